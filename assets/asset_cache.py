@@ -0,0 +1,81 @@
+import os
+import pygame
+from collections import OrderedDict
+from pathlib import Path
+
+# Dossier des images du jeu
+IMG_DIR = Path(__file__).parent / "img"
+
+# Nombre de surfaces redimensionnées gardées en mémoire
+MAX_SCALED = 64
+
+
+class AssetCache:
+    """
+    Cache des images du jeu.
+    Chaque fichier est chargé une seule fois et converti au format de l'écran
+    (convert / convert_alpha), ce qui accélère les blits.
+    Les versions redimensionnées sont gardées par (chemin, taille) dans un LRU :
+    une image n'est redimensionnée que lorsque la taille demandée change
+    (redimensionnement de la fenêtre, plein écran).
+    preload() décode un fichier à l'avance sans le convertir (thread de
+    chargement du démarrage) ; la conversion est faite au premier image().
+    """
+
+    def __init__(self, max_scaled=MAX_SCALED):
+        self.max_scaled = max_scaled
+        self.images = {}
+        self.decoded = {}
+        self.scaled_images = OrderedDict()
+        self.loads = 0
+        self.rescales = 0
+
+    def image(self, path, alpha=False):
+        """Image d'origine (chargée au premier appel)"""
+        key = (os.path.abspath(path), alpha)
+        surface = self.images.get(key)
+        if surface is None:
+            surface = self.decoded.get(key)
+            if surface is None:
+                surface = pygame.image.load(str(path))
+                self.loads += 1
+            # La conversion demande une fenêtre ouverte (pygame.display.set_mode) ;
+            # sans fenêtre l'image n'est pas gardée et sera rechargée puis convertie
+            if pygame.display.get_surface() is None:
+                return surface
+            surface = surface.convert_alpha() if alpha else surface.convert()
+            self.images[key] = surface
+            self.decoded.pop(key, None)
+        return surface
+
+    def preload(self, path, alpha=False):
+        """Décode le fichier sans le convertir (utilisable hors de la boucle d'affichage)"""
+        key = (os.path.abspath(path), alpha)
+        if key not in self.images and key not in self.decoded:
+            self.decoded[key] = pygame.image.load(str(path))
+            self.loads += 1
+
+    def scaled(self, path, size, alpha=False):
+        """Image redimensionnée à size (largeur, hauteur), calculée une seule fois par taille"""
+        key = (os.path.abspath(path), tuple(size), alpha)
+        surface = self.scaled_images.get(key)
+        if surface is not None:
+            self.scaled_images.move_to_end(key)
+            return surface
+        surface = pygame.transform.scale(self.image(path, alpha), key[1])
+        self.rescales += 1
+        if pygame.display.get_surface() is not None:
+            self.scaled_images[key] = surface
+            if len(self.scaled_images) > self.max_scaled:
+                self.scaled_images.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """Oublie toutes les images (changement de mode d'affichage)"""
+        self.images.clear()
+        self.decoded.clear()
+        self.scaled_images.clear()
+
+
+# Instance globale partagée par les menus et les parties
+asset_cache = AssetCache()
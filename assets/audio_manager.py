@@ -1,13 +1,25 @@
 import pygame
 import json
+import threading
 from pathlib import Path
 
 class AudioManager:
     def __init__(self):
         self.sounds = {}
         self.settings = self.load_settings()
-        self.init_pygame_mixer()
-        self.load_sounds()
+        # Le mixer et les sons sont chargés par load() : au démarrage dans le thread
+        # de chargement (assets.startup), sinon au premier son joué
+        self.loaded = False
+        self._load_lock = threading.Lock()
+    
+    def load(self):
+        """Initialise le mixer et charge les sons (une seule fois)"""
+        with self._load_lock:
+            if self.loaded:
+                return
+            self.init_pygame_mixer()
+            self.load_sounds()
+            self.loaded = True
     
     def init_pygame_mixer(self):
         """Initialise le système audio de pygame"""
@@ -104,6 +116,8 @@ class AudioManager:
         """Joue un son si audio activé"""
         if not self.settings['enabled']:
             return
+        if not self.loaded:
+            self.load()
             
         if sound_name in self.sounds:
             try:
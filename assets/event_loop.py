@@ -0,0 +1,34 @@
+import pygame
+
+# Attente maximale d'un événement quand rien ne bouge (millisecondes) :
+# la boucle se réveille au moins à ce rythme pour revérifier son état
+IDLE_TIMEOUT = 500
+
+# Événement posté par les threads (IA, réseau) pour réveiller une boucle en attente
+WAKE_EVENT = pygame.event.custom_type()
+
+
+def get_events(active=False, timeout=IDLE_TIMEOUT):
+    """
+    Événements à traiter pour cette image.
+    active : quelque chose bouge (animation, coup en attente) ; les événements
+    sont lus sans attendre et la boucle garde sa cadence (clock.tick).
+    Sinon la boucle dort dans pygame.event.wait jusqu'au prochain événement
+    (souris, clavier, fenêtre, WAKE_EVENT) ou au plus timeout millisecondes,
+    ce qui ramène un écran immobile à une consommation CPU quasi nulle.
+    """
+    if active:
+        return pygame.event.get()
+    event = pygame.event.wait(timeout)
+    if event.type == pygame.NOEVENT:
+        return []
+    return [event] + pygame.event.get()
+
+
+def wake():
+    """Réveille la boucle d'affichage (appelable depuis un autre thread)"""
+    try:
+        pygame.event.post(pygame.event.Event(WAKE_EVENT))
+    except pygame.error:
+        # Affichage fermé ou pas encore initialisé : personne à réveiller
+        pass
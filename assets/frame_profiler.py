@@ -0,0 +1,233 @@
+import json
+import math
+import os
+import time
+from collections import deque
+from contextlib import nullcontext
+from pathlib import Path
+
+# Activation : variable d'environnement KATARENGA_PROFILE=1, ou dans assets/settings.json
+#   "profiler": {"enabled": true, "file": "assets/cache/profil_images.json"}
+# KATARENGA_PROFILE_FILE remplace le fichier des percentiles écrit à la sortie.
+PROJECT_ROOT = Path(__file__).parent.parent
+SETTINGS_FILE = PROJECT_ROOT / "assets" / "settings.json"
+DEFAULT_DUMP_FILE = PROJECT_ROOT / "assets" / "cache" / "profil_images.json"
+
+# Section de l'attente des événements : exclue du temps de travail de l'image
+WAIT_SECTION = "attente"
+
+# Nombre d'images de l'histogramme glissant affiché
+HISTORY = 120
+# Mesures gardées par section pour les percentiles de fin de partie
+MAX_SAMPLES = 100000
+# Rafraîchissement de l'affichage (secondes) : l'overlay ne réveille pas un écran immobile
+REFRESH = 0.25
+# Échelle de l'histogramme (millisecondes pour la hauteur complète)
+HISTOGRAM_MS = 33.3
+
+PERCENTILES = (50, 90, 99)
+
+_NULL_SECTION = nullcontext()
+
+
+class _Section:
+    """Chronomètre d'une section (with profiler.section("nom"))"""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.add(self.name, time.perf_counter() - self.start)
+        return False
+
+
+def percentile(values, p):
+    """Percentile p (0-100) d'une liste triée, par rang le plus proche"""
+    if not values:
+        return 0.0
+    return values[max(0, math.ceil(p / 100 * len(values)) - 1)]
+
+
+class FrameProfiler:
+    """
+    Mesure du temps des images des boucles de jeu.
+    - section(nom) : contexte qui chronomètre une partie de l'image (dessin du
+      plateau, pions, croix Isolation, victoire, messages réseau...) ; une
+      section rencontrée plusieurs fois dans une image est cumulée.
+      start(nom) / stop(nom) font de même autour d'un long bloc de code.
+    - end_frame() : clôt l'image ; le temps de l'image est le temps écoulé
+      depuis la précédente, moins l'attente des événements (WAIT_SECTION).
+    - draw(screen) : overlay avec le temps moyen et le p95 de chaque section
+      et l'histogramme des HISTORY dernières images.
+    - dump() : percentiles de chaque section, écrits en JSON à la sortie.
+    Désactivé, section() rend un contexte vide partagé et les autres
+    méthodes ne font rien : le coût reste négligeable.
+    """
+
+    def __init__(self, enabled=False, dump_file=DEFAULT_DUMP_FILE):
+        self.enabled = enabled
+        self.dump_file = Path(dump_file)
+        self.current = {}
+        self.started = {}
+        self.samples = {}
+        self.recent = {}
+        self.frame_times = deque(maxlen=HISTORY)
+        self.frames = 0
+        self.frame_start = None
+        self.refresh_key = 0
+        self.last_refresh = 0.0
+        self.font = None
+
+    def section(self, name):
+        if not self.enabled:
+            return _NULL_SECTION
+        return _Section(self, name)
+
+    def start(self, name):
+        if self.enabled:
+            self.started[name] = time.perf_counter()
+
+    def stop(self, name):
+        if self.enabled and name in self.started:
+            self.add(name, time.perf_counter() - self.started.pop(name))
+
+    def add(self, name, seconds):
+        self.current[name] = self.current.get(name, 0.0) + seconds
+
+    def end_frame(self):
+        """Enregistre l'image en cours"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self.frame_start is not None:
+            work = now - self.frame_start - self.current.get(WAIT_SECTION, 0.0)
+            self.record("image", work)
+            self.frame_times.append(work)
+            for name, seconds in self.current.items():
+                if name != WAIT_SECTION:
+                    self.record(name, seconds)
+            self.frames += 1
+        self.current = {}
+        self.frame_start = now
+        if now - self.last_refresh >= REFRESH:
+            self.last_refresh = now
+            self.refresh_key += 1
+
+    def record(self, name, seconds):
+        if name not in self.samples:
+            self.samples[name] = deque(maxlen=MAX_SAMPLES)
+            self.recent[name] = deque(maxlen=HISTORY)
+        self.samples[name].append(seconds)
+        self.recent[name].append(seconds)
+
+    def reset(self):
+        """Nouvelle boucle (nouvelle partie) : l'attente entre deux boucles n'est pas une image"""
+        self.current = {}
+        self.started = {}
+        self.frame_start = None
+
+    # --- Affichage -------------------------------------------------------
+
+    def overlay_rect(self, screen):
+        """Zone occupée par l'overlay (coin bas gauche)"""
+        import pygame
+        lines = len(self.recent) + 1
+        width, height = 260, 16 * lines + 70
+        return pygame.Rect(10, screen.get_height() - height - 10, width, height)
+
+    def draw(self, screen):
+        """Dessine l'overlay : temps par section et histogramme glissant des images"""
+        if not self.enabled:
+            return
+        import pygame
+        if self.font is None:
+            self.font = pygame.font.Font(None, 20)
+        rect = self.overlay_rect(screen)
+        panel = pygame.Surface(rect.size, pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        screen.blit(panel, rect.topleft)
+
+        # Colonnes : section, moyenne et p95 (ms) alignés à droite
+        def row(y, cells):
+            name, mean, p95 = (self.font.render(text, True, (255, 255, 255)) for text in cells)
+            screen.blit(name, (rect.x + 6, y))
+            screen.blit(mean, mean.get_rect(topright=(rect.x + 170, y)))
+            screen.blit(p95, p95.get_rect(topright=(rect.right - 8, y)))
+
+        y = rect.y + 6
+        row(y, (f"{self.frames} images", "moy. ms", "p95 ms"))
+        for name, values in sorted(self.recent.items(), key=lambda item: item[0] != "image"):
+            y += 16
+            ordered = sorted(values)
+            row(y, (name, f"{1000 * sum(ordered) / len(ordered):.2f}", f"{1000 * percentile(ordered, 95):.2f}"))
+
+        # Histogramme : une barre par image, ligne repère à 16,7 ms (60 images/s)
+        base = rect.bottom - 6
+        height = 50
+        bar_width = max(1, (rect.width - 12) // HISTORY)
+        for i, seconds in enumerate(self.frame_times):
+            ms = 1000 * seconds
+            bar = min(height, max(1, int(height * ms / HISTOGRAM_MS)))
+            color = (80, 200, 80) if ms < 16.7 else (230, 180, 40) if ms < HISTOGRAM_MS else (230, 60, 60)
+            pygame.draw.rect(screen, color, (rect.x + 6 + i * bar_width, base - bar, bar_width, bar))
+        line_y = base - int(height * 16.7 / HISTOGRAM_MS)
+        pygame.draw.line(screen, (255, 255, 255), (rect.x + 6, line_y), (rect.right - 6, line_y))
+
+    # --- Résultats -------------------------------------------------------
+
+    def summary(self):
+        """{section: {"images", "moyenne_ms", "p50_ms", "p90_ms", "p99_ms", "max_ms"}}"""
+        result = {}
+        for name, values in self.samples.items():
+            ordered = sorted(values)
+            stats = {"images": len(ordered), "moyenne_ms": round(1000 * sum(ordered) / len(ordered), 3)}
+            for p in PERCENTILES:
+                stats[f"p{p}_ms"] = round(1000 * percentile(ordered, p), 3)
+            stats["max_ms"] = round(1000 * ordered[-1], 3)
+            result[name] = stats
+        return result
+
+    def dump(self, path=None):
+        """Écrit les percentiles de chaque section dans un fichier JSON"""
+        if not self.enabled or not self.samples:
+            return None
+        path = Path(path) if path else self.dump_file
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(self.summary(), f, indent=4)
+            print(f"Profil des images écrit dans {path}")
+        except OSError as e:
+            print(f"Erreur écriture profil: {e}")
+        return path
+
+
+def load_profiler():
+    """Profiler configuré par l'environnement ou settings.json"""
+    enabled = os.environ.get("KATARENGA_PROFILE", "") not in ("", "0")
+    dump_file = DEFAULT_DUMP_FILE
+    try:
+        with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
+            settings = json.load(f).get("profiler", {})
+        enabled = enabled or bool(settings.get("enabled", False))
+        if settings.get("file"):
+            dump_file = PROJECT_ROOT / settings["file"]
+    except (OSError, ValueError):
+        pass
+    dump_file = os.environ.get("KATARENGA_PROFILE_FILE", dump_file)
+    profiler = FrameProfiler(enabled, dump_file)
+    if enabled:
+        import atexit
+        atexit.register(profiler.dump)
+    return profiler
+
+
+# Instance globale partagée par les boucles de jeu
+profiler = load_profiler()
@@ -0,0 +1,218 @@
+import sys
+import threading
+from pathlib import Path
+import pygame
+from assets.colors import Colors
+
+PROJECT_ROOT = Path(__file__).parent.parent
+IMG_DIR = PROJECT_ROOT / "assets" / "img"
+
+# Images décodées après l'ouverture du menu, pendant qu'il est affiché
+# (fichier, alpha) : cadre et cases du plateau
+BOARD_IMAGES = [
+    ("frame.png", True),
+    ("yellow.png", True),
+    ("green.png", True),
+    ("blue.png", True),
+    ("red.png", True),
+]
+
+
+class StartupLoader:
+    """
+    Chargement des ressources du démarrage dans un thread : la fenêtre
+    s'affiche tout de suite et l'écran de chargement suit l'avancement.
+    Chaque étape est (libellé, fonction) ; son résultat est gardé dans
+    results[libellé]. Une erreur est affichée sans arrêter le chargement :
+    la ressource sera chargée au premier usage, comme avant.
+    Les required premières étapes sont nécessaires au premier menu, les
+    suivantes continuent en arrière-plan pendant que le menu est affiché.
+    """
+
+    def __init__(self, steps, required=None):
+        self.steps = list(steps)
+        self.required = len(self.steps) if required is None else required
+        self.done = 0
+        self.label = ""
+        self.results = {}
+        self.thread = None
+
+    def start(self):
+        self.thread = threading.Thread(target=self.run, name="startup-loader", daemon=True)
+        self.thread.start()
+
+    def run(self):
+        from assets.event_loop import wake
+        for label, function in self.steps:
+            self.label = label
+            try:
+                self.results[label] = function()
+            except Exception as e:
+                print(f"Erreur chargement {label}: {e}")
+            self.done += 1
+            wake()
+
+    def progress(self):
+        """Avancement des étapes nécessaires au premier menu (0 à 1)"""
+        return min(1.0, self.done / self.required) if self.required else 1.0
+
+    def ready(self):
+        return self.done >= self.required
+
+    def finished(self):
+        return self.done >= len(self.steps)
+
+
+def startup_steps(loader, screen):
+    """
+    Étapes du démarrage : quadrants.json, sons et images du menu (nécessaires
+    au premier menu), puis images du plateau et des quadrants.
+    Retourne (étapes, nombre d'étapes nécessaires).
+    """
+    from assets.asset_cache import asset_cache
+    from assets.audio_manager import audio_manager
+
+    def load_quadrants():
+        from config_manager import initialize_quadrants
+        return initialize_quadrants()
+
+    def preload_quadrant_images():
+        _, quadrants_data = loader.results.get("Quadrants", (None, {}))
+        for data in quadrants_data.values():
+            image_path = data.get("image_path")
+            if image_path and Path(image_path).exists():
+                asset_cache.preload(image_path)
+
+    def prepare_menu():
+        # Fond déjà converti à la taille de l'écran et logo converti : la
+        # première image du menu n'a plus que des blits à faire
+        asset_cache.scaled(IMG_DIR / "fond.png", screen.get_size())
+        asset_cache.image(IMG_DIR / "logo.png", alpha=True)
+
+    def image_step(name, alpha):
+        return f"Image {name}", lambda: asset_cache.preload(IMG_DIR / name, alpha)
+
+    steps = [("Quadrants", load_quadrants), ("Sons", audio_manager.load), ("Menu", prepare_menu)]
+    required = len(steps)
+    steps += [image_step(name, alpha) for name, alpha in BOARD_IMAGES]
+    steps.append(("Images des quadrants", preload_quadrant_images))
+    return steps, required
+
+
+def show_loading_screen(screen, loader):
+    """
+    Écran de chargement : titre, barre de progression et étape en cours,
+    jusqu'à ce que les ressources du premier menu soient chargées.
+    Retourne False si la fenêtre a été fermée pendant le chargement.
+    """
+    font = pygame.font.Font(None, 48)
+    small_font = pygame.font.Font(None, 24)
+
+    while True:
+        width, height = screen.get_size()
+        screen.fill(Colors.BLUE)
+
+        title = font.render("Katarenga & Co", True, Colors.BLACK)
+        screen.blit(title, title.get_rect(center=(width // 2, height // 2 - 60)))
+
+        bar = pygame.Rect(0, 0, width // 3, 24)
+        bar.center = (width // 2, height // 2)
+        pygame.draw.rect(screen, Colors.WHITE, bar)
+        filled = bar.copy()
+        filled.width = int(bar.width * loader.progress())
+        pygame.draw.rect(screen, Colors.DARK_GREEN, filled)
+        pygame.draw.rect(screen, Colors.BLACK, bar, 2)
+
+        step = small_font.render(f"Chargement : {loader.label}", True, Colors.DARK_GRAY)
+        screen.blit(step, step.get_rect(center=(width // 2, bar.bottom + 25)))
+        pygame.display.flip()
+
+        if loader.ready():
+            return True
+
+        # Réveillé par le thread à chaque étape terminée
+        from assets.event_loop import get_events
+        for event in get_events(timeout=100):
+            if event.type == pygame.QUIT:
+                return False
+
+
+def load_with_progress(screen):
+    """
+    Lance le chargement en arrière-plan et affiche sa progression.
+    Retourne (config, quadrants_data) comme config_manager.initialize_quadrants,
+    ou None si la fenêtre a été fermée.
+    """
+    loader = StartupLoader([])
+    loader.steps, loader.required = startup_steps(loader, screen)
+    loader.start()
+    if not show_loading_screen(screen, loader):
+        return None
+    return loader.results.get("Quadrants", ({}, {}))
+
+
+# --- Mesure du démarrage ----------------------------------------------------
+
+BENCHMARK_CHILD = r'''
+import os, sys, runpy
+sys.path.insert(0, {root!r})
+import pygame
+_flip = pygame.display.flip
+first_frame = []
+
+def flip():
+    if not first_frame:
+        first_frame.append(True)
+        print("premiere_image", file=sys.stderr, flush=True)
+    _flip()
+pygame.display.flip = flip
+
+# Le menu principal est prêt quand sa boucle attend le premier événement
+import assets.event_loop
+_get_events = assets.event_loop.get_events
+
+def get_events(*args, **kwargs):
+    if sys._getframe(1).f_code.co_name == "run_menu":
+        print("menu", file=sys.stderr, flush=True)
+        os._exit(0)
+    return _get_events(*args, **kwargs)
+assets.event_loop.get_events = get_events
+sys.argv = [{main!r}]
+runpy.run_path({main!r}, run_name="__main__")
+'''
+
+
+def benchmark(runs=7):
+    """
+    Lance main.py runs fois (pilotes SDL dummy) et mesure depuis le lancement du
+    processus : la première image affichée et le premier menu prêt.
+    Retourne {"premiere_image": [secondes...], "menu": [secondes...]}.
+    """
+    import os
+    import subprocess
+    import time
+    child = BENCHMARK_CHILD.format(root=str(PROJECT_ROOT), main=str(PROJECT_ROOT / "main.py"))
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy")
+    timings = {"premiere_image": [], "menu": []}
+    for _ in range(runs):
+        start = time.perf_counter()
+        process = subprocess.Popen([sys.executable, "-c", child], cwd=str(PROJECT_ROOT), env=env,
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        for line in process.stderr:
+            name = line.strip()
+            if name in timings:
+                timings[name].append(time.perf_counter() - start)
+        process.wait()
+    return timings
+
+
+if __name__ == "__main__":
+    import argparse
+    import statistics
+    parser = argparse.ArgumentParser(description="Temps de démarrage : lancement -> première image -> menu")
+    parser.add_argument("--runs", type=int, default=7)
+    args = parser.parse_args()
+    for name, values in benchmark(args.runs).items():
+        if values:
+            print(f"{name:15} médiane {1000 * statistics.median(values):6.0f} ms  "
+                  f"min {1000 * min(values):6.0f} ms  max {1000 * max(values):6.0f} ms")
@@ -215,7 +215,10 @@ def create_default_quadrants(config):
 def initialize_quadrants():
     """
     Initialise le système de quadrants
+    Les quadrants viennent du dépôt partagé (quadrant/repository.py) : le
+    fichier n'est relu que s'il a changé depuis la dernière lecture.
     """
+    from quadrant.repository import quadrant_repository
     config = read_config()
-    quadrants_data = create_default_quadrants(config)
+    quadrants_data = quadrant_repository.all()
     return config, quadrants_data
\ No newline at end of file
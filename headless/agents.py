@@ -0,0 +1,146 @@
+from plateau.bitboard import square
+
+
+def to_square_move(move, mode):
+    """Coup au format du jeu (from_row, from_col, (to_row, to_col)) ou (row, col) vers (départ, arrivée)"""
+    if move is None:
+        return None
+    if mode == 2:
+        sq = square(*move)
+        return sq, sq
+    from_row, from_col, to_pos = move
+    return square(from_row, from_col), square(*to_pos)
+
+
+class Agent:
+    """
+    Joueur d'une partie sans affichage.
+    choose_move(state) reçoit le GameState de la partie (à ne pas modifier)
+    et retourne un coup (case_départ, case_arrivée), ou None s'il ne peut pas jouer.
+    """
+    name = "agent"
+    # Modes de jeu pris en charge (0 Katarenga, 1 Congress, 2 Isolation)
+    modes = (0, 1, 2)
+
+    def new_game(self, mode, player):
+        """Appelé avant chaque partie"""
+        self.mode = mode
+        self.player = player
+
+    def choose_move(self, state):
+        raise NotImplementedError
+
+
+class RandomAgent(Agent):
+    """IA du niveau Facile : randomAi (Katarenga, Congress) et isolation_ai"""
+    name = "random"
+
+    def choose_move(self, state):
+        from plateau.game_logic import randomAi, isolation_ai
+        board_grid = state.tables.key
+        pawn_grid = state.to_pawn_grid()
+        if state.mode == 2:
+            move = isolation_ai(pawn_grid, board_grid, state.side)
+        else:
+            move = randomAi(pawn_grid, board_grid, state.side, state.mode, state.camps)
+        return to_square_move(move, state.mode)
+
+
+class SearchAgent(Agent):
+    """Alpha-beta Katarenga (éventuellement réparti sur plusieurs processus)"""
+    name = "search"
+    modes = (0,)
+
+    def __init__(self, time_budget=0.1, workers=1):
+        from plateau.parallel_search import ParallelSearch
+        self.time_budget = time_budget
+        self.executor = ParallelSearch(int(workers))
+
+    def choose_move(self, state):
+        if state.mode != 0:
+            raise ValueError("SearchAgent ne joue qu'à Katarenga")
+        move = self.executor.search_move(state, self.time_budget)
+        return to_square_move(move, state.mode)
+
+
+class ExpertAgent(Agent):
+    """
+    IA du niveau Expert comme dans start_game : alpha-beta en Katarenga,
+    heuristique puis solveur en Isolation, coups aléatoires en Congress.
+    """
+    name = "expert"
+
+    def __init__(self, time_budget=0.1):
+        self.search = SearchAgent(time_budget)
+        self.fallback = RandomAgent()
+
+    def choose_move(self, state):
+        if state.mode == 0:
+            return self.search.choose_move(state)
+        if state.mode == 2:
+            from jeux.isolation_solver import isolation_expert_ai
+            from jeux.attack_map import AttackMap
+            move = isolation_expert_ai(None, state.tables.key, state.side, AttackMap.from_state(state))
+            return to_square_move(move, state.mode)
+        return self.fallback.choose_move(state)
+
+
+class MCTSAgent(Agent):
+    """Recherche Monte-Carlo ; l'arbre est réutilisé d'un coup à l'autre pendant la partie"""
+    name = "mcts"
+
+    def __init__(self, time_ms=100, iterations=None, seed=None):
+        self.time_ms = time_ms
+        self.iterations = None if iterations is None else int(iterations)
+        self.seed = seed
+        self.mcts = None
+
+    def new_game(self, mode, player):
+        from plateau.mcts import MCTSPlayer
+        super().new_game(mode, player)
+        self.mcts = MCTSPlayer(time_ms=self.time_ms, iterations=self.iterations, seed=self.seed)
+
+    def choose_move(self, state):
+        return self.mcts.choose_move(state)
+
+
+AGENTS = {
+    "random": RandomAgent,
+    "search": SearchAgent,
+    "expert": ExpertAgent,
+    "mcts": MCTSAgent,
+}
+
+
+def parse_value(text):
+    """Valeur d'option : entier, réel ou texte"""
+    for convert in (int, float):
+        try:
+            return convert(text)
+        except ValueError:
+            pass
+    return text
+
+
+def agent_modes(spec):
+    """Modes de jeu pris en charge par l'agent d'une description texte"""
+    name = spec.partition(":")[0]
+    if name not in AGENTS:
+        raise ValueError(f"Agent inconnu: {name} (disponibles: {', '.join(AGENTS)})")
+    return AGENTS[name].modes
+
+
+def make_agent(spec):
+    """
+    Crée un agent à partir d'une description texte (sérialisable vers les processus) :
+    "random", "mcts:time_ms=50" ou "search:time_budget=0.2,workers=2".
+    """
+    name, _, options = spec.partition(":")
+    if name not in AGENTS:
+        raise ValueError(f"Agent inconnu: {name} (disponibles: {', '.join(AGENTS)})")
+    kwargs = {}
+    for option in filter(None, options.split(",")):
+        key, _, value = option.partition("=")
+        kwargs[key.strip()] = parse_value(value.strip())
+    return AGENTS[name](**kwargs)
+
@@ -0,0 +1,269 @@
+import json
+import time
+from functools import lru_cache
+from pathlib import Path
+from plateau.bitboard import GRID_SIZE
+from plateau.game_logic import create_game_board, initialize_pawns_for_game_mode
+from plateau.game_state import GameState
+from headless.simulator import MODE_NAMES
+
+# Comptage exhaustif des positions (« perft ») à partir des positions de départ
+# de initialize_pawns_for_game_mode, pour mesurer la vitesse de génération des
+# coups et vérifier qu'une optimisation du moteur ne change aucun résultat.
+# Une position terminée (victoire, nul, joueur bloqué) n'a pas de fils.
+
+# Plateaux fixes : quatre quadrants de quadrant/quadrants.json (haut gauche, haut droite, bas gauche, bas droite)
+LAYOUTS = {
+    "q1-q2-q3-q4": ["quadrant_1", "quadrant_2", "quadrant_3", "quadrant_4"],
+    "q5-q6-q7-q8": ["quadrant_5", "quadrant_6", "quadrant_7", "quadrant_8"],
+    "q9-q10-q1-q5": ["quadrant_9", "quadrant_10", "quadrant_1", "quadrant_5"],
+}
+
+# Profondeurs des comptes de référence, par mode (quelques secondes par disposition)
+GOLDEN_DEPTHS = {0: 4, 1: 4, 2: 3}
+
+# Comptes de référence, vérifiés par tests/test_perft.py
+GOLDEN_FILE = Path(__file__).parent.parent / "tests" / "perft_golden.json"
+
+ENGINES = ["etat", "grille"]
+
+
+@lru_cache(maxsize=1)
+def load_quadrants():
+    """Grilles 4x4 de quadrants.json, par nom de quadrant"""
+    quadrants_file = Path(__file__).parent.parent / "quadrant" / "quadrants.json"
+    with open(quadrants_file, "r", encoding="utf-8") as f:
+        return {name: quadrant["grid"] for name, quadrant in json.load(f).items()}
+
+
+def layout_board(layout):
+    """Plateau 10x10 d'une disposition de LAYOUTS"""
+    quadrants = load_quadrants()
+    return create_game_board([quadrants[name] for name in LAYOUTS[layout]])
+
+
+# --- Moteur GameState (bitboards, make/unmake) --------------------------------
+
+def perft(state, depth):
+    """Nombre de positions atteintes en exactement depth coups"""
+    if depth == 0:
+        return 1
+    if state.undo_stack and state.winner()[0]:
+        return 0
+    moves = state.legal_moves()
+    if depth == 1:
+        # Les coups menant à une fin de partie comptent : ce sont des positions atteintes
+        return len(moves)
+    total = 0
+    for move in moves:
+        state.make_move(move)
+        total += perft(state, depth - 1)
+        state.unmake_move()
+    return total
+
+
+def divide(state, depth):
+    """Compte de chaque coup de la racine (pour localiser une différence entre moteurs)"""
+    counts = {}
+    for move in state.legal_moves():
+        state.make_move(move)
+        counts[move] = perft(state, depth - 1)
+        state.unmake_move()
+    return counts
+
+
+# --- Moteur grilles (fonctions du jeu sur pawn_grid) -------------------------
+
+class GridPosition:
+    """
+    Position sur les grilles 10x10 du jeu, modifiée sur place et restaurée.
+    Les coups sont générés par plateau.pawn.get_valid_moves (camps Katarenga
+    dans les variables globales de jeux.katarenga), la fin de partie par
+    check_katarenga_victory / check_minimum_pawn_victory_condition et
+    jeux.congress.check_victory ; en Isolation, les cases sûres sont
+    recalculées depuis la grille par AttackMap.from_grids, comme
+    check_isolation_complete_victory.
+    Nécessite pygame (importé par ces modules).
+    """
+
+    def __init__(self, board_grid, mode):
+        from jeux import katarenga
+        self.board_grid = board_grid
+        self.pawn_grid = initialize_pawns_for_game_mode(mode)
+        self.mode = mode
+        self.side = 1
+        self.plies = 0
+        katarenga.reset_camps()
+
+    def legal_moves(self):
+        """Coups ((ligne, colonne), (ligne, colonne)) du joueur au trait"""
+        pawn_grid = self.pawn_grid
+        if self.mode == 2:
+            from jeux.attack_map import AttackMap
+            return [(cell, cell) for cell in AttackMap.from_grids(self.board_grid, pawn_grid).safe_cells()]
+        from plateau.pawn import get_valid_moves
+        moves = []
+        for row in range(GRID_SIZE):
+            for col in range(GRID_SIZE):
+                if pawn_grid[row][col] == self.side:
+                    for target in get_valid_moves(row, col, self.board_grid, pawn_grid, self.mode):
+                        moves.append(((row, col), target))
+        return moves
+
+    def camp_entries(self, row, col):
+        """Liste de jeux.katarenga représentant le camp (row, col) du joueur au trait"""
+        from jeux import katarenga
+        camps = katarenga.camps_player1 if self.side == 1 else katarenga.camps_player2
+        return camps["camp1" if col == 0 else "camp2"]
+
+    def make_move(self, move):
+        """Joue le coup ; retourne ce qu'il faut pour l'annuler"""
+        (from_row, from_col), (to_row, to_col) = move
+        pawn_grid = self.pawn_grid
+        captured = pawn_grid[to_row][to_col]
+        if self.mode == 2:
+            pawn_grid[to_row][to_col] = self.side
+        elif (to_row, to_col) in ((0, 0), (0, 9), (9, 0), (9, 9)):
+            # Entrée dans un camp : le pion quitte le plateau
+            pawn_grid[from_row][from_col] = 0
+            self.camp_entries(to_row, to_col).append(self.side)
+        else:
+            pawn_grid[from_row][from_col] = 0
+            pawn_grid[to_row][to_col] = self.side
+        self.side = 3 - self.side
+        self.plies += 1
+        return captured
+
+    def unmake_move(self, move, captured):
+        (from_row, from_col), (to_row, to_col) = move
+        self.side = 3 - self.side
+        self.plies -= 1
+        pawn_grid = self.pawn_grid
+        if self.mode == 2:
+            pawn_grid[to_row][to_col] = 0
+        elif (to_row, to_col) in ((0, 0), (0, 9), (9, 0), (9, 9)):
+            pawn_grid[from_row][from_col] = self.side
+            self.camp_entries(to_row, to_col).pop()
+        else:
+            pawn_grid[from_row][from_col] = self.side
+            pawn_grid[to_row][to_col] = captured
+
+    def game_over(self):
+        if self.mode == 0:
+            from jeux.katarenga import check_katarenga_victory, check_minimum_pawn_victory_condition
+            return bool(check_katarenga_victory() or check_minimum_pawn_victory_condition(self.pawn_grid, 0))
+        if self.mode == 1:
+            from jeux.congress import check_victory
+            return check_victory(self.pawn_grid)[0] > 0
+        # Isolation : la partie s'arrête quand plus aucune case n'est sûre
+        return not self.legal_moves()
+
+
+def perft_grid(position, depth):
+    """perft() avec les fonctions du jeu sur grilles"""
+    if depth == 0:
+        return 1
+    if position.plies and position.game_over():
+        return 0
+    moves = position.legal_moves()
+    if depth == 1:
+        return len(moves)
+    total = 0
+    for move in moves:
+        captured = position.make_move(move)
+        total += perft_grid(position, depth - 1)
+        position.unmake_move(move, captured)
+    return total
+
+
+# --- Mesures et vérification -------------------------------------------------
+
+def run_perft(layout, mode, depth, engine="etat"):
+    """Retourne (positions, secondes) pour une disposition, un mode et une profondeur"""
+    board_grid = layout_board(layout)
+    start = time.perf_counter()
+    if engine == "grille":
+        nodes = perft_grid(GridPosition(board_grid, mode), depth)
+    else:
+        state = GameState.from_grids(board_grid, initialize_pawns_for_game_mode(mode), mode)
+        nodes = perft(state, depth)
+    return nodes, time.perf_counter() - start
+
+
+def load_golden():
+    """Comptes de référence : {disposition: {mode: [positions à la profondeur 1, 2, ...]}}"""
+    with open(GOLDEN_FILE, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def check_golden(engine="etat", report=print, max_depth=None):
+    """
+    Compare les comptes du moteur aux valeurs de référence.
+    max_depth : dernière profondeur vérifiée (par défaut toutes celles du fichier).
+    Retourne la liste des différences (disposition, mode, profondeur, attendu, obtenu).
+    """
+    golden = load_golden()
+    failures = []
+    for layout, modes in golden.items():
+        for mode_name, counts in modes.items():
+            mode = MODE_NAMES.index(mode_name)
+            for depth, expected in enumerate(counts[:max_depth], start=1):
+                nodes, seconds = run_perft(layout, mode, depth, engine)
+                status = "ok" if nodes == expected else f"ERREUR (attendu {expected})"
+                report(f"{layout:14} {mode_name:10} profondeur {depth} : {nodes:9} positions "
+                       f"{nodes / seconds if seconds else 0:10.0f} pos/s  {status}")
+                if nodes != expected:
+                    failures.append((layout, mode_name, depth, expected, nodes))
+    return failures
+
+
+def write_golden(depths=GOLDEN_DEPTHS):
+    """Régénère perft_golden.json avec le moteur GameState (après une modification des règles)"""
+    golden = {}
+    for layout in LAYOUTS:
+        golden[layout] = {MODE_NAMES[mode]: [run_perft(layout, mode, depth)[0]
+                                             for depth in range(1, depths[mode] + 1)]
+                          for mode in range(3)}
+    with open(GOLDEN_FILE, "w", encoding="utf-8") as f:
+        json.dump(golden, f, indent=4)
+    return golden
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Comptage perft des coups depuis les positions de départ")
+    parser.add_argument("--mode", type=int, choices=[0, 1, 2], help="0 Katarenga, 1 Congress, 2 Isolation")
+    parser.add_argument("--layout", choices=list(LAYOUTS), default="q1-q2-q3-q4")
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--engine", choices=ENGINES, default="etat",
+                        help="etat : GameState ; grille : get_valid_moves et fonctions de victoire (pygame requis)")
+    parser.add_argument("--divide", action="store_true", help="compte par coup de la racine")
+    parser.add_argument("--check", action="store_true", help="vérifie les comptes de perft_golden.json")
+    parser.add_argument("--update", action="store_true", help="réécrit perft_golden.json")
+    args = parser.parse_args(argv)
+
+    if args.update:
+        write_golden()
+        print(f"Comptes de référence écrits dans {GOLDEN_FILE}")
+        return 0
+    if args.check:
+        failures = check_golden(args.engine)
+        print("Tous les comptes correspondent" if not failures else f"{len(failures)} compte(s) différent(s)")
+        return 1 if failures else 0
+
+    modes = [args.mode] if args.mode is not None else range(3)
+    for mode in modes:
+        if args.divide:
+            state = GameState.from_grids(layout_board(args.layout), initialize_pawns_for_game_mode(mode), mode)
+            for move, count in sorted(divide(state, args.depth).items()):
+                from_pos, to_pos = divmod(move[0], GRID_SIZE), divmod(move[1], GRID_SIZE)
+                print(f"{from_pos} -> {to_pos} : {count}" if mode != 2 else f"{to_pos} : {count}")
+        for depth in range(1, args.depth + 1):
+            nodes, seconds = run_perft(args.layout, mode, depth, args.engine)
+            print(f"{MODE_NAMES[mode]:10} profondeur {depth} : {nodes:9} positions en {seconds:7.3f} s "
+                  f"({nodes / seconds if seconds else 0:.0f} pos/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,150 @@
+import csv
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from headless.agents import make_agent
+from headless.simulator import MAX_PLIES, MODE_NAMES, load_quadrant_grids, play_game, random_board
+
+
+def play_task(task):
+    """
+    Une partie du lot (exécutée dans un processus).
+    task : (numéro, mode, [description agent A, description agent B], graine, limite de coups).
+    Les couleurs sont échangées une partie sur deux pour que chaque agent joue les deux camps.
+    """
+    index, mode, specs, seed, max_plies = task
+    # randomAi et isolation_ai utilisent le module random : parties reproductibles
+    random.seed(seed)
+    rng = random.Random(seed)
+    board_grid = random_board(load_quadrant_grids(), rng)
+    red, blue = (0, 1) if index % 2 == 0 else (1, 0)
+    agents = {1: make_agent(specs[red]), 2: make_agent(specs[blue])}
+    result = play_game(board_grid, mode, agents, max_plies)
+    result["game"] = index
+    result["seed"] = seed
+    # Index (0 = A, 1 = B) de l'agent de chaque couleur
+    result["red"] = red
+    result["blue"] = blue
+    return result
+
+
+def run_batch(mode, specs, games, workers=1, seed=0, max_plies=MAX_PLIES):
+    """
+    Joue games parties entre deux agents, réparties sur workers processus.
+    specs : deux descriptions d'agents (voir headless.agents.make_agent).
+    Retourne la liste des résultats de partie.
+    """
+    tasks = [(index, mode, list(specs), seed + index, max_plies) for index in range(games)]
+    if workers <= 1:
+        return [play_task(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(play_task, tasks, chunksize=max(1, games // (workers * 4))))
+
+
+def summarize(results, specs, wall_time=None):
+    """Statistiques du lot : victoires par agent, longueur des parties, coups par seconde"""
+    agents = []
+    for index, spec in enumerate(specs):
+        wins = draws = losses = moves = 0
+        think_time = 0.0
+        for result in results:
+            player = 1 if result["red"] == index else 2
+            moves += result["moves"][player]
+            think_time += result["think_time"][player]
+            if result["winner"] == 0:
+                draws += 1
+            elif result["winner"] == player:
+                wins += 1
+            else:
+                losses += 1
+        played = len(results)
+        agents.append({
+            "agent": "AB"[index],
+            "spec": spec,
+            "wins": wins,
+            "draws": draws,
+            "losses": losses,
+            "win_rate": wins / played if played else 0.0,
+            "score": (wins + draws / 2) / played if played else 0.0,
+            "moves": moves,
+            "ms_per_move": 1000 * think_time / moves if moves else 0.0,
+        })
+
+    plies = [result["plies"] for result in results]
+    total_time = sum(result["duration"] for result in results)
+    reasons = {}
+    for result in results:
+        reasons[result["reason"]] = reasons.get(result["reason"], 0) + 1
+    return {
+        "mode": MODE_NAMES[results[0]["mode"]] if results else None,
+        "games": len(results),
+        "agents": agents,
+        "red_wins": sum(1 for result in results if result["winner"] == 1),
+        "blue_wins": sum(1 for result in results if result["winner"] == 2),
+        "draws": sum(1 for result in results if result["winner"] == 0),
+        "reasons": reasons,
+        "average_plies": sum(plies) / len(plies) if plies else 0.0,
+        "min_plies": min(plies, default=0),
+        "max_plies": max(plies, default=0),
+        # Coups joués par seconde de partie (réflexion des agents comprise)
+        "moves_per_second": sum(plies) / total_time if total_time else 0.0,
+        "wall_time": wall_time,
+    }
+
+
+def write_json(path, summary, results):
+    """Résumé et détail des parties"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"summary": summary, "games": results}, f, indent=2, ensure_ascii=False)
+
+
+def write_csv(path, summary):
+    """Une ligne par agent avec les statistiques agrégées du lot"""
+    columns = ["mode", "games", "agent", "spec", "wins", "draws", "losses", "win_rate", "score",
+               "ms_per_move", "average_plies", "moves_per_second"]
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=columns, extrasaction="ignore")
+        writer.writeheader()
+        for agent in summary["agents"]:
+            writer.writerow({**summary, **agent})
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Parties sans affichage entre deux agents")
+    parser.add_argument("--mode", type=int, choices=[0, 1, 2], default=0,
+                        help="0 Katarenga, 1 Congress, 2 Isolation")
+    parser.add_argument("--agents", nargs=2, default=["random", "random"], metavar="AGENT",
+                        help='deux agents, ex. random "mcts:time_ms=50" "search:time_budget=0.1"')
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-plies", type=int, default=MAX_PLIES)
+    parser.add_argument("--output", help="fichier de résultats .json ou .csv")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    results = run_batch(args.mode, args.agents, args.games, args.workers, args.seed, args.max_plies)
+    summary = summarize(results, args.agents, time.perf_counter() - start)
+
+    print(f"{summary['mode']} : {summary['games']} parties en {summary['wall_time']:.1f} s "
+          f"({args.workers} processus)")
+    for agent in summary["agents"]:
+        print(f"  {agent['agent']} {agent['spec']:30} {agent['wins']:4} V {agent['draws']:4} N "
+              f"{agent['losses']:4} D  victoires {agent['win_rate']:.1%}  {agent['ms_per_move']:.2f} ms/coup")
+    print(f"  Longueur moyenne {summary['average_plies']:.1f} coups, "
+          f"{summary['moves_per_second']:.0f} coups/s, fins : {summary['reasons']}")
+
+    if args.output:
+        if args.output.endswith(".csv"):
+            write_csv(args.output, summary)
+        else:
+            write_json(args.output, summary, results)
+        print(f"Résultats écrits dans {args.output}")
+    return summary
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import time
+from functools import lru_cache
+from plateau.game_logic import create_game_board, initialize_pawns_for_game_mode, rotate_quadrant
+from plateau.game_state import GameState
+
+# Au-delà, la partie est déclarée nulle (Katarenga et Congress peuvent tourner en rond)
+MAX_PLIES = 400
+
+MODE_NAMES = ["Katarenga", "Congress", "Isolation"]
+
+
+def random_board(quadrant_grids, rng, rotations=False):
+    """
+    Plateau de quatre quadrants tirés au hasard, comme dans la sélection du jeu.
+    rotations : chaque quadrant est aussi tourné au hasard (0, 90, 180 ou 270 degrés).
+    """
+    grids = [rng.choice(quadrant_grids) for _ in range(4)]
+    if rotations:
+        grids = [rotate_quadrant(grid, rng.choice((0, 90, 180, 270))) for grid in grids]
+    return create_game_board(grids)
+
+
+@lru_cache(maxsize=1)
+def load_quadrant_grids():
+    """Grilles 4x4 des quadrants de quadrant/quadrants.json (lues une fois par processus)"""
+    import json
+    from pathlib import Path
+    quadrants_file = Path(__file__).parent.parent / "quadrant" / "quadrants.json"
+    with open(quadrants_file, "r", encoding="utf-8") as f:
+        return [quadrant["grid"] for quadrant in json.load(f).values()]
+
+
+def end_reason(state, winner):
+    """Raison de la fin de partie, pour les statistiques"""
+    mode = state.mode
+    if mode == 0:
+        return "camps" if state.camps_winner() == winner else "pions"
+    if mode == 1:
+        return "connexion"
+    return "isolation"
+
+
+def play_game(board_grid, mode, agents, max_plies=MAX_PLIES, validate=True):
+    """
+    Joue une partie complète sans affichage.
+    agents : {1: agent rouge, 2: agent bleu} (voir headless.agents).
+    Les règles de fin sont celles de start_game ; un joueur sans coup perd.
+    validate : vérifie que chaque coup est légal (ValueError sinon).
+    Retourne un dictionnaire : gagnant (0 si nul), raison, coups joués et temps.
+    """
+    state = GameState.from_grids(board_grid, initialize_pawns_for_game_mode(mode), mode)
+    for player, agent in agents.items():
+        agent.new_game(mode, player)
+    think_time = {1: 0.0, 2: 0.0}
+    moves = {1: 0, 2: 0}
+    winner, reason = 0, "limite"
+    start = time.perf_counter()
+
+    while len(state.undo_stack) < max_plies:
+        player = state.side
+        move_start = time.perf_counter()
+        move = agents[player].choose_move(state)
+        think_time[player] += time.perf_counter() - move_start
+        if move is None:
+            winner, reason = 3 - player, "bloqué"
+            break
+        if validate and tuple(move) not in state.legal_moves(player):
+            raise ValueError(f"Coup illégal de {agents[player].name} : {move}")
+        state.make_move(move, player)
+        moves[player] += 1
+        over, winner = state.winner()
+        if over:
+            reason = end_reason(state, winner)
+            break
+
+    duration = time.perf_counter() - start
+    return {
+        "mode": mode,
+        "winner": winner,
+        "reason": reason,
+        "plies": len(state.undo_stack),
+        "duration": duration,
+        "moves": moves,
+        "think_time": think_time,
+    }
@@ -0,0 +1,359 @@
+import json
+import math
+import os
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import combinations
+from headless.agents import agent_modes, make_agent
+from headless.simulator import MAX_PLIES, MODE_NAMES, load_quadrant_grids, play_game, random_board
+
+# Tournoi entre agents (voir headless.agents) : toutes rencontres ou gauntlet,
+# classement Elo avec intervalles de confiance et arrêt anticipé par SPRT.
+
+# Quantile de la loi normale pour un intervalle de confiance à 95 %
+Z_95 = 1.959964
+# Écart Elo maximal affiché (score de 0 ou 100 %)
+ELO_LIMIT = 1000
+# Nul virtuel ajouté à chaque rencontre pour le classement (évite les Elo infinis)
+PRIOR_DRAWS = 1
+# Hypothèses et risques par défaut du SPRT (écart Elo du premier agent sur le second)
+SPRT_ELO0 = 0
+SPRT_ELO1 = 50
+SPRT_ALPHA = 0.05
+SPRT_BETA = 0.05
+
+
+# --- Calculs Elo --------------------------------------------------------------
+
+def expected_score(elo):
+    """Score attendu pour un écart Elo"""
+    return 1 / (1 + 10 ** (-elo / 400))
+
+
+def elo_from_score(score):
+    """Écart Elo correspondant à un score (limité à ±ELO_LIMIT)"""
+    if score <= 0:
+        return -ELO_LIMIT
+    if score >= 1:
+        return ELO_LIMIT
+    return max(-ELO_LIMIT, min(ELO_LIMIT, -400 * math.log10(1 / score - 1)))
+
+
+def score_statistics(wins, draws, losses):
+    """(score moyen, variance d'une partie) pour des résultats victoire/nul/défaite"""
+    games = wins + draws + losses
+    if not games:
+        return 0.5, 0.0
+    score = (wins + draws / 2) / games
+    variance = (wins * (1 - score) ** 2 + draws * (0.5 - score) ** 2 + losses * score ** 2) / games
+    return score, variance
+
+
+def elo_interval(wins, draws, losses, z=Z_95):
+    """Écart Elo et intervalle de confiance (bas, haut) d'une rencontre"""
+    games = wins + draws + losses
+    score, variance = score_statistics(wins, draws, losses)
+    if not games:
+        return 0.0, -ELO_LIMIT, ELO_LIMIT
+    margin = z * math.sqrt(variance / games)
+    return elo_from_score(score), elo_from_score(score - margin), elo_from_score(score + margin)
+
+
+def sprt_bounds(alpha=SPRT_ALPHA, beta=SPRT_BETA):
+    """Bornes (basse, haute) du log-rapport de vraisemblance"""
+    return math.log(beta / (1 - alpha)), math.log((1 - beta) / alpha)
+
+
+def sprt_llr(wins, draws, losses, elo0=SPRT_ELO0, elo1=SPRT_ELO1):
+    """
+    Log-rapport de vraisemblance de H1 (écart elo1) contre H0 (écart elo0),
+    approximation normale du modèle victoire/nul/défaite.
+    """
+    games = wins + draws + losses
+    if not games:
+        return 0.0
+    score, variance = score_statistics(wins, draws, losses)
+    # Résultats tous identiques : variance d'une seule partie différente sur games
+    variance = max(variance, 1 / (4 * games))
+    score0, score1 = expected_score(elo0), expected_score(elo1)
+    return games * (score1 - score0) * (2 * score - score0 - score1) / (2 * variance)
+
+
+def fit_ratings(names, pairings, iterations=1000, tolerance=1e-9):
+    """
+    Classement Elo de tous les agents par maximum de vraisemblance (Bradley-Terry,
+    un nul compte une demi-victoire) à partir des rencontres jouées.
+    Retourne {nom: (elo, demi-largeur de l'intervalle à 95 %)}, moyenne à 0.
+    """
+    points = {name: 0.0 for name in names}
+    games = {name: {} for name in names}
+    for pairing in pairings:
+        a, b = pairing.first, pairing.second
+        played = pairing.games_played() + 2 * PRIOR_DRAWS
+        points[a] += pairing.wins + pairing.draws / 2 + PRIOR_DRAWS
+        points[b] += pairing.losses + pairing.draws / 2 + PRIOR_DRAWS
+        games[a][b] = games[a].get(b, 0) + played
+        games[b][a] = games[b].get(a, 0) + played
+
+    strength = {name: 1.0 for name in names}
+    for _ in range(iterations):
+        change = 0.0
+        for name in names:
+            denominator = sum(count / (strength[name] + strength[other])
+                              for other, count in games[name].items())
+            if denominator:
+                new = points[name] / denominator
+                change = max(change, abs(math.log(new / strength[name])))
+                strength[name] = new
+        if change < tolerance:
+            break
+
+    elos = {name: 400 * math.log10(strength[name]) for name in names}
+    mean = sum(elos.values()) / len(elos) if elos else 0.0
+    scale = 400 / math.log(10)
+    ratings = {}
+    for name in names:
+        information = 0.0
+        for other, count in games[name].items():
+            p = expected_score(elos[name] - elos[other])
+            information += count * p * (1 - p)
+        margin = Z_95 * scale / math.sqrt(information) if information else float("inf")
+        ratings[name] = (elos[name] - mean, margin)
+    return ratings
+
+
+# --- Rencontres ---------------------------------------------------------------
+
+class Pairing:
+    """
+    Rencontre entre deux agents dans un mode : résultats du point de vue de first
+    et état du SPRT ("H0", "H1" ou None tant que le test n'a pas conclu).
+    """
+
+    def __init__(self, mode, first, second, max_games):
+        self.mode = mode
+        self.first = first
+        self.second = second
+        self.max_games = max_games
+        self.wins = 0
+        self.draws = 0
+        self.losses = 0
+        self.scheduled = 0
+        self.llr = 0.0
+        self.decision = None
+
+    def games_played(self):
+        return self.wins + self.draws + self.losses
+
+    def can_schedule(self):
+        return self.decision is None and self.scheduled < self.max_games
+
+    def record(self, score):
+        if score == 1:
+            self.wins += 1
+        elif score == 0:
+            self.losses += 1
+        else:
+            self.draws += 1
+
+    def update_sprt(self, sprt):
+        """sprt : (elo0, elo1, alpha, beta) ou None"""
+        if sprt is None or self.decision is not None:
+            return
+        elo0, elo1, alpha, beta = sprt
+        self.llr = sprt_llr(self.wins, self.draws, self.losses, elo0, elo1)
+        lower, upper = sprt_bounds(alpha, beta)
+        if self.llr >= upper:
+            self.decision = "H1"
+        elif self.llr <= lower:
+            self.decision = "H0"
+
+    def summary(self):
+        elo, low, high = elo_interval(self.wins, self.draws, self.losses)
+        return {
+            "first": self.first,
+            "second": self.second,
+            "games": self.games_played(),
+            "wins": self.wins,
+            "draws": self.draws,
+            "losses": self.losses,
+            "elo": elo,
+            "elo_low": low,
+            "elo_high": high,
+            "llr": self.llr,
+            "sprt": self.decision,
+        }
+
+
+def make_pairings(mode, specs, games, gauntlet=False):
+    """
+    Rencontres d'un mode entre les agents qui le prennent en charge.
+    gauntlet : le premier agent affronte chacun des autres ; sinon toutes les paires.
+    """
+    if gauntlet:
+        if mode not in agent_modes(specs[0]):
+            return []
+        pairs = [(specs[0], other) for other in specs[1:] if mode in agent_modes(other)]
+    else:
+        pairs = list(combinations([spec for spec in specs if mode in agent_modes(spec)], 2))
+    return [Pairing(mode, first, second, games) for first, second in pairs]
+
+
+def tournament_task(task):
+    """
+    Une partie du tournoi (exécutée dans un processus).
+    Les parties vont par deux sur le même plateau, couleurs échangées ;
+    la suite des plateaux ne dépend que de la graine (identique pour toutes les rencontres).
+    Retourne le score de l'agent first (1, 0.5 ou 0) et le résultat de play_game.
+    """
+    mode, first, second, index, seed, rotations, max_plies = task
+    # randomAi et isolation_ai utilisent le module random : parties reproductibles
+    random.seed(seed * 1000003 + index)
+    board_grid = random_board(load_quadrant_grids(), random.Random(seed + index // 2), rotations)
+    first_player = 1 if index % 2 == 0 else 2
+    agents = {first_player: make_agent(first), 3 - first_player: make_agent(second)}
+    result = play_game(board_grid, mode, agents, max_plies)
+    if result["winner"] == 0:
+        score = 0.5
+    else:
+        score = 1 if result["winner"] == first_player else 0
+    return score, result
+
+
+def run_pairings(pairings, workers=1, seed=0, rotations=True, max_plies=MAX_PLIES, sprt=None, report=None):
+    """
+    Joue les rencontres en parallèle (une partie de chaque rencontre à tour de rôle)
+    jusqu'à leur nombre maximal de parties ou à la conclusion de leur SPRT.
+    Les parties déjà lancées à la conclusion sont comptées dans les résultats.
+    report(pairing) est appelé après chaque partie.
+    """
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    pending = {}
+
+    def submit(pairing):
+        task = (pairing.mode, pairing.first, pairing.second, pairing.scheduled, seed, rotations, max_plies)
+        pairing.scheduled += 1
+        if executor is not None:
+            future = executor.submit(tournament_task, task)
+        else:
+            future = Future()
+            future.set_result(tournament_task(task))
+        pending[future] = pairing
+
+    try:
+        turn = 0
+        while True:
+            # Quelques parties d'avance par processus, réparties entre les rencontres
+            while len(pending) < 2 * workers:
+                available = [pairing for pairing in pairings if pairing.can_schedule()]
+                if not available:
+                    break
+                submit(available[turn % len(available)])
+                turn += 1
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                pairing = pending.pop(future)
+                score, _ = future.result()
+                pairing.record(score)
+                pairing.update_sprt(sprt)
+                if report is not None:
+                    report(pairing)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+    return pairings
+
+
+def run_tournament(specs, modes=(0, 1, 2), games=100, workers=1, seed=0, gauntlet=False,
+                   rotations=True, max_plies=MAX_PLIES, sprt=None, report=None):
+    """
+    Tournoi complet : pour chaque mode, rencontres puis classement.
+    Retourne {nom du mode: {"ratings": ..., "pairings": [...], "wall_time": ...}}.
+    """
+    results = {}
+    for mode in modes:
+        pairings = make_pairings(mode, specs, games, gauntlet)
+        if not pairings:
+            continue
+        start = time.perf_counter()
+        run_pairings(pairings, workers, seed, rotations, max_plies, sprt, report)
+        names = sorted({name for pairing in pairings for name in (pairing.first, pairing.second)},
+                       key=specs.index)
+        results[MODE_NAMES[mode]] = {
+            "ratings": fit_ratings(names, pairings),
+            "pairings": [pairing.summary() for pairing in pairings],
+            "wall_time": time.perf_counter() - start,
+        }
+    return results
+
+
+def format_report(results, sprt=None):
+    """Rapport texte : classement puis rencontres, pour chaque mode"""
+    lines = []
+    for mode_name, result in results.items():
+        lines.append(f"=== {mode_name} ({result['wall_time']:.1f} s) ===")
+        ranking = sorted(result["ratings"].items(), key=lambda item: -item[1][0])
+        games = {}
+        for pairing in result["pairings"]:
+            for name in (pairing["first"], pairing["second"]):
+                games[name] = games.get(name, 0) + pairing["games"]
+        for rank, (name, (elo, margin)) in enumerate(ranking, start=1):
+            lines.append(f"{rank:2}. {name:30} {elo:+7.0f} ± {margin:4.0f}  ({games.get(name, 0)} parties)")
+        lines.append("")
+        for pairing in result["pairings"]:
+            line = (f"    {pairing['first']} - {pairing['second']} : "
+                    f"{pairing['wins']} V {pairing['draws']} N {pairing['losses']} D, "
+                    f"Elo {pairing['elo']:+.0f} [{pairing['elo_low']:+.0f}, {pairing['elo_high']:+.0f}]")
+            if sprt is not None:
+                lower, upper = sprt_bounds(sprt[2], sprt[3])
+                decision = pairing["sprt"] or "en cours"
+                line += f", LLR {pairing['llr']:.2f} [{lower:.2f}, {upper:.2f}] {decision}"
+            lines.append(line)
+        lines.append("")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Tournoi Elo entre agents, sans affichage")
+    parser.add_argument("agents", nargs="+",
+                        help='agents, ex. random expert "mcts:time_ms=50" "search:time_budget=0.1"')
+    parser.add_argument("--modes", type=int, nargs="+", choices=[0, 1, 2], default=[0, 1, 2],
+                        help="0 Katarenga, 1 Congress, 2 Isolation")
+    parser.add_argument("--games", type=int, default=100, help="nombre maximal de parties par rencontre")
+    parser.add_argument("--gauntlet", action="store_true", help="le premier agent affronte chacun des autres")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-rotations", action="store_true", help="quadrants toujours dans leur sens d'origine")
+    parser.add_argument("--max-plies", type=int, default=MAX_PLIES)
+    parser.add_argument("--sprt", type=float, nargs=2, metavar=("ELO0", "ELO1"),
+                        help=f"arrêt anticipé par SPRT, ex. --sprt {SPRT_ELO0} {SPRT_ELO1}")
+    parser.add_argument("--alpha", type=float, default=SPRT_ALPHA)
+    parser.add_argument("--beta", type=float, default=SPRT_BETA)
+    parser.add_argument("--output", help="fichier de résultats .json")
+    args = parser.parse_args(argv)
+
+    if len(set(args.agents)) != len(args.agents):
+        parser.error("chaque agent doit être différent")
+    sprt = (args.sprt[0], args.sprt[1], args.alpha, args.beta) if args.sprt else None
+
+    def report(pairing):
+        print(f"\r{MODE_NAMES[pairing.mode]} {pairing.first} - {pairing.second} : "
+              f"{pairing.wins}-{pairing.draws}-{pairing.losses}   ", end="", flush=True)
+
+    results = run_tournament(args.agents, args.modes, args.games, args.workers, args.seed, args.gauntlet,
+                             not args.no_rotations, args.max_plies, sprt, report)
+    print()
+    print(format_report(results, sprt))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"Résultats écrits dans {args.output}")
+    return results
+
+
+if __name__ == "__main__":
+    main()
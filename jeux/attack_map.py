@@ -0,0 +1,120 @@
+from plateau.bitboard import GRID_SIZE, PLAYABLE_MASK, iter_squares, pawn_occupancy, popcount, square
+from plateau.layout_tables import ROOK, BISHOP, get_layout_tables
+
+
+class AttackMap:
+    """
+    Carte des cases attaquées en Isolation, mise à jour à chaque placement.
+    Chaque pion garde son masque d'attaque et chaque case le nombre de pions
+    qui l'attaquent : un placement ne recalcule que le masque du nouveau pion
+    et ceux des tours/fous dont un rayon passe par la case posée.
+    Les cases interdites, les cases libres sûres et leur nombre sont
+    disponibles directement.
+    """
+
+    def __init__(self, tables, occupied=0):
+        self.tables = tables
+        self.occupied = 0
+        # Masque d'attaque de chaque pion posé, et nombre d'attaquants par case
+        self.masks = [0] * (GRID_SIZE * GRID_SIZE)
+        self.counts = [0] * (GRID_SIZE * GRID_SIZE)
+        # Pions posés sur une case tour ou fou (rayons bloquables)
+        self.sliders = 0
+        self.forbidden = 0
+        self.safe = PLAYABLE_MASK
+        self.safe_count = popcount(PLAYABLE_MASK)
+        for sq in iter_squares(occupied):
+            self.place_square(sq)
+
+    @classmethod
+    def from_grids(cls, board_grid, pawn_grid):
+        """Construit la carte à partir des grilles 10x10 du jeu"""
+        pawns = pawn_occupancy(pawn_grid)
+        return cls(get_layout_tables(board_grid), pawns[1] | pawns[2])
+
+    @classmethod
+    def from_state(cls, state):
+        """Construit la carte à partir d'un GameState"""
+        return cls(state.tables, state.occupied())
+
+    # --- Mises à jour --------------------------------------------------
+
+    def _set_mask(self, sq, mask):
+        """Remplace le masque d'attaque du pion sq en ajustant les compteurs"""
+        old = self.masks[sq]
+        if old == mask:
+            return
+        self.masks[sq] = mask
+        counts = self.counts
+        for target in iter_squares(old & ~mask):
+            counts[target] -= 1
+            if counts[target] == 0:
+                bit = 1 << target
+                self.forbidden ^= bit
+                if bit & PLAYABLE_MASK and not bit & self.occupied:
+                    self.safe |= bit
+                    self.safe_count += 1
+        for target in iter_squares(mask & ~old):
+            counts[target] += 1
+            if counts[target] == 1:
+                bit = 1 << target
+                self.forbidden |= bit
+                if bit & self.safe:
+                    self.safe ^= bit
+                    self.safe_count -= 1
+
+    def _refresh_sliders(self, bit):
+        """Recalcule les tours et fous dont un rayon atteint la case modifiée"""
+        attacks = self.tables.attacks
+        for sq in iter_squares(self.sliders):
+            if self.masks[sq] & bit:
+                self._set_mask(sq, attacks(sq, self.occupied))
+
+    def place_square(self, sq):
+        """Pose un pion sur la case sq"""
+        bit = 1 << sq
+        self.occupied |= bit
+        if bit & self.safe:
+            self.safe ^= bit
+            self.safe_count -= 1
+        # Le nouveau pion peut couper les rayons qui le traversent
+        self._refresh_sliders(bit)
+        if self.tables.patterns[sq] in (ROOK, BISHOP):
+            self.sliders |= bit
+        self._set_mask(sq, self.tables.attacks(sq, self.occupied))
+
+    def remove_square(self, sq):
+        """Retire le pion de la case sq (annulation, utilisée par la recherche)"""
+        bit = 1 << sq
+        self._set_mask(sq, 0)
+        self.sliders &= ~bit
+        self.occupied ^= bit
+        # Les rayons bloqués par ce pion s'allongent à nouveau
+        self._refresh_sliders(bit)
+        if bit & PLAYABLE_MASK and not bit & self.forbidden:
+            self.safe |= bit
+            self.safe_count += 1
+
+    def place(self, row, col):
+        self.place_square(square(row, col))
+
+    def remove(self, row, col):
+        self.remove_square(square(row, col))
+
+    # --- Requêtes ------------------------------------------------------
+
+    def is_forbidden(self, row, col):
+        """Case attaquée par au moins un pion"""
+        return bool(self.forbidden >> square(row, col) & 1)
+
+    def is_safe(self, row, col):
+        """Case libre et non attaquée où un pion peut être posé"""
+        return bool(self.safe >> square(row, col) & 1)
+
+    def forbidden_cells(self):
+        """Cases vides interdites (croix), en coordonnées"""
+        return [divmod(sq, GRID_SIZE) for sq in iter_squares(self.forbidden & ~self.occupied & PLAYABLE_MASK)]
+
+    def safe_cells(self):
+        """Cases libres sûres, en coordonnées"""
+        return [divmod(sq, GRID_SIZE) for sq in iter_squares(self.safe)]
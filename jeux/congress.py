@@ -1,56 +1,142 @@
 
 import pygame
+from plateau.bitboard import GRID_SIZE, iter_squares, pawn_occupancy
 
-def connected(row, col, pawn_grid, player, visited, directions):
+# Voisins orthogonaux : Haut, Bas, Gauche, Droite
+DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+
+
+class CongressConnectivity:
     """
-    Fonction récursive pour explorer les pions connectés.
+    Composantes connexes (orthogonales) des pions de chaque joueur, par union-find,
+    directement sur la grille 10x10 (index de case = ligne * 10 + colonne).
+    Congress n'a pas de capture : un coup ne change que les composantes
+    du joueur qui joue, seules celles-ci sont recalculées.
     """
-    # Si la position est déjà visitée ou n'appartient pas au joueur, on arrête
-    if (row, col) in visited or pawn_grid[row][col] != player:
-        return
 
-    # Marquer la position comme visitée
-    visited.append((row, col))
-    for dr, dc in directions:
-        new_row, new_col = row + dr, col + dc
+    def __init__(self, pawn_grid=None):
+        self.cells = {1: set(), 2: set()}
+        self.parent = {1: {}, 2: {}}
+        # Nombre de composantes de chaque joueur
+        self.count = {1: 0, 2: 0}
+        if pawn_grid is not None:
+            pawns = pawn_occupancy(pawn_grid)
+            for player in (1, 2):
+                self.cells[player] = set(iter_squares(pawns[player]))
+        self.rebuild(1)
+        self.rebuild(2)
+
+    @classmethod
+    def from_pawns(cls, pawns):
+        """Construit à partir des bitboards [0, pions_joueur1, pions_joueur2]"""
+        connectivity = cls()
+        for player in (1, 2):
+            connectivity.cells[player] = set(iter_squares(pawns[player]))
+            connectivity.rebuild(player)
+        return connectivity
+
+    def find(self, player, sq):
+        """Racine de la composante de sq (itératif, compression par moitié)"""
+        parent = self.parent[player]
+        while parent[sq] != sq:
+            parent[sq] = parent[parent[sq]]
+            sq = parent[sq]
+        return sq
+
+    def union(self, player, a, b):
+        root_a = self.find(player, a)
+        root_b = self.find(player, b)
+        if root_a != root_b:
+            self.parent[player][root_b] = root_a
+            self.count[player] -= 1
+
+    def rebuild(self, player):
+        """Recalcule les composantes d'un joueur"""
+        cells = self.cells[player]
+        self.parent[player] = {sq: sq for sq in cells}
+        self.count[player] = len(cells)
+        for sq in cells:
+            # Voisins de droite et du bas : chaque liaison n'est vue qu'une fois
+            if sq % GRID_SIZE < GRID_SIZE - 1 and sq + 1 in cells:
+                self.union(player, sq, sq + 1)
+            if sq + GRID_SIZE in cells:
+                self.union(player, sq, sq + GRID_SIZE)
+
+    def apply_move(self, from_pos, to_pos, player):
+        """Met à jour après le déplacement d'un pion du joueur"""
+        cells = self.cells[player]
+        cells.discard(from_pos[0] * GRID_SIZE + from_pos[1])
+        cells.add(to_pos[0] * GRID_SIZE + to_pos[1])
+        self.rebuild(player)
+
+    def components(self, player):
+        """Dictionnaire racine -> liste des cases de la composante"""
+        groups = {}
+        for sq in self.cells[player]:
+            groups.setdefault(self.find(player, sq), []).append(sq)
+        return groups
 
-        # Vérifier si dans les limites de la grille
-        if 0 <= new_row < 8 and 0 <= new_col < 8:
-            connected(new_row, new_col, pawn_grid, player, visited, directions)
+    def component_sizes(self, player):
+        """Tailles des composantes du joueur, de la plus grande à la plus petite"""
+        return sorted((len(group) for group in self.components(player).values()), reverse=True)
+
+    def largest_component(self, player):
+        """Taille de la plus grande composante (0 si le joueur n'a plus de pion)"""
+        sizes = self.component_sizes(player)
+        return sizes[0] if sizes else 0
+
+    def largest_components(self):
+        """Tailles des plus grandes composantes des deux joueurs (pour l'évaluation)"""
+        return {1: self.largest_component(1), 2: self.largest_component(2)}
+
+    def is_connected(self, player):
+        """Tous les pions du joueur forment un seul bloc (faux sans pion)"""
+        return self.count[player] == 1
+
+    def winner(self):
+        """
+        Retourne (gagnant, pions_connectés) comme check_victory,
+        avec les positions (ligne, colonne) de la grille 10x10.
+        """
+        for player in [1, 2]:
+            if self.is_connected(player):
+                return player, [divmod(sq, GRID_SIZE) for sq in sorted(self.cells[player])]
+        return 0, []
 
 
 def find_connected_pawns(pawn_grid, start_pos, player):
     """
-    Trouve tous les pions connectés à partir d'une position de départ.
+    Trouve tous les pions connectés à partir d'une position de départ
+    (parcours itératif de la grille).
     """
-    directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # Haut, Bas, Gauche, Droite
+    rows = len(pawn_grid)
+    cols = len(pawn_grid[0])
+    if pawn_grid[start_pos[0]][start_pos[1]] != player:
+        return []
 
-    visited = []  # Liste pour stocker les positions visitées
-    
-    connected(start_pos[0], start_pos[1], pawn_grid, player, visited, directions)
+    visited = {tuple(start_pos)}
+    order = [tuple(start_pos)]
+    stack = [tuple(start_pos)]
+    while stack:
+        row, col = stack.pop()
+        for dr, dc in DIRECTIONS:
+            new_row, new_col = row + dr, col + dc
+            # Vérifier si dans les limites de la grille
+            if (0 <= new_row < rows and 0 <= new_col < cols and
+                    (new_row, new_col) not in visited and pawn_grid[new_row][new_col] == player):
+                visited.add((new_row, new_col))
+                order.append((new_row, new_col))
+                stack.append((new_row, new_col))
+    return order
 
-    return visited 
 
 def check_victory(pawn_grid):
     """
     Vérifie si l'une des conditions de victoire du mode Congress est remplie.
+    pawn_grid : grille 10x10 du jeu. Retourne (gagnant, pions_connectés).
+    Un joueur sans pion ne gagne pas.
     """
-    # Vérifier la victoire pour chaque joueur
-    for player in [1, 2]:
-        player_pawns = []
-        for row in range(8):
-            for col in range(8):
-                if pawn_grid[row][col] == player:
-                    player_pawns.append((row, col))
-        # Vérifier si tous les pions forment un bloc connecté
-        connected_pawns = find_connected_pawns(pawn_grid, player_pawns[0], player)
-        
-        # Si tous les pions du joueur sont connectés, c'est une victoire
-        if len(connected_pawns) == len(player_pawns):
-            return player, connected_pawns
-    
-    # Aucune victoire
-    return 0, []
+    return CongressConnectivity(pawn_grid).winner()
 
 def highlight_connected_pawns(screen, connected_pawns, board_x, board_y, cell_size, player_color):
     """
@@ -0,0 +1,227 @@
+import os
+import pickle
+import random
+from pathlib import Path
+from plateau.bitboard import GRID_SIZE, iter_squares, pawn_occupancy, popcount
+from plateau.layout_tables import get_layout_tables, layout_hash
+
+# En dessous de ce nombre de cases sûres, l'IA experte joue parfaitement
+SOLVER_THRESHOLD = 16
+
+# Cache disque des positions résolues, un fichier par plateau
+CACHE_DIR = Path(__file__).parent.parent / "assets" / "cache"
+# Au-delà, les nouvelles positions restent en mémoire sans être écrites
+MAX_DISK_ENTRIES = 500000
+
+
+class SolverInterrupted(Exception):
+    """Levée quand la résolution est abandonnée (stop levé) : la position en cours n'est pas mémorisée"""
+
+
+def _placement_result(safe, occupied, attacks, sq):
+    """Cases sûres et occupation après un placement sur sq"""
+    bit = 1 << sq
+    occupied |= bit
+    # Une case sûre n'est sur aucun rayon : seul le nouveau pion retire des cases
+    return safe & ~bit & ~attacks(sq, occupied), occupied
+
+
+class IsolationSolver:
+    """
+    Résolution exacte des fins de partie Isolation pour une disposition de plateau.
+    Une case sûre n'étant attaquée par aucun pion, poser un pion ne coupe aucun
+    rayon : l'ensemble des cases sûres ne fait que diminuer et la suite de la
+    partie ne dépend que de l'occupation. La valeur mémorisée pour une occupation
+    est l'écart de placements (joueur au trait - adversaire) jusqu'à la fin avec
+    un jeu parfait ; elle ne dépend pas de la couleur au trait.
+    """
+
+    def __init__(self, board_grid):
+        self.tables = get_layout_tables(board_grid)
+        self.layout = layout_hash(board_grid)
+        self.memo = {}
+        self.loaded_entries = 0
+        # threading.Event optionnel vérifié à chaque position calculée
+        self.stop = None
+        self.load()
+
+    # --- Cache disque --------------------------------------------------
+
+    def cache_path(self):
+        return CACHE_DIR / f"isolation_{self.layout}.pkl"
+
+    def load(self):
+        """Charge les positions déjà résolues pour ce plateau (si le fichier existe)"""
+        try:
+            with open(self.cache_path(), "rb") as cache_file:
+                memo = pickle.load(cache_file)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return
+        if isinstance(memo, dict):
+            self.memo = memo
+            self.loaded_entries = len(memo)
+
+    def save(self):
+        """Écrit le cache s'il a grandi (écriture atomique)"""
+        if len(self.memo) == self.loaded_entries or len(self.memo) > MAX_DISK_ENTRIES:
+            return
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            temp_path = self.cache_path().with_suffix(".tmp")
+            with open(temp_path, "wb") as cache_file:
+                pickle.dump(self.memo, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self.cache_path())
+            self.loaded_entries = len(self.memo)
+        except OSError as e:
+            print(f"Erreur sauvegarde cache Isolation: {e}")
+
+    # --- Résolution ----------------------------------------------------
+
+    def margin(self, safe, occupied):
+        """Écart de placements final pour le joueur au trait, avec un jeu parfait"""
+        memo = self.memo
+        value = memo.get(occupied)
+        if value is not None:
+            return value
+        if self.stop is not None and self.stop.is_set():
+            raise SolverInterrupted()
+        attacks = self.tables.attacks
+        best = 0
+        if safe:
+            best = -GRID_SIZE * GRID_SIZE
+            for sq in iter_squares(safe):
+                new_safe, new_occupied = _placement_result(safe, occupied, attacks, sq)
+                value = 1 - self.margin(new_safe, new_occupied)
+                if value > best:
+                    best = value
+        memo[occupied] = best
+        return best
+
+    def best_move(self, safe, occupied, stop=None):
+        """
+        Retourne (case, écart) du meilleur placement, ou (None, 0) sans case sûre.
+        SolverInterrupted si stop est levé avant la fin (positions déjà résolues gardées).
+        """
+        self.stop = stop
+        attacks = self.tables.attacks
+        best_sq, best = None, -GRID_SIZE * GRID_SIZE
+        for sq in iter_squares(safe):
+            new_safe, new_occupied = _placement_result(safe, occupied, attacks, sq)
+            value = 1 - self.margin(new_safe, new_occupied)
+            if value > best:
+                best_sq, best = sq, value
+        if best_sq is None:
+            return None, 0
+        return best_sq, best
+
+
+_solvers = {}
+
+
+def get_solver(board_grid):
+    """Solveur du plateau (un seul par disposition, cache disque chargé une fois)"""
+    key = get_layout_tables(board_grid).fingerprint
+    solver = _solvers.get(key)
+    if solver is None:
+        solver = IsolationSolver(board_grid)
+        _solvers[key] = solver
+    return solver
+
+
+def safe_mask(board_grid, pawn_grid):
+    """Occupation et cases sûres de la position"""
+    from jeux.attack_map import AttackMap
+    attack_map = AttackMap.from_grids(board_grid, pawn_grid)
+    return attack_map.safe, attack_map.occupied
+
+
+def solve_position(board_grid, pawn_grid, current_player):
+    """
+    Résultat théorique de la position pour current_player.
+    Retourne (résultat, placement) : résultat 1 gagné, 0 nul, -1 perdu
+    (départage au nombre de pions comme check_isolation_complete_victory),
+    placement (ligne, colonne) ou None si aucune case sûre.
+    """
+    pawns = pawn_occupancy(pawn_grid)
+    safe, occupied = safe_mask(board_grid, pawn_grid)
+    solver = get_solver(board_grid)
+    sq, margin = solver.best_move(safe, occupied)
+    solver.save()
+    final = popcount(pawns[current_player]) - popcount(pawns[3 - current_player]) + margin
+    result = (final > 0) - (final < 0)
+    return result, (divmod(sq, GRID_SIZE) if sq is not None else None)
+
+
+def isolation_expert_ai(pawn_grid, board_grid, current_player, attack_map=None, threshold=SOLVER_THRESHOLD,
+                        stop=None):
+    """
+    IA Isolation de niveau expert, même interface que isolation_ai.
+    Au-dessus du seuil de cases sûres : placement qui retire le moins de cases sûres.
+    En dessous : placement parfait calculé par le solveur.
+    stop : threading.Event optionnel qui interrompt la résolution (retourne alors None).
+    """
+    if attack_map is None:
+        from jeux.attack_map import AttackMap
+        attack_map = AttackMap.from_grids(board_grid, pawn_grid)
+    safe, occupied = attack_map.safe, attack_map.occupied
+    if not safe:
+        return None
+
+    if attack_map.safe_count <= threshold:
+        solver = get_solver(board_grid)
+        try:
+            sq, _ = solver.best_move(safe, occupied, stop)
+        except SolverInterrupted:
+            return None
+        solver.save()
+        return divmod(sq, GRID_SIZE)
+
+    # Heuristique : garder le plus de cases sûres possible après le placement
+    attacks = attack_map.tables.attacks
+    best_count, candidates = -1, []
+    for sq in iter_squares(safe):
+        new_safe, _ = _placement_result(safe, occupied, attacks, sq)
+        count = popcount(new_safe)
+        if count > best_count:
+            best_count, candidates = count, [sq]
+        elif count == best_count:
+            candidates.append(sq)
+    return divmod(random.choice(candidates), GRID_SIZE)
+
+
+def benchmark(games=20, threshold=SOLVER_THRESHOLD, seed=3):
+    """
+    Temps de résolution au moment où la partie passe sous le seuil,
+    sur des plateaux tirés des quadrants du jeu.
+    """
+    import json
+    import time
+    from plateau.game_logic import create_game_board, initialize_pawns_for_game_mode
+
+    quadrants_file = Path(__file__).parent.parent / "quadrant" / "quadrants.json"
+    with open(quadrants_file, "r", encoding="utf-8") as f:
+        grids = [quadrant["grid"] for quadrant in json.load(f).values()]
+    rng = random.Random(seed)
+    timings = []
+    for _ in range(games):
+        board_grid = create_game_board([rng.choice(grids) for _ in range(4)])
+        pawn_grid = initialize_pawns_for_game_mode(2)
+        solver = IsolationSolver.__new__(IsolationSolver)
+        solver.tables, solver.memo = get_layout_tables(board_grid), {}
+        safe, occupied = safe_mask(board_grid, pawn_grid)
+        # Placements aléatoires jusqu'au seuil
+        while popcount(safe) > threshold:
+            sq = rng.choice(list(iter_squares(safe)))
+            safe, occupied = _placement_result(safe, occupied, solver.tables.attacks, sq)
+        start = time.perf_counter()
+        solver.best_move(safe, occupied)
+        timings.append((time.perf_counter() - start, len(solver.memo)))
+    return timings
+
+
+if __name__ == "__main__":
+    timings = benchmark()
+    worst = max(timings)
+    average = sum(t for t, _ in timings) / len(timings)
+    print(f"Seuil {SOLVER_THRESHOLD} cases sûres, {len(timings)} plateaux")
+    print(f"Résolution moyenne : {average * 1000:.1f} ms, pire : {worst[0] * 1000:.1f} ms ({worst[1]} positions)")
@@ -1,4 +1,4 @@
-import pygame
+from plateau.bitboard import CAMP_SQUARES, square
 
 # Variables globales pour les camps (en dehors du plateau 8x8)
 camps_player1 = {"camp1": [], "camp2": []}  # Camps du joueur 1 (rouge)
@@ -43,6 +43,20 @@ def is_camp_occupied(row, col, player):
         else:  # (0, 9)
             return len(camps_player2["camp2"]) > 0
 
+def occupied_camps_mask(player):
+    """Bitboard des camps déjà occupés parmi ceux visés par le joueur"""
+    # Lecture directe des camps : appelé pour chaque get_valid_moves en Katarenga
+    if player == 1:
+        camps, (camp1, camp2) = camps_player1, CAMP_SQUARES[1]
+    else:
+        camps, (camp1, camp2) = camps_player2, CAMP_SQUARES[2]
+    mask = 0
+    if camps["camp1"]:
+        mask |= 1 << camp1
+    if camps["camp2"]:
+        mask |= 1 << camp2
+    return mask
+
 def place_in_camp(row, col, pawn_grid, player):
     """Place un pion dans un camp et le retire du jeu - LIMITE À UN PION PAR CAMP"""
     global camps_player1, camps_player2
@@ -104,14 +118,24 @@ def check_katarenga_victory():
     
     return 0
 
-def draw_camps(screen, board_x, board_y, cell_size):
-    """Dessine les camps dans les coins du frame sans texture de fond"""
+def draw_camps(screen, board_x, board_y, cell_size, camps=None):
+    """
+    Dessine les camps dans les coins du frame sans texture de fond.
+    camps : bitboard des camps occupés (GameState.camps) ; par défaut,
+    lu dans les variables globales des camps.
+    """
+    # Seul affichage du module : les règles restent utilisables sans pygame
+    import pygame
+
     # Couleurs
     RED = (200, 50, 50)
     BLUE = (50, 50, 200)
     WHITE = (255, 255, 255)
     BLACK = (0, 0, 0)
     
+    if camps is None:
+        camps = occupied_camps_mask(1) | occupied_camps_mask(2)
+    
     # Positions des camps dans les coins absolus du frame
     camp_positions = [
         (0, 0), (0, 9),  # Camps bleus en haut
@@ -119,6 +143,10 @@ def draw_camps(screen, board_x, board_y, cell_size):
     ]
     
     for row, col in camp_positions:
+        # Dessiner le camp seulement s'il y a un pion (un pion maximum par camp)
+        if not camps >> square(row, col) & 1:
+            continue
+        
         # Calculer la position dans le coin du frame
         # Les camps sont dans le frame mais en dehors du plateau 8x8
         camp_rect = pygame.Rect(
@@ -128,36 +156,12 @@ def draw_camps(screen, board_x, board_y, cell_size):
             cell_size
         )
         
-        # Identifier le type de camp
-        is_blue_camp = (row == 0)  # Camps du haut = bleus
-        is_red_camp = (row == 9)   # Camps du bas = rouges
+        # Camps du haut = bleus, camps du bas = rouges
+        pion_color = BLUE if row == 0 else RED
         
-        # Dessiner seulement si le camp contient des pions
-        has_pions = False
-        pion_color = None
-        
-        if is_blue_camp:
-            if col == 0 and len(camps_player2["camp1"]) > 0:
-                has_pions = True
-                pion_color = BLUE
-            elif col == 9 and len(camps_player2["camp2"]) > 0:
-                has_pions = True
-                pion_color = BLUE
-        elif is_red_camp:
-            if col == 0 and len(camps_player1["camp1"]) > 0:
-                has_pions = True
-                pion_color = RED
-            elif col == 9 and len(camps_player1["camp2"]) > 0:
-                has_pions = True
-                pion_color = RED
-        
-        # Dessiner le camp seulement s'il y a des pions
-        if has_pions:
-            # Dessiner un cercle pour représenter le pion dans le camp
-            pygame.draw.circle(screen, pion_color, camp_rect.center, cell_size // 3)
-            pygame.draw.circle(screen, BLACK, camp_rect.center, cell_size // 3, 3)
-            
-            # Plus besoin d'afficher le nombre car il n'y a qu'un pion maximum par camp
+        # Dessiner un cercle pour représenter le pion dans le camp
+        pygame.draw.circle(screen, pion_color, camp_rect.center, cell_size // 3)
+        pygame.draw.circle(screen, BLACK, camp_rect.center, cell_size // 3, 3)
 
 def has_pion_in_camp(player):
     """Vérifie si le joueur a au moins un pion dans ses camps"""
@@ -182,6 +186,13 @@ def check_minimum_pawn_victory_condition(pawn_grid, game_mode):
     red_has_camp_pion = has_pion_in_camp(1)
     blue_has_camp_pion = has_pion_in_camp(2)
     
+    return minimum_pawn_winner(red_pawns, blue_pawns, red_has_camp_pion, blue_has_camp_pion)
+
+def minimum_pawn_winner(red_pawns, blue_pawns, red_has_camp_pion, blue_has_camp_pion):
+    """
+    Règle du nombre minimum de pions, sans dépendre des variables globales des camps.
+    Retourne le gagnant (1 ou 2) ou 0 si la partie continue.
+    """
     # Règles modifiées pour la victoire par élimination
     if red_pawns == 1 and not red_has_camp_pion:
         return 2  # Bleu gagne : Rouge n'a qu'1 pion et aucun pion dans un camp
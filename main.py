@@ -1,21 +1,27 @@
 import pygame
-from menus.menu import run_menu
-from config_manager import initialize_quadrants
-from jeux.isolation import run_isolation
 
 if __name__ == "__main__":
-    # Initialiser les quadrants et récupérer la configuration
-    config, _ = initialize_quadrants()
+    # La fenêtre s'ouvre tout de suite : quadrants, sons et images sont chargés
+    # dans un thread pendant l'écran de chargement (assets/startup.py)
     pygame.init()
     screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
 
     pygame.display.set_caption("Jeu Pygame")
 
-    # Lancement du menu principal
-    selected_game = run_menu(screen)  #  Doit retourner un identifiant de mode
+    from assets.startup import load_with_progress
+    loaded = load_with_progress(screen)
 
-    # Redirection selon le mode de jeu choisi
-    if selected_game == "Isolation":
-        run_isolation(screen)
+    if loaded is not None:
+        config, _ = loaded
 
-    pygame.quit()
\ No newline at end of file
+        # Lancement du menu principal (les menus importent les modules de jeu
+        # et de réseau seulement quand leur entrée est choisie)
+        from menus.menu import run_menu
+        selected_game = run_menu(screen)  #  Doit retourner un identifiant de mode
+
+        # Redirection selon le mode de jeu choisi
+        if selected_game == "Isolation":
+            from jeux.isolation import run_isolation
+            run_isolation(screen)
+
+    pygame.quit()
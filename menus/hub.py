@@ -1,17 +1,16 @@
 import pygame
 import sys
 from pathlib import Path
-from menus.menu_quadrant import show_quadrant
-from plateau.game_modes import show_game_modes
 from assets.colors import Colors
 from assets.audio_manager import audio_manager 
-from menus.settings_menu import show_settings_menu  
+from assets.asset_cache import asset_cache
+from assets.event_loop import get_events
 
 def show_settings(screen):
     # Définition des couleurs
     script_dir = Path(__file__).parent.parent.absolute()
-    background_image = pygame.image.load(script_dir / "assets" / "img" / "fond.png")
-    logo_image = pygame.image.load(script_dir / "assets" / "img" / "logo.png")
+    background_path = script_dir / "assets" / "img" / "fond.png"
+    logo_image = asset_cache.image(script_dir / "assets" / "img" / "logo.png", alpha=True)
     WHITE = Colors.WHITE
     BLACK = Colors.BLACK
     GREEN = Colors.GREEN
@@ -53,7 +52,7 @@ def show_settings(screen):
 
     running = True
     while running:
-        background_scaled = pygame.transform.scale(background_image, screen.get_size())
+        background_scaled = asset_cache.scaled(background_path, screen.get_size())
         screen.blit(background_scaled, (0, 0))
         
         # Affichage du logo
@@ -70,22 +69,26 @@ def show_settings(screen):
             # Textes des boutons
             draw_centered_text(texts[i], rect, BLACK)
 
-        # Gestion des événements
-        for event in pygame.event.get():
+        pygame.display.flip()
+
+        # Gestion des événements : la boucle dort jusqu'au prochain événement
+        for event in get_events():
             if event.type == pygame.QUIT:
                 running = False
             if event.type == pygame.MOUSEBUTTONDOWN:
+                # Les écrans sont importés quand leur entrée est choisie (démarrage plus rapide)
                 if buttons[0].collidepoint(event.pos):  # Jouer
                     audio_manager.play_sound('button_click')  #  NOUVEAU SON
+                    from plateau.game_modes import show_game_modes
                     show_game_modes(screen)  # Utilise directement show_game_modes avec le bouton Jouer
                 elif buttons[1].collidepoint(event.pos):  # Quadrant
                     audio_manager.play_sound('button_click')  #  NOUVEAU SON
+                    from menus.menu_quadrant import show_quadrant
                     show_quadrant(screen)
                 elif buttons[2].collidepoint(event.pos):  # Paramètres
                     audio_manager.play_sound('button_click')  #  NOUVEAU SON
+                    from menus.settings_menu import show_settings_menu
                     show_settings_menu(screen)  #  NOUVELLE PAGE SETTINGS
                 elif buttons[3].collidepoint(event.pos):  # Quitter
                     audio_manager.play_sound('button_click')  # NOUVEAU SON
                     running = False
-
-        pygame.display.flip()
\ No newline at end of file
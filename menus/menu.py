@@ -3,14 +3,15 @@ import sys
 from pathlib import Path
 from assets.colors import Colors
 from assets.audio_manager import audio_manager
+from assets.asset_cache import asset_cache
+from assets.event_loop import get_events
 
 
-screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
 def run_menu(screen):
     # Définition des couleurs
     script_dir = Path(sys.argv[0]).parent.absolute()
-    background_image = pygame.image.load(script_dir / "assets" / "img" / "fond.png")
-    logo_image = pygame.image.load(script_dir / "assets" / "img" / "logo.png")
+    background_path = script_dir / "assets" / "img" / "fond.png"
+    logo_image = asset_cache.image(script_dir / "assets" / "img" / "logo.png", alpha=True)
     WHITE = Colors.WHITE
     BLACK = Colors.BLACK
     RED = Colors.RED
@@ -51,7 +52,7 @@ def run_menu(screen):
 
     running = True
     while running:
-        background_scaled = pygame.transform.scale(background_image, screen.get_size())
+        background_scaled = asset_cache.scaled(background_path, screen.get_size())
         screen.blit(background_scaled, (0, 0))
         
         # Affichage du logo
@@ -68,8 +69,10 @@ def run_menu(screen):
             # Textes des boutons
             draw_centered_text(texts[i], rect, BLACK)
 
-        # Gestion des événements
-        for event in pygame.event.get():
+        pygame.display.flip()
+
+        # Gestion des événements : la boucle dort jusqu'au prochain événement
+        for event in get_events():
             if event.type == pygame.QUIT:
                 running = False
             if event.type == pygame.MOUSEBUTTONDOWN:
@@ -81,5 +84,3 @@ def run_menu(screen):
                 elif buttons[1].collidepoint(event.pos):  # Quitter
                     audio_manager.play_sound('button_click')  #gestion son
                     running = False
-
-        pygame.display.flip()
\ No newline at end of file
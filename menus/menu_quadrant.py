@@ -3,13 +3,14 @@ import sys
 from pathlib import Path
 from assets.colors import Colors
 from assets.audio_manager import audio_manager
+from assets.asset_cache import asset_cache
 
 def show_quadrant(screen):
     # Récupérer les dimensions de l'écran
     WIDTH, HEIGHT = screen.get_width(), screen.get_height()
     #couleurs
     script_dir = Path(__file__).parent.parent.absolute()
-    background_image = pygame.image.load(script_dir / "assets" / "img" / "fond.png")
+    background_path = script_dir / "assets" / "img" / "fond.png"
     
     WHITE = Colors.WHITE
     BLACK = Colors.BLACK
@@ -48,7 +49,7 @@ def show_quadrant(screen):
 
     running = True
     while running:
-        background_scaled = pygame.transform.scale(background_image, screen.get_size())
+        background_scaled = asset_cache.scaled(background_path, screen.get_size())
         screen.blit(background_scaled, (0, 0))
         
         # Titre centré au-dessus des boutons
@@ -3,6 +3,8 @@ import sys
 from pathlib import Path
 from assets.colors import Colors
 from assets.audio_manager import audio_manager
+from assets.asset_cache import asset_cache
+from assets.event_loop import get_events
 
 def show_settings_menu(screen):
     """
@@ -13,7 +15,7 @@ def show_settings_menu(screen):
     
     # Couleurs
     script_dir = Path(__file__).parent.parent.absolute()
-    background_image = pygame.image.load(script_dir / "assets" / "img" / "fond.png")
+    background_path = script_dir / "assets" / "img" / "fond.png"
     
     WHITE = Colors.WHITE
     BLACK = Colors.BLACK
@@ -78,7 +80,7 @@ def show_settings_menu(screen):
     
     while running:
         # Fond
-        background_scaled = pygame.transform.scale(background_image, screen.get_size())
+        background_scaled = asset_cache.scaled(background_path, screen.get_size())
         screen.blit(background_scaled, (0, 0))
         
         # Titre
@@ -138,8 +140,11 @@ def show_settings_menu(screen):
         back_text_rect = back_text.get_rect(center=back_button_rect.center)
         screen.blit(back_text, back_text_rect)
         
-        # Gestion des événements
-        for event in pygame.event.get():
+        pygame.display.flip()
+        
+        # Gestion des événements : la boucle dort jusqu'au prochain événement
+        # (le glissement du curseur de volume arrive en MOUSEMOTION)
+        for event in get_events():
             if event.type == pygame.QUIT:
                 return
             
@@ -181,5 +186,4 @@ def show_settings_menu(screen):
                     audio_manager.play_sound('button_click')
                     return
         
-        pygame.display.flip()
         clock.tick(60)
\ No newline at end of file
@@ -0,0 +1,195 @@
+import threading
+from plateau.bitboard import GRID_SIZE
+from plateau.search import DEFAULT_TIME_BUDGET
+
+# Recherche courte utilisée pour prévoir la réponse quand la table n'en connaît pas
+PREDICTION_DEPTH = 2
+PREDICTION_TIME = 0.05
+
+
+class AIDriver:
+    """
+    Calcul des coups de l'IA hors de la boucle d'affichage.
+    request() lance le calcul dans un thread, la boucle de jeu continue
+    d'animer et appelle poll() à chaque image jusqu'au résultat ; la fin
+    d'un calcul poste assets.event_loop.WAKE_EVENT pour réveiller une
+    boucle qui attend les événements.
+    cancel() interrompt la réflexion (bouton Abandonner, changement de mode) :
+    les calculs vérifient un threading.Event et un résultat périmé est ignoré.
+    Pendant le tour du joueur humain, ponder_katarenga() et ponder_mcts()
+    réfléchissent à l'avance sur la réponse attendue.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stop = None
+        # Numéro de la demande en cours : un résultat d'une autre demande est ignoré
+        self._generation = 0
+        self._result = None
+        self._ready = False
+        # None, "request" (coup attendu) ou "ponder" (réflexion anticipée)
+        self.status = None
+        # Réflexion alpha-beta : clé de la position prévue, événement qui termine
+        # la recherche (le résultat est gardé) et minuterie lancée à la réponse prévue
+        self._ponder_key = None
+        self._ponder_finish = None
+        self._ponder_budget = DEFAULT_TIME_BUDGET
+        self._ponder_timer = None
+        self.ponder_hits = 0
+
+    # --- Thread de calcul ----------------------------------------------
+
+    def _start(self, compute, status):
+        """Lance compute(stop) dans un thread pour une nouvelle demande"""
+        self._generation += 1
+        generation = self._generation
+        stop = threading.Event()
+
+        def run():
+            try:
+                result = compute(stop)
+            except Exception as e:
+                print(f"Erreur IA: {e}")
+                result = None
+            with self._lock:
+                if generation == self._generation and not stop.is_set():
+                    self._result = result
+                    self._ready = True
+            # La boucle de jeu peut dormir en attendant le coup : la réveiller
+            from assets.event_loop import wake
+            wake()
+
+        self._stop = stop
+        self._result = None
+        self._ready = False
+        self.status = status
+        self._thread = threading.Thread(target=run, name="ai-driver", daemon=True)
+        self._thread.start()
+
+    def cancel(self):
+        """Interrompt le calcul en cours et oublie son résultat"""
+        with self._lock:
+            self._generation += 1
+            self._ready = False
+            self._result = None
+        if self._stop is not None:
+            self._stop.set()
+        if self._ponder_finish is not None:
+            self._ponder_finish.set()
+        if self._ponder_timer is not None:
+            self._ponder_timer.cancel()
+        # Les calculs s'arrêtent en quelques millisecondes : attendre évite
+        # qu'un arbre MCTS soit encore modifié par l'ancien thread
+        if self._thread is not None:
+            self._thread.join()
+        self._thread = None
+        self._stop = None
+        self.status = None
+        self._ponder_key = None
+        self._ponder_finish = None
+        self._ponder_timer = None
+
+    def thinking(self):
+        """Un coup a été demandé et n'a pas encore été récupéré"""
+        return self.status == "request"
+
+    def pondering(self):
+        return self.status == "ponder"
+
+    def request(self, compute, key=None):
+        """
+        Demande un coup : compute(stop) est appelé dans le thread.
+        key est la clé Zobrist de la position : si elle correspond à la
+        réflexion anticipée, la recherche déjà commencée est conservée.
+        """
+        with self._lock:
+            ponder_key = self._ponder_key
+        if self.status == "ponder" and key is not None and key == ponder_key:
+            # Réponse prévue : la réflexion devient la recherche du coup,
+            # avec un budget complet à partir de maintenant
+            self.ponder_hits += 1
+            self.status = "request"
+            self._ponder_key = None
+            self._ponder_timer = threading.Timer(self._ponder_budget, self._ponder_finish.set)
+            self._ponder_timer.daemon = True
+            self._ponder_timer.start()
+            return
+        self.cancel()
+        self._start(compute, "request")
+
+    def poll(self):
+        """Retourne (terminé, coup) ; le coup n'est rendu qu'une fois"""
+        if self.status != "request":
+            return False, None
+        with self._lock:
+            if not self._ready:
+                return False, None
+            result = self._result
+            self._ready = False
+            self._result = None
+        self.status = None
+        self._thread = None
+        return True, result
+
+    # --- Réflexion pendant le tour de l'adversaire ----------------------
+
+    def ponder_katarenga(self, state, time_budget=DEFAULT_TIME_BUDGET):
+        """
+        Katarenga alpha-beta : dans le thread de calcul, prévoit la réponse de
+        l'adversaire (meilleur coup mémorisé dans la table de transposition,
+        sinon résultat d'une recherche courte), la joue et cherche déjà le
+        coup suivant, sans limite de temps jusqu'à la réponse réelle.
+        La boucle d'affichage ne fait que lancer le calcul : la position
+        prévue n'est connue (et une réponse reconnue par request) qu'une fois
+        la prédiction terminée.
+        """
+        from plateau.search import KatarengaSearch, get_shared_table
+        from plateau.zobrist import decode_move
+
+        self.cancel()
+        # copy() ne garde pas l'historique : le relever avant
+        history = set(state.history_keys())
+        ponder_state = state.copy()
+        # Sans limite de temps : les recherches s'arrêtent quand finish est levé
+        finish = threading.Event()
+
+        def compute(stop):
+            table = get_shared_table(ponder_state.tables.key)
+            entry = table.probe(ponder_state.key)
+            predicted = decode_move(entry[3]) if entry is not None else None
+            if predicted is None or predicted not in ponder_state.legal_moves():
+                # La recherche a pu tourner dans d'autres processus (table non partagée)
+                prediction = KatarengaSearch(PREDICTION_TIME, PREDICTION_DEPTH, table)
+                prediction.history = set(history)
+                prediction.stop = finish
+                predicted, _ = prediction.find_best_move(ponder_state.copy())
+                if predicted is None or finish.is_set():
+                    return None
+
+            search = KatarengaSearch(float("inf"), transposition_table=table)
+            search.history = history | {ponder_state.key}
+            search.stop = finish
+            ponder_state.make_move(predicted)
+            with self._lock:
+                if not stop.is_set():
+                    self._ponder_key = ponder_state.key
+            move, _ = search.find_best_move(ponder_state)
+            if move is None:
+                return None
+            from_row, from_col = divmod(move[0], GRID_SIZE)
+            return from_row, from_col, divmod(move[1], GRID_SIZE)
+
+        self._ponder_finish = finish
+        self._ponder_budget = time_budget
+        self._start(compute, "ponder")
+
+    def ponder_mcts(self, player, state):
+        """
+        MCTS : l'arbre continue de grandir depuis la position actuelle,
+        surtout sous les réponses les plus probables. Le coup suivant
+        reprend l'arbre à partir de la réponse réellement jouée.
+        """
+        self.cancel()
+        state = state.copy()
+        self._start(lambda stop: player.ponder(state, stop), "ponder")
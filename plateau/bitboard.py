@@ -0,0 +1,151 @@
+# Moteur de génération de coups sur bitboards.
+# Chaque case de la grille 10x10 correspond à un bit : index = ligne * 10 + colonne.
+# Les camps Katarenga (coins de la grille) font partie des 100 bits.
+
+GRID_SIZE = 10
+
+# Couleurs des cases (valeurs de board_grid) et déplacement associé
+YELLOW = 1  # Fou
+GREEN = 2   # Cavalier
+BLUE = 3    # Roi
+RED = 4     # Tour
+
+KING_OFFSETS = [
+    (-1, -1), (-1, 0), (-1, 1),
+    (0, -1),           (0, 1),
+    (1, -1),  (1, 0),  (1, 1)
+]
+KNIGHT_OFFSETS = [
+    (-2, -1), (-2, 1),
+    (-1, -2), (-1, 2),
+    (1, -2),  (1, 2),
+    (2, -1),  (2, 1)
+]
+# Ordre des directions identique à l'ancienne implémentation (ordre des coups conservé)
+ROOK_DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+BISHOP_DIRECTIONS = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+
+
+def square(row, col):
+    """Convertit des coordonnées (ligne, colonne) en index de bit"""
+    return row * GRID_SIZE + col
+
+
+def to_coords(sq):
+    """Convertit un index de bit en coordonnées (ligne, colonne)"""
+    return divmod(sq, GRID_SIZE)
+
+
+def is_playable(row, col):
+    """Vérifie si une case appartient à la zone de jeu 8x8"""
+    return 1 <= row <= 8 and 1 <= col <= 8
+
+
+def popcount(mask):
+    """Nombre de bits à 1 dans un masque"""
+    return bin(mask).count("1")
+
+
+def iter_squares(mask):
+    """Parcourt les index des bits à 1 par ordre croissant"""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def iter_squares_desc(mask):
+    """Parcourt les index des bits à 1 par ordre décroissant"""
+    while mask:
+        sq = mask.bit_length() - 1
+        yield sq
+        mask ^= 1 << sq
+
+
+def _build_playable_mask():
+    mask = 0
+    for row in range(1, 9):
+        for col in range(1, 9):
+            mask |= 1 << square(row, col)
+    return mask
+
+
+def _build_step_masks(offsets):
+    """Masques des cases atteignables en un saut (roi, cavalier), limités à la zone 8x8"""
+    masks = []
+    for sq in range(GRID_SIZE * GRID_SIZE):
+        row, col = to_coords(sq)
+        mask = 0
+        for dr, dc in offsets:
+            r, c = row + dr, col + dc
+            if is_playable(r, c):
+                mask |= 1 << square(r, c)
+        masks.append(mask)
+    return masks
+
+
+def _build_ray_masks(directions):
+    """
+    Rayons géométriques (sans arrêt de couleur) pour chaque case et chaque direction.
+    Un rayon s'arrête dès qu'il quitte la zone de jeu 8x8.
+    """
+    rays = []
+    for dr, dc in directions:
+        per_square = []
+        for sq in range(GRID_SIZE * GRID_SIZE):
+            row, col = to_coords(sq)
+            mask = 0
+            r, c = row + dr, col + dc
+            while is_playable(r, c):
+                mask |= 1 << square(r, c)
+                r += dr
+                c += dc
+            per_square.append(mask)
+        # Direction croissante si l'index augmente le long du rayon
+        rays.append((per_square, dr * GRID_SIZE + dc > 0))
+    return rays
+
+
+PLAYABLE_MASK = _build_playable_mask()
+KING_MASKS = _build_step_masks(KING_OFFSETS)
+KNIGHT_MASKS = _build_step_masks(KNIGHT_OFFSETS)
+ROOK_RAYS = _build_ray_masks(ROOK_DIRECTIONS)
+BISHOP_RAYS = _build_ray_masks(BISHOP_DIRECTIONS)
+
+# Camps Katarenga : cases visées par chaque joueur et ligne de base ennemie
+CAMP_SQUARES = {
+    1: (square(9, 0), square(9, 9)),  # Rouge vise les camps du bas
+    2: (square(0, 0), square(0, 9))   # Bleu vise les camps du haut
+}
+CAMP_MASKS = {
+    player: (1 << squares[0]) | (1 << squares[1])
+    for player, squares in CAMP_SQUARES.items()
+}
+ENEMY_BASELINE_ROW = {1: 8, 2: 1}
+
+
+# Tables de traduction octet -> '0'/'1' pour extraire les bitboards d'une grille
+_PLAYER1_BITS = bytes(ord("1") if value == 1 else ord("0") for value in range(256))
+_PLAYER2_BITS = bytes(ord("1") if value == 2 else ord("0") for value in range(256))
+
+
+def pawn_occupancy(pawn_grid):
+    """
+    Construit les bitboards des pions à partir de pawn_grid.
+    Retourne [0, pions_joueur1, pions_joueur2] pour un accès par numéro de joueur.
+    """
+    # La chaîne est inversée pour que la case 0 corresponde au bit de poids faible
+    raw = b"".join(map(bytes, pawn_grid))[::-1]
+    return [0, int(raw.translate(_PLAYER1_BITS), 2), int(raw.translate(_PLAYER2_BITS), 2)]
+
+
+def ray_reach(ray, ascending, blockers):
+    """Partie du rayon atteignable, première case bloquante incluse"""
+    stops = ray & blockers
+    if not stops:
+        return ray
+    if ascending:
+        first = stops & -stops
+        return ray & ((first << 1) - 1)
+    first = 1 << (stops.bit_length() - 1)
+    return ray & ~(first - 1)
@@ -0,0 +1,74 @@
+import pygame
+
+
+class BoardRenderer:
+    """
+    Affichage du plateau par couches.
+    - Couche fixe : fond, cadre, cases du plateau et boutons, dessinée une seule fois
+      par taille de fenêtre et par plateau dans une surface hors écran.
+    - Couches dynamiques (pions, points de déplacement, croix Isolation, textes) :
+      chacune est décrite par une entrée {clé: (rect, valeur)} à chaque image.
+    Seules les zones dont la valeur a changé depuis l'image précédente sont
+    restaurées depuis la couche fixe, redessinées et envoyées à l'écran avec
+    pygame.display.update ; une partie à l'arrêt ne redessine plus rien.
+    changed indique si la dernière image a modifié l'écran.
+    """
+
+    def __init__(self):
+        self.screen = None
+        self.static = None
+        self.static_key = None
+        self.layers = {}
+        self.full_redraw = True
+        self.changed = False
+
+    def invalidate(self):
+        """L'écran a été recouvert (message de victoire...) : la prochaine image est complète"""
+        self.full_redraw = True
+
+    def prepare(self, screen, static_key, draw_static, layers):
+        """
+        Prépare l'image : retourne la liste des zones à redessiner (vide si rien n'a changé).
+        static_key identifie la couche fixe, draw_static(surface) la dessine.
+        Les zones sont restaurées depuis la couche fixe et l'écran est limité (clip)
+        à leur union : l'appelant redessine ensuite les couches dynamiques sans rien
+        changer à son code de dessin, puis appelle present().
+        """
+        self.screen = screen
+        if self.static is None or static_key != self.static_key:
+            self.static = pygame.Surface(screen.get_size()).convert()
+            draw_static(self.static)
+            self.static_key = static_key
+            self.full_redraw = True
+
+        if self.full_redraw:
+            rects = [screen.get_rect()]
+        else:
+            rects = []
+            previous = self.layers
+            for key in previous.keys() | layers.keys():
+                old = previous.get(key)
+                new = layers.get(key)
+                if old != new:
+                    if old is not None:
+                        rects.append(old[0])
+                    if new is not None:
+                        rects.append(new[0])
+        self.layers = layers
+        self.changed = bool(rects)
+
+        if rects:
+            area = rects[0].unionall(rects[1:])
+            screen.set_clip(area)
+            screen.blit(self.static, area, area)
+        return rects
+
+    def present(self, rects):
+        """Affiche les zones redessinées (tout l'écran après une invalidation)"""
+        if self.screen is not None:
+            self.screen.set_clip(None)
+        if self.full_redraw:
+            pygame.display.flip()
+            self.full_redraw = False
+        elif rects:
+            pygame.display.update(rects)
@@ -1,24 +1,19 @@
 import pygame
 import sys
 import time
-import random
 from pathlib import Path
 from assets.colors import Colors
 from plateau.pawn import get_valid_moves, highlight_possible_moves, is_valid_move
 from plateau.game_modes import GLOBAL_SELECTED_GAME, GLOBAL_SELECTED_OPPONENT
-from jeux.congress import check_victory, highlight_connected_pawns
+from jeux.congress import check_victory, highlight_connected_pawns, CongressConnectivity
 from jeux.isolation import place_pawn, check_isolation_victory
-from jeux.katarenga import check_minimum_pawn_victory_condition
+from plateau.game_logic import create_game_board, initialize_pawns_for_game_mode, isolation_ai, randomAi
 from assets.audio_manager import audio_manager
+from assets.asset_cache import asset_cache
+from assets.event_loop import get_events
+from assets.frame_profiler import profiler, WAIT_SECTION
 
 
-def get_valid_moves_with_mode(row, col, board_grid, pawn_grid, game_mode):
-    """
-    Version locale de get_valid_moves qui utilise maintenant pawn.py pour tout
-    """
-    from plateau.pawn import get_valid_moves
-    return get_valid_moves(row, col, board_grid, pawn_grid, game_mode)
-
 # Version améliorée de la classe Animation
 class Animation:
     def __init__(self):
@@ -86,17 +81,21 @@ class Animation:
         """Vérifie s'il y a un mouvement en attente à exécuter"""
         return self.pending_move is not None
     
-    def execute_pending_move(self, pawn_grid, current_game_mode):
-        """Exécute le mouvement en attente et retourne les infos de victoire"""
+    def execute_pending_move(self, state, current_game_mode, connectivity=None):
+        """
+        Exécute le mouvement en attente dans l'état de la partie (GameState)
+        et retourne les infos de victoire
+        connectivity : composantes Congress de la partie, mises à jour par le coup
+        """
         if not self.pending_move:
             return None, None, None
             
         from_pos = self.pending_move['from']
         to_pos = self.pending_move['to']
         
-        # Exécuter le mouvement dans la grille logique
-        pawn_grid[to_pos[0]][to_pos[1]] = pawn_grid[from_pos[0]][from_pos[1]]
-        pawn_grid[from_pos[0]][from_pos[1]] = 0
+        # Exécuter le mouvement dans l'état logique, la grille n'est qu'une vue
+        state.move_coords(from_pos, to_pos)
+        pawn_grid = state.to_pawn_grid()
         
         # Vérifier la condition de victoire selon le mode de jeu
         winner = 0
@@ -104,14 +103,18 @@ class Animation:
         game_over = False
         
         if current_game_mode == 1:  # Si mode Congress
-            winner, connected_pawns = check_victory(pawn_grid)
+            if connectivity is not None:
+                # Seules les composantes du joueur qui a joué sont recalculées
+                connectivity.apply_move(from_pos, to_pos, self.pending_move['pawn_color'])
+                winner, connected_pawns = connectivity.winner()
+            else:
+                winner, connected_pawns = check_victory(pawn_grid)
             if winner > 0:
                 game_over = True
         elif current_game_mode == 2:  # Si mode Isolation
             game_over, winner = check_isolation_victory(pawn_grid, self.pending_move['pawn_color'], None)
         elif current_game_mode == 0:  # Si mode Katarenga
-            from jeux.katarenga import check_katarenga_victory
-            winner = check_katarenga_victory()
+            winner = state.camps_winner()
             if winner > 0:
                 game_over = True
         
@@ -120,14 +123,19 @@ class Animation:
         
         return winner, connected_pawns, game_over
 
-def draw_animated_pawns(screen, pawn_grid, board_x, board_y, cell_size, selected_pawn, animation, current_game_mode):
-    """Dessine les pions avec animations simples"""
+def draw_animated_pawns(screen, pawn_grid, board_x, board_y, cell_size, selected_pawn, animation, current_game_mode,
+                        moving_pos=None):
+    """
+    Dessine les pions avec animations simples
+    moving_pos : position du pion en mouvement déjà calculée pour cette image
+    """
     DARK_RED = Colors.DARK_RED
     DARK_BLUE = Colors.DARK_BLUE
     BLACK = Colors.BLACK
     
     # Obtenir la position du pion en mouvement
-    moving_pos = animation.get_current_pos()
+    if moving_pos is None:
+        moving_pos = animation.get_current_pos()
     moving_pawn_info = animation.moving_pawn
     
     # Déterminer la taille de la grille selon le mode
@@ -169,87 +177,52 @@ def draw_animated_pawns(screen, pawn_grid, board_x, board_y, cell_size, selected
         pygame.draw.circle(screen, pawn_color, moving_pos, radius)
         pygame.draw.circle(screen, BLACK, moving_pos, radius, 2)
 
-def check_isolation_complete_victory(pawn_grid, board_grid):
+def board_layers(pawn_grid, board_x, board_y, cell_size, selected_pawn, animation, moving_pos,
+                 possible_moves=(), forbidden_cells=(), connected_pawns=(), camps=0):
+    """
+    Description des couches dynamiques du plateau pour BoardRenderer :
+    {(ligne, colonne): (zone de la case, contenu)} pour chaque case où quelque chose
+    est dessiné (pion, sélection, point de déplacement, croix, surbrillance, camp),
+    et "moving" pour le pion en cours d'animation (à la position moving_pos).
+    """
+    moves = set(possible_moves)
+    forbidden = set(forbidden_cells)
+    connected = set(connected_pawns)
+    moving_pawn_info = animation.moving_pawn
+    layers = {}
+    for row in range(10):
+        for col in range(10):
+            pawn = pawn_grid[row][col]
+            # Le pion en mouvement n'est plus dessiné à sa position d'origine
+            if moving_pawn_info and moving_pawn_info[0] == row and moving_pawn_info[1] == col:
+                pawn = 0
+            cell = (row, col)
+            content = (pawn, cell == selected_pawn, cell in moves, cell in forbidden,
+                       cell in connected, bool(camps >> (row * 10 + col) & 1))
+            if any(content):
+                layers[cell] = (pygame.Rect(board_x + col * cell_size, board_y + row * cell_size,
+                                            cell_size, cell_size), content)
+    
+    # Pion en mouvement : sa zone suit la position de l'animation
+    if moving_pos and moving_pawn_info and animation.moving_pawn_color:
+        radius = cell_size // 3 + 2
+        layers["moving"] = (pygame.Rect(moving_pos[0] - radius, moving_pos[1] - radius, 2 * radius, 2 * radius),
+                            animation.moving_pawn_color)
+    return layers
+
+def check_isolation_complete_victory(pawn_grid, board_grid, attack_map=None):
     """
     Vérifie si le jeu Isolation est terminé car toutes les cases sont prises
     (soit par des pions, soit interdites par des croix)
+    attack_map : carte d'attaque de la partie (reconstruite si absente)
     """
-    # Compter les cases libres ET non interdites dans la zone 8x8
-    free_valid_positions = 0
-    
-    for row in range(1, 9):
-        for col in range(1, 9):
-            if pawn_grid[row][col] == 0:  # Case vide
-                # Vérifier si cette case est interdite (avec croix)
-                position_forbidden = False
-                
-                # Vérifier tous les pions existants pour voir s'ils interdisent cette case
-                for pion_row in range(1, 9):
-                    for pion_col in range(1, 9):
-                        if pawn_grid[pion_row][pion_col] != 0:  # Il y a un pion ici
-                            cell_color = board_grid[pion_row][pion_col]
-                            
-                            # Calculer les positions d'attaque selon la couleur de la case
-                            if cell_color == 3:  # Bleu = Roi
-                                directions = [(-1,-1), (-1,0), (-1,1), (0,-1), (0,1), (1,-1), (1,0), (1,1)]
-                                for dr, dc in directions:
-                                    new_row, new_col = pion_row + dr, pion_col + dc
-                                    if new_row == row and new_col == col:
-                                        position_forbidden = True
-                                        break
-                            
-                            elif cell_color == 4:  # Rouge = Tour
-                                directions = [(-1,0), (1,0), (0,-1), (0,1)]
-                                for dr, dc in directions:
-                                    new_row, new_col = pion_row + dr, pion_col + dc
-                                    while 1 <= new_row <= 8 and 1 <= new_col <= 8:
-                                        if new_row == row and new_col == col:
-                                            position_forbidden = True
-                                            break
-                                        if pawn_grid[new_row][new_col] != 0:
-                                            break
-                                        if board_grid[new_row][new_col] == 4:
-                                            break
-                                        new_row, new_col = new_row + dr, new_col + dc
-                                    if position_forbidden:
-                                        break
-                            
-                            elif cell_color == 1:  # Jaune = Fou
-                                directions = [(-1,-1), (-1,1), (1,-1), (1,1)]
-                                for dr, dc in directions:
-                                    new_row, new_col = pion_row + dr, pion_col + dc
-                                    while 1 <= new_row <= 8 and 1 <= new_col <= 8:
-                                        if new_row == row and new_col == col:
-                                            position_forbidden = True
-                                            break
-                                        if pawn_grid[new_row][new_col] != 0:
-                                            break
-                                        if board_grid[new_row][new_col] == 1:
-                                            break
-                                        new_row, new_col = new_row + dr, new_col + dc
-                                    if position_forbidden:
-                                        break
-                            
-                            elif cell_color == 2:  # Vert = Cavalier
-                                knight_moves = [(-2,-1), (-2,1), (-1,-2), (-1,2), (1,-2), (1,2), (2,-1), (2,1)]
-                                for dr, dc in knight_moves:
-                                    new_row, new_col = pion_row + dr, pion_col + dc
-                                    if new_row == row and new_col == col:
-                                        position_forbidden = True
-                                        break
-                            
-                            if position_forbidden:
-                                break
-                        if position_forbidden:
-                            break
-                
-                # Si la case n'est pas interdite, c'est une case libre valide
-                if not position_forbidden:
-                    free_valid_positions += 1
+    if attack_map is None:
+        from jeux.attack_map import AttackMap
+        attack_map = AttackMap.from_grids(board_grid, pawn_grid)
     
     # Si aucune case libre et valide, le jeu est terminé
     # Le gagnant est celui qui a le plus de pions
-    if free_valid_positions == 0:
+    if attack_map.safe_count == 0:
         player1_pawns = sum(1 for row in range(1, 9) for col in range(1, 9) if pawn_grid[row][col] == 1)
         player2_pawns = sum(1 for row in range(1, 9) for col in range(1, 9) if pawn_grid[row][col] == 2)
         
@@ -262,228 +235,57 @@ def check_isolation_complete_victory(pawn_grid, board_grid):
     
     return False, 0
 
-def show_invalid_positions_isolation(screen, pawn_grid, board_grid, board_x, board_y, cell_size):
+def show_invalid_positions_isolation(screen, pawn_grid, board_grid, board_x, board_y, cell_size, attack_map=None):
     """
     Affiche des croix noires sur les cases où il n'est pas possible de placer un pion
     en mode Isolation (zone 8x8 dans la grille 10x10)
-    Ultra simple : regarde tous les pions existants et marque leurs cases d'attaque
-    AVEC règles d'arrêt sur cases colorées (comme dans vos images)
+    Les cases attaquées (avec arrêt sur cases colorées) viennent de la carte
+    d'attaque, mise à jour à chaque placement au lieu d'être recalculée à chaque image
     """
-    # Créer un set des positions interdites
-    forbidden_positions = set()
-    
-    # Pour chaque pion sur le plateau
-    for pion_row in range(1, 9):
-        for pion_col in range(1, 9):
-            if pawn_grid[pion_row][pion_col] != 0:  # Il y a un pion ici
-                # Regarder la couleur de la case où est le pion
-                cell_color = board_grid[pion_row][pion_col]
-                
-                # Calculer les positions d'attaque selon la couleur de la case
-                if cell_color == 3:  # Bleu = Roi (8 directions, 1 case)
-                    directions = [(-1,-1), (-1,0), (-1,1), (0,-1), (0,1), (1,-1), (1,0), (1,1)]
-                    for dr, dc in directions:
-                        new_row, new_col = pion_row + dr, pion_col + dc
-                        if 1 <= new_row <= 8 and 1 <= new_col <= 8:
-                            forbidden_positions.add((new_row, new_col))
-                
-                elif cell_color == 4:  # Rouge = Tour (4 directions, jusqu'à obstacle OU case rouge)
-                    directions = [(-1,0), (1,0), (0,-1), (0,1)]
-                    for dr, dc in directions:
-                        new_row, new_col = pion_row + dr, pion_col + dc
-                        while 1 <= new_row <= 8 and 1 <= new_col <= 8:
-                            forbidden_positions.add((new_row, new_col))
-                            # Arrêter si on rencontre un autre pion
-                            if pawn_grid[new_row][new_col] != 0:
-                                break
-                            # Arrêter si on arrive sur une case rouge (règle spéciale)
-                            if board_grid[new_row][new_col] == 4:
-                                break
-                            new_row, new_col = new_row + dr, new_col + dc
-                
-                elif cell_color == 1:  # Jaune = Fou (4 diagonales, jusqu'à obstacle OU case jaune)
-                    directions = [(-1,-1), (-1,1), (1,-1), (1,1)]
-                    for dr, dc in directions:
-                        new_row, new_col = pion_row + dr, pion_col + dc
-                        while 1 <= new_row <= 8 and 1 <= new_col <= 8:
-                            forbidden_positions.add((new_row, new_col))
-                            # Arrêter si on rencontre un autre pion
-                            if pawn_grid[new_row][new_col] != 0:
-                                break
-                            # Arrêter si on arrive sur une case jaune (règle spéciale)
-                            if board_grid[new_row][new_col] == 1:
-                                break
-                            new_row, new_col = new_row + dr, new_col + dc
-                
-                elif cell_color == 2:  # Vert = Cavalier (en L)
-                    knight_moves = [(-2,-1), (-2,1), (-1,-2), (-1,2), (1,-2), (1,2), (2,-1), (2,1)]
-                    for dr, dc in knight_moves:
-                        new_row, new_col = pion_row + dr, pion_col + dc
-                        if 1 <= new_row <= 8 and 1 <= new_col <= 8:
-                            forbidden_positions.add((new_row, new_col))
+    if attack_map is None:
+        from jeux.attack_map import AttackMap
+        attack_map = AttackMap.from_grids(board_grid, pawn_grid)
     
     # Dessiner les croix sur toutes les positions interdites qui sont vides
-    for row, col in forbidden_positions:
-        if pawn_grid[row][col] == 0:  # Case vide
-            # Dessiner une croix noire
-            x = board_x + col * cell_size
-            y = board_y + row * cell_size
-            
-            # Marges pour la croix
-            margin = cell_size // 4
-            
-            # Dessiner la croix noire
-            pygame.draw.line(screen, (0, 0, 0), 
-                        (x + margin, y + margin), 
-                        (x + cell_size - margin, y + cell_size - margin), 6)
-            pygame.draw.line(screen, (0, 0, 0), 
-                        (x + cell_size - margin, y + margin), 
-                        (x + margin, y + cell_size - margin), 6)
-
-def create_game_board(quadrant_grid_data):
+    for row, col in attack_map.forbidden_cells():
+        # Dessiner une croix noire
+        x = board_x + col * cell_size
+        y = board_y + row * cell_size
+        
+        # Marges pour la croix
+        margin = cell_size // 4
+        
+        # Dessiner la croix noire
+        pygame.draw.line(screen, (0, 0, 0), 
+                    (x + margin, y + margin), 
+                    (x + cell_size - margin, y + cell_size - margin), 6)
+        pygame.draw.line(screen, (0, 0, 0), 
+                    (x + cell_size - margin, y + margin), 
+                    (x + margin, y + cell_size - margin), 6)
+
+def ai_move_compute(state, pawn_grid, board_grid, game_mode, current_player, attack_map, expert, mcts_player=None):
     """
-    Crée un plateau de jeu à partir des données de grille des 4 quadrants
+    Prépare le calcul du coup de l'IA pour AIDriver : retourne compute(stop).
+    Le calcul travaille sur une copie de l'état, la partie n'est pas modifiée
+    pendant la réflexion.
     """
-    # Créer une grille 10x10 vide pour le plateau
-    board_grid = [[0 for _ in range(10)] for _ in range(10)]
-    
-    # Remplir la grille avec les données des quadrants
-    if len(quadrant_grid_data) == 4:
-        # Quadrant 1 (haut gauche)
-        for i in range(4):
-            for j in range(4):
-                board_grid[i + 1][j + 1] = quadrant_grid_data[0][i][j]
-
-        # Quadrant 2 (haut droite)
-        for i in range(4):
-            for j in range(4):
-                board_grid[i + 1][j + 5] = quadrant_grid_data[1][i][j]
-
-        # Quadrant 3 (bas gauche)
-        for i in range(4):
-            for j in range(4):
-                board_grid[i + 5][j + 1] = quadrant_grid_data[2][i][j]
-
-        # Quadrant 4 (bas droite)
-        for i in range(4):
-            for j in range(4):
-                board_grid[i + 5][j + 5] = quadrant_grid_data[3][i][j]
-    
-    return board_grid
+    snapshot = state.copy()
+    history = state.history_keys()
+    if mcts_player is not None:
+        from plateau.mcts import mcts_ai
+        return lambda stop: mcts_ai(mcts_player, snapshot, stop)
+    if game_mode == 0 and expert:
+        # Katarenga : recherche alpha-beta répartie sur les cœurs disponibles
+        from plateau.parallel_search import get_parallel_search
+        return lambda stop: get_parallel_search().search_move(snapshot, history=history, stop=stop)
+    if game_mode == 2:
+        if expert:
+            # Heuristique puis jeu parfait sous le seuil de cases sûres
+            from jeux.isolation_solver import isolation_expert_ai
+            return lambda stop: isolation_expert_ai(pawn_grid, board_grid, current_player, attack_map, stop=stop)
+        return lambda stop: isolation_ai(pawn_grid, board_grid, current_player, attack_map)
+    return lambda stop: randomAi(pawn_grid, board_grid, current_player, game_mode, state.camps)
 
-def initialize_pawns_for_game_mode(game_mode):
-    """
-    Initialise les pions selon le mode de jeu sélectionné
-    """
-    # Créer une grille 10x10 vide pour les pions
-    pawn_grid = [[0 for _ in range(10)] for _ in range(10)]
-    
-    if game_mode == 0:  # Katarenga
-        # Pions rouges ligne 1 (joueur 1) - colonnes 1 à 8
-        for col in range(1, 9):
-            pawn_grid[1][col] = 1
-        # Pions bleus ligne 8 (joueur 2) - colonnes 1 à 8
-        for col in range(1, 9):
-            pawn_grid[8][col] = 2
-
-    elif game_mode == 1:  # Congress
-        # Positions des pions rouges (joueur 1) - ajustées pour la zone 8x8
-        red_positions = [
-            (1, 2), (1, 5), (2, 8), (4, 1), 
-            (5, 8), (7, 1), (8, 4), (8, 7)   
-        ]
-        
-        # Positions des pions bleus (joueur 2) - ajustées pour la zone 8x8
-        blue_positions = [
-            (1, 4), (1, 7), (2, 1), (4, 8), 
-            (5, 1), (7, 8), (8, 2), (8, 5) 
-        ]
-        
-        # Placer les pions rouges
-        for row, col in red_positions:
-            pawn_grid[row][col] = 1
-        
-        # Placer les pions bleus
-        for row, col in blue_positions:
-            pawn_grid[row][col] = 2
-    
-    elif game_mode == 2:  # Isolation
-        # Plateau vide au début pour le mode Isolation
-        pass
-    
-    return pawn_grid
-
-def isolation_ai(pawn_grid, board_grid, current_player):
-    """
-    IA simple pour le mode Isolation qui choisit une position aléatoire valide
-    Ultra simple : évite les cases où il y a des croix
-    AVEC règles d'arrêt sur cases colorées (comme dans vos images)
-    """
-    # Créer un set des positions interdites (même logique que show_invalid_positions_isolation)
-    forbidden_positions = set()
-    
-    # Pour chaque pion sur le plateau
-    for pion_row in range(1, 9):
-        for pion_col in range(1, 9):
-            if pawn_grid[pion_row][pion_col] != 0:  # Il y a un pion ici
-                # Regarder la couleur de la case où est le pion
-                cell_color = board_grid[pion_row][pion_col]
-                
-                # Calculer les positions d'attaque selon la couleur de la case
-                if cell_color == 3:  # Bleu = Roi
-                    directions = [(-1,-1), (-1,0), (-1,1), (0,-1), (0,1), (1,-1), (1,0), (1,1)]
-                    for dr, dc in directions:
-                        new_row, new_col = pion_row + dr, pion_col + dc
-                        if 1 <= new_row <= 8 and 1 <= new_col <= 8:
-                            forbidden_positions.add((new_row, new_col))
-                
-                elif cell_color == 4:  # Rouge = Tour
-                    directions = [(-1,0), (1,0), (0,-1), (0,1)]
-                    for dr, dc in directions:
-                        new_row, new_col = pion_row + dr, pion_col + dc
-                        while 1 <= new_row <= 8 and 1 <= new_col <= 8:
-                            forbidden_positions.add((new_row, new_col))
-                            if pawn_grid[new_row][new_col] != 0:
-                                break
-                            # Arrêter si on arrive sur une case rouge (règle spéciale)
-                            if board_grid[new_row][new_col] == 4:
-                                break
-                            new_row, new_col = new_row + dr, new_col + dc
-                
-                elif cell_color == 1:  # Jaune = Fou
-                    directions = [(-1,-1), (-1,1), (1,-1), (1,1)]
-                    for dr, dc in directions:
-                        new_row, new_col = pion_row + dr, pion_col + dc
-                        while 1 <= new_row <= 8 and 1 <= new_col <= 8:
-                            forbidden_positions.add((new_row, new_col))
-                            if pawn_grid[new_row][new_col] != 0:
-                                break
-                            # Arrêter si on arrive sur une case jaune (règle spéciale)
-                            if board_grid[new_row][new_col] == 1:
-                                break
-                            new_row, new_col = new_row + dr, new_col + dc
-                
-                elif cell_color == 2:  # Vert = Cavalier
-                    knight_moves = [(-2,-1), (-2,1), (-1,-2), (-1,2), (1,-2), (1,2), (2,-1), (2,1)]
-                    for dr, dc in knight_moves:
-                        new_row, new_col = pion_row + dr, pion_col + dc
-                        if 1 <= new_row <= 8 and 1 <= new_col <= 8:
-                            forbidden_positions.add((new_row, new_col))
-    
-    # Chercher toutes les positions valides (vides et pas interdites)
-    valid_positions = []
-    for row in range(1, 9):
-        for col in range(1, 9):
-            if (pawn_grid[row][col] == 0 and  # Case vide
-                (row, col) not in forbidden_positions):  # Pas interdite
-                valid_positions.append((row, col))
-    
-    # Si aucune position valide, retourner None
-    if not valid_positions:
-        return None
-    
-    # Choisir une position aléatoire
-    return random.choice(valid_positions)
 
 def start_game(screen, quadrants_data):
     """
@@ -493,7 +295,7 @@ def start_game(screen, quadrants_data):
 
     # Couleurs
     script_dir = Path(sys.argv[0]).parent.absolute()
-    background_image = pygame.image.load(script_dir / "assets" / "img" / "fond.png")
+    background_path = script_dir / "assets" / "img" / "fond.png"
     
     WHITE = Colors.WHITE
     BLACK = Colors.BLACK
@@ -507,15 +309,17 @@ def start_game(screen, quadrants_data):
     # Chargement des images
     PATH = Path(sys.argv[0]).parent.absolute()
     
-    # Dictionnaire des valeurs de cellule aux images
+    # Dictionnaire des valeurs de cellule aux images (chargées et redimensionnées par asset_cache)
+    cell_image_paths = {
+        1: PATH / "assets" / "img" / "yellow.png",
+        2: PATH / "assets" / "img" / "green.png",
+        3: PATH / "assets" / "img" / "blue.png",
+        4: PATH / "assets" / "img" / "red.png",
+    }
     images = {}
-    images[1] = pygame.image.load(PATH / "assets" / "img" / "yellow.png")  
-    images[2] = pygame.image.load(PATH / "assets" / "img" / "green.png")  
-    images[3] = pygame.image.load(PATH / "assets" / "img" / "blue.png")   
-    images[4] = pygame.image.load(PATH / "assets" / "img" / "red.png")
 
-    # Chargement de l'image du cadre    
-    frame_image = pygame.image.load(PATH / "assets" / "img" / "frame.png")    
+    # Image du cadre
+    frame_path = PATH / "assets" / "img" / "frame.png"
     
     # Créer le plateau de jeu à partir des données des quadrants
     board_grid = create_game_board(quadrants_data)
@@ -538,26 +342,46 @@ def start_game(screen, quadrants_data):
     # Initialiser les pions selon le mode de jeu
     pawn_grid = initialize_pawns_for_game_mode(current_game_mode)
     
-    # Initialiser Katarenga si nécessaire
-    if current_game_mode == 0:
-        from jeux.katarenga import reset_camps
-        reset_camps()
+    # État de la partie (pions, camps Katarenga, joueur au trait) :
+    # pawn_grid n'en est qu'une vue pour l'affichage, recalculée après chaque coup
+    from plateau.game_state import GameState
+    state = GameState.from_grids(board_grid, pawn_grid, current_game_mode)
+    
+    # Carte d'attaque Isolation, mise à jour à chaque placement
+    from jeux.attack_map import AttackMap
+    attack_map = AttackMap.from_state(state)
+    
+    # Composantes connexes Congress, mises à jour à chaque coup
+    connectivity = CongressConnectivity(pawn_grid)
+    
+    # Adversaire MCTS : créé au premier coup, son arbre est réutilisé d'un tour à l'autre
+    mcts_player = None
+    
+    # Calcul des coups de l'IA en arrière-plan (et réflexion pendant le tour humain)
+    from plateau.ai_driver import AIDriver
+    ai_driver = AIDriver()
+    pondered_key = None
     
     # Initialiser la phase de jeu
     game_phase = "play"
     
     def reset_game_for_mode():
         nonlocal current_player, selected_pawn, possible_moves, game_over, game_phase, winner, connected_pawns, current_game_mode
+        nonlocal state, attack_map, connectivity, mcts_player, pondered_key
 
         # IMPORTANT: Recharger le mode depuis les variables globales
         from plateau.game_modes import GLOBAL_SELECTED_GAME, GLOBAL_SELECTED_OPPONENT
         current_game_mode = GLOBAL_SELECTED_GAME
         new_pawn_grid = initialize_pawns_for_game_mode(current_game_mode)
         
-        # Réinitialiser Katarenga si nécessaire
-        if current_game_mode == 0:
-            from jeux.katarenga import reset_camps
-            reset_camps()
+        # Nouvel état de partie (les camps Katarenga repartent vides)
+        state = GameState.from_grids(board_grid, new_pawn_grid, current_game_mode)
+        attack_map = AttackMap.from_state(state)
+        connectivity = CongressConnectivity(new_pawn_grid)
+        # La réflexion en cours portait sur l'ancienne partie
+        ai_driver.cancel()
+        mcts_player = None
+        pondered_key = None
 
         # Réinitialiser les variables de jeu
         selected_pawn = None
@@ -579,48 +403,26 @@ def start_game(screen, quadrants_data):
     # Horloge pour contrôler le framerate
     clock = pygame.time.Clock()
     
-    running = True
-    while running:
-        # Vérifier si le mode de jeu a changé
-        from plateau.game_modes import GLOBAL_SELECTED_GAME, GLOBAL_SELECTED_OPPONENT
-        if GLOBAL_SELECTED_GAME != last_known_game_mode:
-            current_game_mode = GLOBAL_SELECTED_GAME
-            pawn_grid = reset_game_for_mode()
-            last_known_game_mode = current_game_mode
-        
-        # Récupérer les dimensions actuelles de la fenêtre
-        current_width, current_height = screen.get_size()
-        
-        # Utiliser la taille originale de Katarenga comme base pour tous les modes
-        cell_size = min(current_width, current_height) // 10
-        
-        # Redimensionner les images
-        for key in images:
-            images[key] = pygame.transform.scale(images[key], (cell_size, cell_size))
-        
-        # Taille du plateau en pixels 
-        board_size = 10 * cell_size
-        
-        # Position du plateau avec espace pour le contour
-        board_x = (current_width - board_size) // 2
-        board_y = (current_height - board_size) // 2
-        
-        # Boutons
-        back_button = pygame.Rect(20, 20, 80, 30)
-        
-        background_scaled = pygame.transform.scale(background_image, screen.get_size())
-        screen.blit(background_scaled, (0, 0))        
+    # Affichage par couches : plateau pré-rendu une fois par taille de fenêtre et par mode,
+    # pions et repères redessinés seulement dans les zones qui changent
+    from plateau.board_renderer import BoardRenderer
+    renderer = BoardRenderer()
+    
+    def draw_static(surface):
+        """Couche fixe : fond, cadre, cases du plateau, mode de jeu et bouton Abandonner"""
+        background_scaled = asset_cache.scaled(background_path, screen.get_size())
+        surface.blit(background_scaled, (0, 0))
 
         # Dessiner le contour du plateau (ajusté pour la taille Katarenga)
-        if frame_image:
+        if frame_path:
             frame_cell_size = min(current_width, current_height) // 12  # Plus petit pour le cadre
             frame_x = (current_width - 10 * frame_cell_size) // 2
             frame_y = (current_height - 10 * frame_cell_size) // 2
-            scaled_frame = pygame.transform.scale(frame_image, (
+            scaled_frame = asset_cache.scaled(frame_path, (
                 10 * frame_cell_size + 2 * frame_cell_size,
                 10 * frame_cell_size + 2 * frame_cell_size
-            ))
-            screen.blit(scaled_frame, (frame_x - frame_cell_size, frame_y - frame_cell_size))
+            ), alpha=True)
+            surface.blit(scaled_frame, (frame_x - frame_cell_size, frame_y - frame_cell_size))
 
         # Dessiner le plateau selon le mode
         if current_game_mode == 0:  # Katarenga - plateau 10x10
@@ -641,14 +443,10 @@ def start_game(screen, quadrants_data):
                         # Zone de jeu normale - dessiner seulement si on a une texture
                         cell_value = board_grid[row][col]
                         if cell_value in images:
-                            screen.blit(images[cell_value], cell_rect)
+                            surface.blit(images[cell_value], cell_rect)
                             # Dessiner la bordure seulement sur les cases avec texture
-                            pygame.draw.rect(screen, BLACK, cell_rect, 2)
+                            pygame.draw.rect(surface, BLACK, cell_rect, 2)
                     # Ne pas dessiner les cases vides des bords (lignes/colonnes 0 et 9)
-            
-            # Dessiner les camps pour Katarenga
-            from jeux.katarenga import draw_camps
-            draw_camps(screen, board_x, board_y, cell_size)
         
         else:  # Congress et Isolation - afficher la zone 8x8 dans la grille 10x10
             for row in range(1, 9):
@@ -664,36 +462,135 @@ def start_game(screen, quadrants_data):
                     
                     # Dessiner la cellule avec l'image correspondante
                     if cell_value in images:
-                        screen.blit(images[cell_value], cell_rect)
+                        surface.blit(images[cell_value], cell_rect)
                         # Dessiner la bordure seulement sur les cases avec texture
-                        pygame.draw.rect(screen, BLACK, cell_rect, 2)
+                        pygame.draw.rect(surface, BLACK, cell_rect, 2)
+        
+
+        
+        # Afficher des informations spécifiques au mode de jeu
+        mode_names = ["Katarenga", "Congress", "Isolation"]
+        mode_text = font.render(f"Mode: {mode_names[current_game_mode]}", True, BLACK)
+        surface.blit(mode_text, (current_width - 200, 50))
+
+        # Dessiner le bouton retour Abandonner
+        pygame.draw.rect(surface, RED, back_button)
+        back_text = font.render("Abandonner", True, WHITE)
+        back_text_rect = back_text.get_rect(center=back_button.center)
+        surface.blit(back_text, back_text_rect)
+    
+    def render():
+        """Dessine les couches dynamiques dans les zones modifiées et les affiche"""
+        show_moves = (selected_pawn and possible_moves and not game_over and
+                      not animation.is_moving() and current_game_mode in [0, 1])
+        show_crosses = current_game_mode == 2 and not game_over and not animation.is_moving()
+        show_connected = game_over and winner > 0 and current_game_mode == 1
+        player_text = None
+        if not game_over:
+            player_text = f"Tour du joueur: {'Rouge' if current_player == 1 else 'Bleu'}"
+        # Position de l'animation calculée une fois : la zone redessinée et le pion coïncident
+        moving_pos = animation.get_current_pos()
+        layers = board_layers(pawn_grid, board_x, board_y, cell_size, selected_pawn, animation, moving_pos,
+                              possible_moves if show_moves else (),
+                              attack_map.forbidden_cells() if show_crosses else (),
+                              connected_pawns if show_connected else (),
+                              state.camps if current_game_mode == 0 else 0)
+        if player_text:
+            layers["player"] = (pygame.Rect((current_width - 200, 20), font.size(player_text)), player_text)
+        if profiler.enabled:
+            # Overlay du profiler, rafraîchi quelques fois par seconde
+            layers["profiler"] = (profiler.overlay_rect(screen), profiler.refresh_key)
+        
+        with profiler.section("plateau"):
+            dirty = renderer.prepare(screen, (screen.get_size(), current_game_mode), draw_static, layers)
+        if dirty:
+            # Dessiner les camps pour Katarenga
+            if current_game_mode == 0:
+                from jeux.katarenga import draw_camps
+                draw_camps(screen, board_x, board_y, cell_size, state.camps)
+            
+            # Dessiner les pions avec animations
+            with profiler.section("pions"):
+                draw_animated_pawns(screen, pawn_grid, board_x, board_y, cell_size, selected_pawn, animation,
+                                    current_game_mode, moving_pos)
+            
+            # Afficher les positions invalides pour Isolation
+            if show_crosses:
+                with profiler.section("croix"):
+                    show_invalid_positions_isolation(screen, pawn_grid, board_grid, board_x, board_y, cell_size, attack_map)
+            
+            # Dessiner les mouvements possibles
+            if show_moves:
+                highlight_possible_moves(screen, possible_moves, board_x, board_y, cell_size)
+            
+            # Mettre en surbrillance les pions connectés si le jeu est terminé en mode Congress
+            if show_connected:
+                player_color = DARK_RED if winner == 1 else DARK_BLUE
+                highlight_connected_pawns(screen, connected_pawns, board_x, board_y, cell_size, player_color)
+            
+            # Afficher le joueur actuel sauf si le jeu est terminé
+            if player_text:
+                text = font.render(player_text, True, DARK_RED if current_player == 1 else DARK_BLUE)
+                screen.blit(text, (current_width - 200, 20))
+            
+            profiler.draw(screen)
+        with profiler.section("affichage"):
+            renderer.present(dirty)
+    
+    # Profiler des images (opt-in) : l'attente avant la partie n'est pas une image
+    profiler.reset()
+    
+    running = True
+    while running:
+        # Vérifier si le mode de jeu a changé
+        from plateau.game_modes import GLOBAL_SELECTED_GAME, GLOBAL_SELECTED_OPPONENT
+        if GLOBAL_SELECTED_GAME != last_known_game_mode:
+            current_game_mode = GLOBAL_SELECTED_GAME
+            pawn_grid = reset_game_for_mode()
+            last_known_game_mode = current_game_mode
+        
+        # Récupérer les dimensions actuelles de la fenêtre
+        current_width, current_height = screen.get_size()
+        
+        # Utiliser la taille originale de Katarenga comme base pour tous les modes
+        cell_size = min(current_width, current_height) // 10
+        
+        # Images à la taille des cases (redimensionnées seulement si la taille change)
+        for key, path in cell_image_paths.items():
+            images[key] = asset_cache.scaled(path, (cell_size, cell_size), alpha=True)
         
-        # Dessiner les pions avec animations
-        draw_animated_pawns(screen, pawn_grid, board_x, board_y, cell_size, selected_pawn, animation, current_game_mode)
+        # Taille du plateau en pixels 
+        board_size = 10 * cell_size
+        
+        # Position du plateau avec espace pour le contour
+        board_x = (current_width - board_size) // 2
+        board_y = (current_height - board_size) // 2
         
-        # Afficher les positions invalides pour Isolation
-        if current_game_mode == 2 and not game_over and not animation.is_moving():
-            show_invalid_positions_isolation(screen, pawn_grid, board_grid, board_x, board_y, cell_size)
+        # Bouton retour Abandonner
+        text_width, text_height = font.size("Abandonner")
+        back_button = pygame.Rect(20, 20, text_width + 20, text_height + 10)
         
         # NOUVELLE VÉRIFICATION: Vérifier si toutes les cases sont prises en mode Isolation
         if current_game_mode == 2 and not game_over and not animation.is_moving() and not animation.has_pending_move():
-            complete_game_over, complete_winner = check_isolation_complete_victory(pawn_grid, board_grid)
+            with profiler.section("victoire"):
+                complete_game_over, complete_winner = check_isolation_complete_victory(pawn_grid, board_grid, attack_map)
             if complete_game_over:
                 game_over = True
                 winner = complete_winner
         
         # Gestion spéciale Katarenga : entrée dans les camps
         if current_game_mode == 0 and not animation.is_moving() and animation.has_pending_move():
-            from jeux.katarenga import place_in_camp, check_katarenga_victory, get_camp_positions
+            from jeux.katarenga import get_camp_positions
             to_row, to_col = animation.pending_move['to']
             player = animation.pending_move['pawn_color']
             camp_positions = get_camp_positions(player)
             
             if (to_row, to_col) in camp_positions:
-                if place_in_camp(to_row, to_col, pawn_grid, player):
-                    pawn_grid[animation.pending_move['from'][0]][animation.pending_move['from'][1]] = 0
+                if not state.is_camp_occupied(to_row, to_col):
+                    state.move_coords(animation.pending_move['from'], (to_row, to_col))
+                    pawn_grid = state.to_pawn_grid()
                     animation.pending_move = None
-                    winner = check_katarenga_victory()
+                    winner = state.camps_winner()
                     game_over = winner > 0
                     if not game_over:
                         current_player = 3 - current_player
@@ -701,19 +598,22 @@ def start_game(screen, quadrants_data):
                     continue
 
         if not animation.is_moving() and animation.has_pending_move():
-            winner_result, connected_result, game_over_result = animation.execute_pending_move(pawn_grid, current_game_mode)
-            
-            if winner_result is not None:
-                winner = winner_result
-                connected_pawns = connected_result
-                game_over = game_over_result
-
-            # 💡 Vérifier si un joueur n'a plus assez de pions pour gagner (Katarenga uniquement)
-            if current_game_mode == 0 and not game_over:
-                forced_victory = check_minimum_pawn_victory_condition(pawn_grid, current_game_mode)
-                if forced_victory > 0:
-                    winner = forced_victory
-                    game_over = True
+            # Coup joué et tests de victoire
+            with profiler.section("victoire"):
+                winner_result, connected_result, game_over_result = animation.execute_pending_move(state, current_game_mode, connectivity)
+                pawn_grid = state.to_pawn_grid()
+                
+                if winner_result is not None:
+                    winner = winner_result
+                    connected_pawns = connected_result
+                    game_over = game_over_result
+
+                # 💡 Vérifier si un joueur n'a plus assez de pions pour gagner (Katarenga uniquement)
+                if current_game_mode == 0 and not game_over:
+                    forced_victory = state.minimum_pawn_winner()
+                    if forced_victory > 0:
+                        winner = forced_victory
+                        game_over = True
 
             # Passer au joueur suivant si le jeu n'est pas terminé
             if not game_over:
@@ -721,20 +621,14 @@ def start_game(screen, quadrants_data):
 
             animation.complete_animation()
 
-        
-        # Dessiner les mouvements possibles
-        if (selected_pawn and possible_moves and not game_over and 
-            not animation.is_moving() and current_game_mode in [0, 1]):
-            highlight_possible_moves(screen, possible_moves, board_x, board_y, cell_size)
-        
-        # Mettre en surbrillance les pions connectés si le jeu est terminé en mode Congress
-        if game_over and winner > 0 and current_game_mode == 1:
-            player_color = DARK_RED if winner == 1 else DARK_BLUE
-            highlight_connected_pawns(screen, connected_pawns, board_x, board_y, cell_size, player_color)
 
         # Afficher le message de victoire unifié pour tous les modes
         if game_over and winner >= 0:
+            ai_driver.cancel()
+            # Position finale affichée sous le message
+            render()
             choice = display_victory_message(screen, winner)
+            renderer.invalidate()
             if choice == "rejouer":
                 # Relancer le game_setup pour rejouer
                 from plateau.game_setup import show_game_setup
@@ -743,65 +637,81 @@ def start_game(screen, quadrants_data):
                 # Retourner au hub
                 return
         
-        # Afficher le joueur actuel sauf si le jeu est terminé
-        if not game_over:
-            player_text = font.render(f"Tour du joueur: {'Rouge' if current_player == 1 else 'Bleu'}", True, DARK_RED if current_player == 1 else DARK_BLUE)
-            screen.blit(player_text, (current_width - 200, 20))
-        
-        # Afficher des informations spécifiques au mode de jeu
-        mode_names = ["Katarenga", "Congress", "Isolation"]
-        mode_text = font.render(f"Mode: {mode_names[current_game_mode]}", True, BLACK)
-        screen.blit(mode_text, (current_width - 200, 50))
-
-        # Dessiner le bouton retour Abandonner
-        text_width, text_height = font.size("Abandonner")
-        back_button = pygame.Rect(back_button.x, back_button.y, text_width + 20, text_height + 10)
-        pygame.draw.rect(screen, RED, back_button)
-        back_text = font.render("Abandonner", True, WHITE)
-        back_text_rect = back_text.get_rect(center=back_button.center)
-        screen.blit(back_text, back_text_rect)
-        
-        # Traitement de l'IA - SEULEMENT si mode Ordi sélectionné
-        if (not game_over and current_player == 2 and not animation.is_moving() and 
+        # Traitement de l'IA - SEULEMENT si mode Ordi ou MCTS sélectionné
+        # Le coup est calculé dans un thread : l'affichage continue pendant la réflexion
+        from plateau.game_modes import GLOBAL_SELECTED_OPPONENT, GLOBAL_AI_LEVEL
+        ai_opponent = GLOBAL_SELECTED_OPPONENT in (0, 3)  # 0 = Ordi, 3 = MCTS
+        expert = GLOBAL_AI_LEVEL == 1
+        use_mcts = GLOBAL_SELECTED_OPPONENT == 3
+        if use_mcts and mcts_player is None:
+            from plateau.mcts import MCTSPlayer
+            mcts_player = MCTSPlayer()
+        if ai_opponent and not use_mcts and current_game_mode == 0 and expert:
+            # Processus de recherche démarrés ici, dans le thread principal,
+            # et non au premier coup dans le thread de l'IA (sans effet ensuite)
+            from plateau.parallel_search import get_parallel_search
+            get_parallel_search().warm_up()
+        
+        if (ai_opponent and not game_over and current_player == 2 and not animation.is_moving() and 
             not animation.has_pending_move()):
             
-            # Recharger la variable globale pour être sûr
-            from plateau.game_modes import GLOBAL_SELECTED_OPPONENT
-            if GLOBAL_SELECTED_OPPONENT == 0:  # 0 = Ordi
-                
-                if current_game_mode in [0, 1]:  # IA pour Katarenga et Congress (déplacement)
-                    ai_move = randomAi(pawn_grid, board_grid, 2, current_game_mode)
-                    if ai_move:
-                        from_row, from_col, (to_row, to_col) = ai_move
-                        animation.start_move(from_row, from_col, to_row, to_col, board_x, board_y, cell_size, pawn_grid[from_row][from_col])
-                        animation.pending_move = {
-                            'from': (from_row, from_col),
-                            'to': (to_row, to_col),
-                            'pawn_color': pawn_grid[from_row][from_col]
-                        }
-                        selected_pawn = None
-                        possible_moves = []
-                
-                elif current_game_mode == 2:  # IA pour Isolation (placement)
-                    ai_position = isolation_ai(pawn_grid, board_grid, current_player)
-                    if ai_position:
-                        row, col = ai_position
-                        # Placer directement le pion (on sait que c'est valide)
-                        pawn_grid[row][col] = current_player
-                        # Jouer le son de placement
-                        audio_manager.play_sound('pawn_move')
-                        
-                        from jeux.isolation import check_isolation_victory
-                        game_over, winner = check_isolation_victory(pawn_grid, current_player, board_grid)
-                        if not game_over:
-                            current_player = 3 - current_player
-                    else:
-                        # L'IA ne peut plus jouer, le joueur humain gagne
-                        game_over = True
-                        winner = 1
+            if not ai_driver.thinking():
+                ai_driver.request(ai_move_compute(state, pawn_grid, board_grid, current_game_mode, current_player,
+                                                  attack_map, expert, mcts_player if use_mcts else None),
+                                  state.key)
+            ai_ready, ai_result = ai_driver.poll()
+            
+            if ai_ready and current_game_mode in [0, 1]:  # IA pour Katarenga et Congress (déplacement)
+                ai_move = ai_result
+                if ai_move:
+                    from_row, from_col, (to_row, to_col) = ai_move
+                    animation.start_move(from_row, from_col, to_row, to_col, board_x, board_y, cell_size, pawn_grid[from_row][from_col])
+                    animation.pending_move = {
+                        'from': (from_row, from_col),
+                        'to': (to_row, to_col),
+                        'pawn_color': pawn_grid[from_row][from_col]
+                    }
+                    selected_pawn = None
+                    possible_moves = []
+            
+            elif ai_ready and current_game_mode == 2:  # IA pour Isolation (placement)
+                ai_position = ai_result
+                if ai_position:
+                    row, col = ai_position
+                    # Placer directement le pion (on sait que c'est valide)
+                    state.place(row, col, current_player)
+                    attack_map.place(row, col)
+                    pawn_grid = state.to_pawn_grid()
+                    # Jouer le son de placement
+                    audio_manager.play_sound('pawn_move')
+                    
+                    from jeux.isolation import check_isolation_victory
+                    game_over, winner = check_isolation_victory(pawn_grid, current_player, board_grid)
+                    if not game_over:
+                        current_player = 3 - current_player
+                else:
+                    # L'IA ne peut plus jouer, le joueur humain gagne
+                    game_over = True
+                    winner = 1
+        
+        # Réflexion anticipée pendant le tour du joueur humain (une fois par position)
+        elif (ai_opponent and not game_over and current_player == 1 and not animation.is_moving() and
+              not animation.has_pending_move() and state.key != pondered_key):
+            pondered_key = state.key
+            if use_mcts:
+                ai_driver.ponder_mcts(mcts_player, state)
+            elif current_game_mode == 0 and expert:
+                ai_driver.ponder_katarenga(state)
                 
-        for event in pygame.event.get():
+        # Attente des événements : cadence normale pendant une animation ou juste après
+        # un changement à l'écran, sinon la boucle dort jusqu'à une action du joueur
+        # ou jusqu'à la fin de la réflexion de l'IA (WAKE_EVENT posté par AIDriver)
+        active = animation.moving_pawn is not None or animation.has_pending_move() or renderer.changed
+        with profiler.section(WAIT_SECTION):
+            events = get_events(active)
+        for event in events:
             if event.type == pygame.QUIT:
+                ai_driver.cancel()
                 return
                 
             elif event.type == pygame.MOUSEBUTTONDOWN:
@@ -810,7 +720,10 @@ def start_game(screen, quadrants_data):
                 
                 # Quitter bouton abandonner
                 if back_button.collidepoint(event.pos):
+                    # Arrêter la réflexion de l'IA pendant le message
+                    ai_driver.cancel()
                     choice = display_victory_message(screen, 0)
+                    renderer.invalidate()
                     if choice == "rejouer":
                         # Relancer le game_setup pour rejouer
                         from plateau.game_setup import show_game_setup
@@ -819,8 +732,9 @@ def start_game(screen, quadrants_data):
                         # Retourner au hub
                         return
                 
-                # clic sur le plateau (seulement si le jeu n'est pas terminé et aucune animation)
-                if not game_over and not animation.is_moving():
+                # clic sur le plateau (seulement si le jeu n'est pas terminé, aucune animation
+                # et pas pendant le tour de l'IA)
+                if not game_over and not animation.is_moving() and not (ai_opponent and current_player == 2):
                     mouse_x, mouse_y = event.pos
                     # Si le clic est dans les limites du plateau
                     if (board_x <= mouse_x < board_x + board_size and 
@@ -834,93 +748,15 @@ def start_game(screen, quadrants_data):
                         if current_game_mode == 2:  # Mode Isolation
                             # Limiter aux cases de jeu 8x8 dans la grille 10x10
                             if 1 <= row <= 8 and 1 <= col <= 8 and pawn_grid[row][col] == 0:  # Case vide
-                                # Fonction pour vérifier si on peut placer un pion
-                                # AVEC règles d'arrêt sur cases colorées (comme dans vos images)
-                                can_place = True
-                                
-                                # Vérifier si cette position est attaquée par un pion existant
-                                for pion_row in range(1, 9):
-                                    for pion_col in range(1, 9):
-                                        if pawn_grid[pion_row][pion_col] != 0:  # Il y a un pion ici
-                                            cell_color = board_grid[pion_row][pion_col]
-                                            
-                                            # Vérifier si ce pion peut attaquer la position cliquée
-                                            if cell_color == 3:  # Bleu = Roi (1 case dans toutes directions)
-                                                dr, dc = abs(row - pion_row), abs(col - pion_col)
-                                                if dr <= 1 and dc <= 1 and (dr > 0 or dc > 0):
-                                                    can_place = False
-                                                    break
-                                            
-                                            elif cell_color == 4:  # Rouge = Tour (ligne droite AVEC arrêt sur cases rouges)
-                                                if row == pion_row:  # Même ligne
-                                                    start_col = min(col, pion_col) + 1
-                                                    end_col = max(col, pion_col)
-                                                    path_clear = True
-                                                    stop_at_red = False
-                                                    for c in range(start_col, end_col):
-                                                        if pawn_grid[row][c] != 0:
-                                                            path_clear = False
-                                                            break
-                                                        # Arrêter si on rencontre une case rouge
-                                                        if board_grid[row][c] == 4:
-                                                            stop_at_red = True
-                                                            break
-                                                    if path_clear and not stop_at_red:
-                                                        can_place = False
-                                                        break
-                                                elif col == pion_col:  # Même colonne
-                                                    start_row = min(row, pion_row) + 1
-                                                    end_row = max(row, pion_row)
-                                                    path_clear = True
-                                                    stop_at_red = False
-                                                    for r in range(start_row, end_row):
-                                                        if pawn_grid[r][col] != 0:
-                                                            path_clear = False
-                                                            break
-                                                        # Arrêter si on rencontre une case rouge
-                                                        if board_grid[r][col] == 4:
-                                                            stop_at_red = True
-                                                            break
-                                                    if path_clear and not stop_at_red:
-                                                        can_place = False
-                                                        break
-                                            
-                                            elif cell_color == 1:  # Jaune = Fou (diagonale AVEC arrêt sur cases jaunes)
-                                                dr, dc = row - pion_row, col - pion_col
-                                                if abs(dr) == abs(dc) and dr != 0:  # Même diagonale
-                                                    step_r = 1 if dr > 0 else -1
-                                                    step_c = 1 if dc > 0 else -1
-                                                    
-                                                    temp_r, temp_c = pion_row + step_r, pion_col + step_c
-                                                    path_clear = True
-                                                    stop_at_yellow = False
-                                                    while temp_r != row and temp_c != col:
-                                                        if pawn_grid[temp_r][temp_c] != 0:
-                                                            path_clear = False
-                                                            break
-                                                        # Arrêter si on rencontre une case jaune
-                                                        if board_grid[temp_r][temp_c] == 1:
-                                                            stop_at_yellow = True
-                                                            break
-                                                        temp_r += step_r
-                                                        temp_c += step_c
-                                                    
-                                                    if path_clear and not stop_at_yellow:
-                                                        can_place = False
-                                                        break
-                                            
-                                            elif cell_color == 2:  # Vert = Cavalier (en L)
-                                                dr, dc = abs(row - pion_row), abs(col - pion_col)
-                                                if (dr == 2 and dc == 1) or (dr == 1 and dc == 2):
-                                                    can_place = False
-                                                    break
-                                    
-                                    if not can_place:
-                                        break
+                                # Case interdite si elle est attaquée par un pion existant
+                                # (règles d'arrêt sur cases colorées incluses dans la carte d'attaque)
+                                can_place = not attack_map.is_forbidden(row, col)
                                 
                                 # Si on peut placer le pion, le faire
                                 if can_place:
-                                    pawn_grid[row][col] = current_player
+                                    state.place(row, col, current_player)
+                                    attack_map.place(row, col)
+                                    pawn_grid = state.to_pawn_grid()
                                     # Jouer le son de placement
                                     audio_manager.play_sound('pawn_move')
                                     
@@ -941,16 +777,17 @@ def start_game(screen, quadrants_data):
                                     if (row, col) in possible_moves:
                                         # Gestion spéciale pour Katarenga et les camps
                                         if current_game_mode == 0:
-                                            from jeux.katarenga import get_camp_positions, place_in_camp, check_katarenga_victory
+                                            from jeux.katarenga import get_camp_positions
                                             camp_positions = get_camp_positions(current_player)
                                             
                                             if (row, col) in camp_positions:
                                                 # Placement direct dans un camp
-                                                if place_in_camp(row, col, pawn_grid, current_player):
-                                                    pawn_grid[selected_row][selected_col] = 0
+                                                if not state.is_camp_occupied(row, col):
+                                                    state.move_coords(selected_pawn, (row, col))
+                                                    pawn_grid = state.to_pawn_grid()
                                                     # Jouer le son de déplacement
                                                     audio_manager.play_sound('pawn_move')
-                                                    winner = check_katarenga_victory()
+                                                    winner = state.camps_winner()
                                                     game_over = winner > 0
                                                     if not game_over:
                                                         current_player = 3 - current_player
@@ -976,7 +813,7 @@ def start_game(screen, quadrants_data):
                                     elif pawn_grid[row][col] == current_player:
                                         # Sélectionner ce nouveau pion
                                         selected_pawn = (row, col)
-                                        possible_moves = get_valid_moves_with_mode(row, col, board_grid, pawn_grid, current_game_mode)
+                                        possible_moves = state.moves_from(row, col)
                                     
                                     # Si le clic est ailleurs, annuler la sélection
                                     else:
@@ -989,15 +826,18 @@ def start_game(screen, quadrants_data):
                                     if current_game_mode == 0:
                                         if 0 <= row < 10 and 0 <= col < 10 and pawn_grid[row][col] == current_player:
                                             selected_pawn = (row, col)
-                                            possible_moves = get_valid_moves_with_mode(row, col, board_grid, pawn_grid, current_game_mode)
+                                            possible_moves = state.moves_from(row, col)
                                     else:
                                         # Pour Congress, limiter à la zone 8x8
                                         if 1 <= row <= 8 and 1 <= col <= 8 and pawn_grid[row][col] == current_player:
                                             selected_pawn = (row, col)
-                                            possible_moves = get_valid_moves_with_mode(row, col, board_grid, pawn_grid, current_game_mode)
+                                            possible_moves = state.moves_from(row, col)
                 
-        pygame.display.flip()
-        clock.tick(60)  # 60 FPS pour des animations fluides
+        with profiler.section("dessin"):
+            render()
+        with profiler.section(WAIT_SECTION):
+            clock.tick(60)  # 60 FPS pour des animations fluides
+        profiler.end_frame()
 
 
 def display_victory_message(screen, winner):
@@ -1097,7 +937,7 @@ def display_victory_message(screen, winner):
     clock = pygame.time.Clock()
     
     while waiting:
-        for event in pygame.event.get():
+        for event in get_events():
             if event.type == pygame.QUIT:
                 return "quit"
                 
@@ -1117,33 +957,3 @@ def display_victory_message(screen, winner):
         
         clock.tick(60)
     
-
-def randomAi(pawn_grid, board_grid, current_player, game_mode):
-    """
-    IA simple qui choisit un mouvement aléatoire parmi les mouvements possibles.
-    Version mise à jour qui utilise maintenant pawn.py pour tout.
-    """
-    from plateau.pawn import get_valid_moves
-    possible_moves = []
-    
-    # Déterminer la taille de la grille selon le mode
-    if game_mode == 0:  # Katarenga
-        grid_range = range(10)
-    else:  # Congress et Isolation
-        grid_range = range(1, 9)
-    
-    # Trouver tous les pions du joueur actuel
-    for row in grid_range:
-        for col in grid_range:
-            if pawn_grid[row][col] == current_player:
-                moves = get_valid_moves(row, col, board_grid, pawn_grid, game_mode)
-                possible_moves.extend([(row, col, move) for move in moves])
-    
-    # Si aucun mouvement possible, retourner None
-    if not possible_moves:
-        return None
-    
-    # Choisir un mouvement aléatoire
-    chosen_move = random.choice(possible_moves)
-    
-    return chosen_move  # Retourne (from_row, from_col, (to_row, to_col))
\ No newline at end of file
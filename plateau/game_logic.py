@@ -0,0 +1,145 @@
+import random
+
+# Fonctions du jeu sans affichage : plateau, pions de départ et IA simples.
+# Elles sont utilisées par start_game comme par les parties sans pygame (headless).
+
+
+def create_game_board(quadrant_grid_data):
+    """
+    Crée un plateau de jeu à partir des données de grille des 4 quadrants
+    """
+    # Créer une grille 10x10 vide pour le plateau
+    board_grid = [[0 for _ in range(10)] for _ in range(10)]
+    
+    # Remplir la grille avec les données des quadrants
+    if len(quadrant_grid_data) == 4:
+        # Quadrant 1 (haut gauche)
+        for i in range(4):
+            for j in range(4):
+                board_grid[i + 1][j + 1] = quadrant_grid_data[0][i][j]
+
+        # Quadrant 2 (haut droite)
+        for i in range(4):
+            for j in range(4):
+                board_grid[i + 1][j + 5] = quadrant_grid_data[1][i][j]
+
+        # Quadrant 3 (bas gauche)
+        for i in range(4):
+            for j in range(4):
+                board_grid[i + 5][j + 1] = quadrant_grid_data[2][i][j]
+
+        # Quadrant 4 (bas droite)
+        for i in range(4):
+            for j in range(4):
+                board_grid[i + 5][j + 5] = quadrant_grid_data[3][i][j]
+    
+    return board_grid
+
+def rotate_quadrant(grid, rotation):
+    """
+    Grille 4x4 d'un quadrant tournée de rotation degrés (0, 90, 180, 270)
+    dans le sens horaire, comme dans la configuration de partie
+    """
+    rotated = [row.copy() for row in grid]
+    for _ in range(rotation // 90):
+        size = len(rotated)
+        rotated = [[rotated[size - 1 - i][j] for i in range(size)] for j in range(len(rotated[0]))]
+    return rotated
+
+def initialize_pawns_for_game_mode(game_mode):
+    """
+    Initialise les pions selon le mode de jeu sélectionné
+    """
+    # Créer une grille 10x10 vide pour les pions
+    pawn_grid = [[0 for _ in range(10)] for _ in range(10)]
+    
+    if game_mode == 0:  # Katarenga
+        # Pions rouges ligne 1 (joueur 1) - colonnes 1 à 8
+        for col in range(1, 9):
+            pawn_grid[1][col] = 1
+        # Pions bleus ligne 8 (joueur 2) - colonnes 1 à 8
+        for col in range(1, 9):
+            pawn_grid[8][col] = 2
+
+    elif game_mode == 1:  # Congress
+        # Positions des pions rouges (joueur 1) - ajustées pour la zone 8x8
+        red_positions = [
+            (1, 2), (1, 5), (2, 8), (4, 1), 
+            (5, 8), (7, 1), (8, 4), (8, 7)   
+        ]
+        
+        # Positions des pions bleus (joueur 2) - ajustées pour la zone 8x8
+        blue_positions = [
+            (1, 4), (1, 7), (2, 1), (4, 8), 
+            (5, 1), (7, 8), (8, 2), (8, 5) 
+        ]
+        
+        # Placer les pions rouges
+        for row, col in red_positions:
+            pawn_grid[row][col] = 1
+        
+        # Placer les pions bleus
+        for row, col in blue_positions:
+            pawn_grid[row][col] = 2
+    
+    elif game_mode == 2:  # Isolation
+        # Plateau vide au début pour le mode Isolation
+        pass
+    
+    return pawn_grid
+
+def isolation_ai(pawn_grid, board_grid, current_player, attack_map=None):
+    """
+    IA simple pour le mode Isolation qui choisit une position aléatoire valide
+    Ultra simple : évite les cases où il y a des croix
+    (cases sûres lues dans la carte d'attaque, reconstruite si absente)
+    """
+    if attack_map is None:
+        from jeux.attack_map import AttackMap
+        attack_map = AttackMap.from_grids(board_grid, pawn_grid)
+    
+    # Chercher toutes les positions valides (vides et pas interdites)
+    valid_positions = attack_map.safe_cells()
+    
+    # Si aucune position valide, retourner None
+    if not valid_positions:
+        return None
+    
+    # Choisir une position aléatoire
+    return random.choice(valid_positions)
+
+
+def randomAi(pawn_grid, board_grid, current_player, game_mode, camps_occupied=None):
+    """
+    IA simple qui choisit un mouvement aléatoire parmi les mouvements possibles.
+    Les tables de déplacement du plateau et les bitboards des pions sont
+    récupérés une seule fois par tour.
+    camps_occupied : bitboard des camps occupés (GameState.camps) ; sans lui,
+    les variables globales de jeux.katarenga sont lues.
+    """
+    from plateau.bitboard import iter_squares, pawn_occupancy
+    from plateau.layout_tables import get_layout_tables
+    tables = get_layout_tables(board_grid)
+    pawns = pawn_occupancy(pawn_grid)
+    own, enemy = pawns[current_player], pawns[3 - current_player]
+    if game_mode != 0:
+        camps_occupied = 0
+    elif camps_occupied is None:
+        from jeux.katarenga import occupied_camps_mask
+        camps_occupied = occupied_camps_mask(current_player)
+    possible_moves = []
+    
+    # Tous les pions du joueur actuel, dans l'ordre des cases (ligne puis colonne)
+    for sq in iter_squares(own):
+        row, col = divmod(sq, 10)
+        moves = tables.move_list(sq, current_player, own, enemy, game_mode, camps_occupied)
+        possible_moves.extend([(row, col, move) for move in moves])
+    
+    # Si aucun mouvement possible, retourner None
+    if not possible_moves:
+        return None
+    
+    # Choisir un mouvement aléatoire
+    chosen_move = random.choice(possible_moves)
+    
+    return chosen_move  # Retourne (from_row, from_col, (to_row, to_col))
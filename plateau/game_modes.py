@@ -3,12 +3,19 @@ import sys
 from pathlib import Path
 from assets.colors import Colors
 from assets.audio_manager import audio_manager  # ✅ NOUVEAU IMPORT AUDIO
+from assets.asset_cache import asset_cache
 
 # Variables globales pour garder le mode de jeu et l'adversaire
 GLOBAL_SELECTED_GAME = 0 
 GLOBAL_SELECTED_OPPONENT = 0
 FIRST_RUN = True
 
+# Niveau de l'IA (adversaire Ordi) : Facile = coups aléatoires,
+# Expert = recherche alpha-beta (Katarenga) et solveur exact (Isolation)
+# Par défaut Facile, comme avant l'ajout du niveau Expert
+AI_LEVELS = ["Facile", "Expert"]
+GLOBAL_AI_LEVEL = 0
+
 def reset_game_state():
     """BUG FIX 1: Fonction pour réinitialiser l'état du jeu"""
     global GLOBAL_SELECTED_GAME, GLOBAL_SELECTED_OPPONENT
@@ -19,7 +26,7 @@ def show_game_modes(screen):
     """
     Affiche la fenêtre de sélection des modes de jeu.
     """
-    global GLOBAL_SELECTED_GAME, GLOBAL_SELECTED_OPPONENT, FIRST_RUN
+    global GLOBAL_SELECTED_GAME, GLOBAL_SELECTED_OPPONENT, FIRST_RUN, GLOBAL_AI_LEVEL
     
     # BUG FIX 1: Réinitialiser les variables de jeu au retour
     reset_game_state()
@@ -29,7 +36,7 @@ def show_game_modes(screen):
     pygame.display.set_caption("Sélection du mode de jeu")
     #couleurs
     script_dir = Path(__file__).parent.parent.absolute()
-    background_image = pygame.image.load(script_dir / "assets" / "img" / "fond.png")
+    background_path = script_dir / "assets" / "img" / "fond.png"
     BLACK = Colors.BLACK
     GREEN = Colors.GREEN 
     BLUE = Colors.BLUE   
@@ -42,7 +49,7 @@ def show_game_modes(screen):
     
     # Options disponibles
     game_types = ["Katarenga", "Congress", "Isolation"]
-    opponent_types = ["Ordi", "Local", "Réseau"]
+    opponent_types = ["Ordi", "Local", "Réseau", "MCTS"]
     
     # BUG FIX 1: Utiliser des variables locales pour éviter les conflits
     selected_game = GLOBAL_SELECTED_GAME
@@ -56,6 +63,8 @@ def show_game_modes(screen):
     
     # Calcul de la largeur totale des boutons et espaces
     total_width = (button_width * 3) + (horizontal_spacing * 2)
+    # La ligne des adversaires compte un bouton de plus
+    opponent_total_width = (button_width * len(opponent_types)) + (horizontal_spacing * (len(opponent_types) - 1))
     
     # Calcul de la hauteur totale incluant tous les éléments
     play_button_height = 60
@@ -70,6 +79,7 @@ def show_game_modes(screen):
         title_height + spacing_between_sections +  # Titre de la section adversaire
         button_height + spacing_between_sections + # Boutons d'adversaire + espace
         selection_text_height + spacing_between_sections + # Texte de sélection
+        button_height + spacing_between_sections + # Bouton niveau de l'IA
         play_button_height                         # Boutons jouer/retour
     )
     
@@ -79,6 +89,7 @@ def show_game_modes(screen):
     
     # Position de départ pour centrer horizontalement les grilles de boutons
     start_x = (WIDTH - total_width) // 2
+    opponent_start_x = (WIDTH - opponent_total_width) // 2
     
     # Position pour les titres des sections (centrage)
     game_title_y = current_y
@@ -100,6 +111,10 @@ def show_game_modes(screen):
     selection_text_y = current_y
     current_y += selection_text_height + spacing_between_sections
     
+    # Position pour le bouton de niveau de l'IA (affiché seulement contre l'Ordi)
+    ai_level_y = current_y
+    current_y += button_height + spacing_between_sections
+    
     # Position pour les boutons Jouer et Retour
     button_row_y = current_y
     
@@ -113,8 +128,8 @@ def show_game_modes(screen):
     
     # Création des boutons d'adversaire (deuxième ligne)
     opponent_buttons = []
-    for col in range(3):
-        x = start_x + col * (button_width + horizontal_spacing)
+    for col in range(len(opponent_types)):
+        x = opponent_start_x + col * (button_width + horizontal_spacing)
         y = opponent_buttons_y
         rect = pygame.Rect(x, y, button_width, button_height)
         opponent_buttons.append(rect)
@@ -142,6 +157,15 @@ def show_game_modes(screen):
         back_button_height
     )
     
+    # Bouton de niveau de l'IA, centré
+    ai_level_button_width = 260
+    ai_level_button = pygame.Rect(
+        (WIDTH - ai_level_button_width) // 2,
+        ai_level_y,
+        ai_level_button_width,
+        button_height
+    )
+    
     def draw_centered_text(text, rect, color):
         text_surf = font.render(text, True, color)
         text_rect = text_surf.get_rect(center=rect.center)
@@ -154,7 +178,7 @@ def show_game_modes(screen):
     
     running = True
     while running:
-        background_scaled = pygame.transform.scale(background_image, screen.get_size())
+        background_scaled = asset_cache.scaled(background_path, screen.get_size())
         screen.blit(background_scaled, (0, 0))
         
         # Afficher les titres des sections
@@ -189,6 +213,11 @@ def show_game_modes(screen):
             pygame.draw.rect(screen, color, rect)
             draw_centered_text(opponent_types[i], rect, BLACK)
         
+        # Dessiner le bouton de niveau de l'IA si l'adversaire est l'ordinateur
+        if selected_opponent == 0:
+            pygame.draw.rect(screen, BLUE, ai_level_button)
+            draw_centered_text(f"Niveau IA: {AI_LEVELS[GLOBAL_AI_LEVEL]}", ai_level_button, BLACK)
+        
         # Dessiner le bouton Jouer
         pygame.draw.rect(screen, GREEN, play_button)
         draw_centered_text("Jouer", play_button, BLACK)
@@ -241,6 +270,11 @@ def show_game_modes(screen):
                         GLOBAL_SELECTED_OPPONENT = i  # BUG FIX 1: Mise à jour immédiate
                         FIRST_RUN = False
                 
+                # Changer le niveau de l'IA (seulement contre l'Ordi)
+                if selected_opponent == 0 and ai_level_button.collidepoint(event.pos):
+                    audio_manager.play_sound('button_click')
+                    GLOBAL_AI_LEVEL = (GLOBAL_AI_LEVEL + 1) % len(AI_LEVELS)
+                
                 # Vérifier si le bouton Jouer a été cliqué
                 if play_button.collidepoint(event.pos):
                     audio_manager.play_sound('button_click')  # ✅ NOUVEAU SON
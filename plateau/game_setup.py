@@ -1,10 +1,11 @@
 import pygame
-import json
 import sys
 from pathlib import Path
 from quadrant.quadrant_viewer import load_quadrants
+from quadrant.repository import quadrant_repository
 from assets.colors import Colors
 from assets.audio_manager import audio_manager  # ✅ NOUVEAU IMPORT AUDIO
+from assets.asset_cache import asset_cache
 
 def show_game_setup(screen):
     """
@@ -17,7 +18,7 @@ def show_game_setup(screen):
     
     # Couleurs
     script_dir = Path(__file__).parent.parent.absolute()
-    background_image = pygame.image.load(script_dir / "assets" / "img" / "fond.png")
+    background_path = script_dir / "assets" / "img" / "fond.png"
     WHITE = Colors.WHITE
     BLACK = Colors.BLACK    
     LIGHT_GRAY = Colors.LIGHT_GRAY
@@ -31,71 +32,15 @@ def show_game_setup(screen):
     button_font = pygame.font.Font(None, 30)
     instruction_font = pygame.font.Font(None, 16)
     
-    # Fonction pour faire tourner une grille dans le sens horaire
-    def rotate_grid(grid):
-        """Tourne une grille 4x4 de 90 degrés dans le sens horaire"""
-        rows = len(grid)
-        cols = len(grid[0])
-        rotated = [[0 for i in range(rows)] for j in range(cols)]
-        
-        for i in range(rows):
-            for j in range(cols):
-                rotated[j][rows - 1 - i] = grid[i][j]
-        
-        return rotated
-    
-    def apply_rotation_to_grid(grid, rotation):
-        """
-        Applique la rotation spécifiée (0, 90, 180, 270) à une grille
-        """
-        rotated_grid = [row.copy() for row in grid]  # Copie de la grille originale
-        # Nombre de rotations de 90° à appliquer
-        num_rotations = rotation // 90
-        for i in range(num_rotations):
-            rotated_grid = rotate_grid(rotated_grid)
-        return rotated_grid
-    
-    def prepare_rotated_grids(quadrants_data):
-        """
-        Prépare toutes les orientations possibles pour chaque quadrant et les stocke dans le JSON.
-        Si les orientations existent déjà, cette fonction ne fait rien.
-        """
-        need_save = False
-        script_dir = Path(__file__).parent.parent.absolute()
-        json_path = script_dir / "quadrant" / "quadrants.json"
-        
-        for quadrant_id, data in quadrants_data.items():
-            # Vérifier si les orientations sont déjà préparées
-            if "rotations" not in data:
-                # S'assurer que nous avons une grille originale
-                if "original_grid" not in data:
-                    data["original_grid"] = [row.copy() for row in data["grid"]]
-                
-                # Créer les rotations possibles
-                rotations = {}
-                for angle in [0, 90, 180, 270]:
-                    rotated_grid = apply_rotation_to_grid(data["original_grid"], angle)
-                    rotations[str(angle)] = rotated_grid
-                
-                # Stocker les rotations dans les données du quadrant
-                data["rotations"] = rotations
-                need_save = True
-        
-        # Sauvegarder les modifications si nécessaire
-        if need_save:
-            json_path.write_text(json.dumps(quadrants_data, indent=4))
-                
+    # Grilles et rotations déjà préparées par le dépôt des quadrants
     quadrants = load_quadrants()
     
-    # Ajout des orientations pour chaque quadrant
-    prepare_rotated_grids(quadrants)
-    
     # Charger les images des quadrants
     quadrant_images = {}
     for quadrant_id, data in quadrants.items():
         image_path = data.get("image_path")
         if image_path and Path(image_path).exists():
-            img = pygame.image.load(image_path)
+            img = asset_cache.image(image_path)
             quadrant_images[quadrant_id] = img
     
     # Calculer les dimensions pour le centrage de la zone du plateau et de la bibliothèque
@@ -238,14 +183,7 @@ def show_game_setup(screen):
     def get_quadrant_grid(quadrant_id, rotation):
         """Obtient la grille du quadrant avec la rotation spécifiée"""
         base_id = quadrant_id.split("_rot")[0]
-        
-        if base_id in quadrants:
-            if "rotations" in quadrants[base_id] and str(rotation) in quadrants[base_id]["rotations"]:
-                return quadrants[base_id]["rotations"][str(rotation)]
-            else:
-                return apply_rotation_to_grid(quadrants[base_id].get("grid", []), rotation)
-        
-        return []
+        return quadrant_repository.grid(base_id, rotation)
     
     def start_game_with_quadrants(selected_quadrants, rotations):
         """Démarre le jeu avec les quadrants sélectionnés et leurs rotations"""
@@ -293,7 +231,7 @@ def show_game_setup(screen):
     running = True
     
     while running:
-        background_scaled = pygame.transform.scale(background_image, screen.get_size())
+        background_scaled = asset_cache.scaled(background_path, screen.get_size())
         screen.blit(background_scaled, (0, 0))
         
         # Titre centré
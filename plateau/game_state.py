@@ -0,0 +1,239 @@
+from plateau.bitboard import (
+    GRID_SIZE, PLAYABLE_MASK, CAMP_MASKS, iter_squares, popcount, pawn_occupancy, square
+)
+from plateau.layout_tables import get_layout_tables
+from plateau.zobrist import SIDE_KEY, compute_hash, hash_move, hash_placement
+from jeux.katarenga import minimum_pawn_winner
+
+ALL_CAMPS_MASK = CAMP_MASKS[1] | CAMP_MASKS[2]
+
+
+def is_placement(move):
+    """En Isolation un coup est un placement : départ et arrivée identiques"""
+    return move[0] == move[1]
+
+
+def connected(bits):
+    """Vérifie par remplissage (orthogonal) que tous les pions d'un bitboard se touchent"""
+    if not bits:
+        return False
+    region = bits & -bits
+    while True:
+        grown = (region | region << 1 | region >> 1
+                 | region << GRID_SIZE | region >> GRID_SIZE) & bits
+        if grown == region:
+            return region == bits
+        region = grown
+
+
+class GameState:
+    """
+    État compact d'une partie : deux bitboards de pions, camps occupés,
+    joueur au trait et mode de jeu. Le plateau (couleurs) ne change pas :
+    il est partagé via les tables de déplacement.
+    make_move/unmake_move modifient l'état en O(1) grâce à une pile d'annulation,
+    sans copier de grille.
+    """
+    __slots__ = ("tables", "mode", "pawns", "camps", "side", "key", "undo_stack")
+
+    def __init__(self, tables, mode, pawns, camps=0, side=1):
+        self.tables = tables
+        self.mode = mode
+        self.pawns = list(pawns)
+        self.camps = camps
+        self.side = side
+        self.key = compute_hash(self.pawns, camps, side, mode)
+        self.undo_stack = []
+
+    @classmethod
+    def from_grids(cls, board_grid, pawn_grid, mode, side=1, camps=0):
+        """Construit l'état à partir des grilles 10x10 du jeu"""
+        return cls(get_layout_tables(board_grid), mode, pawn_occupancy(pawn_grid), camps, side)
+
+    def copy(self):
+        """Copie indépendante (sans l'historique d'annulation)"""
+        return GameState(self.tables, self.mode, self.pawns, self.camps, self.side)
+
+    # --- Coups ---------------------------------------------------------
+
+    def owner(self, sq):
+        """Joueur possédant le pion de la case (0 si vide)"""
+        if self.pawns[1] >> sq & 1:
+            return 1
+        if self.pawns[2] >> sq & 1:
+            return 2
+        return 0
+
+    def make_move(self, move, player=None):
+        """
+        Joue un coup (départ, arrivée) en O(1).
+        Le joueur est celui du pion déplacé ; pour un placement, le joueur au trait.
+        """
+        from_sq, to_sq = move
+        pawns = self.pawns
+        if player is None:
+            player = self.side if from_sq == to_sq else self.owner(from_sq)
+        enemy = 3 - player
+        to_bit = 1 << to_sq
+        captured = bool(pawns[enemy] & to_bit)
+        self.undo_stack.append((move, player, captured, self.side, self.key))
+
+        if from_sq == to_sq:
+            pawns[player] |= to_bit
+            self.key = hash_placement(self.key, player, to_sq)
+        else:
+            self.key = hash_move(self.key, player, from_sq, to_sq, pawns[enemy])
+            if to_bit & ALL_CAMPS_MASK:
+                # Entrée dans un camp : le pion quitte le plateau
+                pawns[player] ^= 1 << from_sq
+                self.camps |= to_bit
+            else:
+                pawns[player] ^= (1 << from_sq) | to_bit
+                if captured:
+                    pawns[enemy] ^= to_bit
+        # Le hash suppose une alternance : si le joueur n'était pas au trait, le trait ne change pas
+        if self.side != player:
+            self.key ^= SIDE_KEY
+        self.side = enemy
+        return captured
+
+    def unmake_move(self):
+        """Annule le dernier coup joué"""
+        move, player, captured, side, key = self.undo_stack.pop()
+        from_sq, to_sq = move
+        pawns = self.pawns
+        to_bit = 1 << to_sq
+        if from_sq == to_sq:
+            pawns[player] ^= to_bit
+        elif to_bit & ALL_CAMPS_MASK:
+            pawns[player] |= 1 << from_sq
+            self.camps ^= to_bit
+        else:
+            pawns[player] ^= (1 << from_sq) | to_bit
+            if captured:
+                pawns[3 - player] |= to_bit
+        self.side = side
+        self.key = key
+
+    def history_keys(self):
+        """Clés Zobrist des positions précédant chaque coup joué (répétitions)"""
+        return [entry[4] for entry in self.undo_stack]
+
+    def move_coords(self, from_pos, to_pos):
+        """Joue un déplacement donné en coordonnées (ligne, colonne)"""
+        return self.make_move((square(*from_pos), square(*to_pos)))
+
+    def place(self, row, col, player=None):
+        """Joue un placement Isolation donné en coordonnées"""
+        sq = square(row, col)
+        return self.make_move((sq, sq), player)
+
+    # --- Génération ----------------------------------------------------
+
+    def occupied(self):
+        return self.pawns[1] | self.pawns[2]
+
+    def forbidden_cells(self):
+        """Cases attaquées par au moins un pion (Isolation)"""
+        occupied = self.occupied()
+        attacks = self.tables.attacks
+        forbidden = 0
+        for sq in iter_squares(occupied):
+            forbidden |= attacks(sq, occupied)
+        return forbidden
+
+    def safe_cells(self):
+        """Cases libres et non attaquées de la zone 8x8 (Isolation)"""
+        return PLAYABLE_MASK & ~self.occupied() & ~self.forbidden_cells()
+
+    def move_mask(self, sq):
+        """Masque des coups du pion de la case sq"""
+        player = self.owner(sq)
+        if not player:
+            return 0
+        return self.tables.move_mask(sq, player, self.pawns[player], self.pawns[3 - player],
+                                     self.mode, self.camps)
+
+    def moves_from(self, row, col):
+        """Coups du pion en (row, col) en coordonnées, dans l'ordre de get_valid_moves"""
+        sq = square(row, col)
+        player = self.owner(sq)
+        if not player:
+            return []
+        return self.tables.move_list(sq, player, self.pawns[player], self.pawns[3 - player],
+                                     self.mode, self.camps)
+
+    def legal_moves(self, player=None):
+        """Liste des coups (départ, arrivée) du joueur (par défaut celui au trait)"""
+        if player is None:
+            player = self.side
+        if self.mode == 2:
+            return [(sq, sq) for sq in iter_squares(self.safe_cells())]
+        own = self.pawns[player]
+        enemy = self.pawns[3 - player]
+        move_mask = self.tables.move_mask
+        moves = []
+        for sq in iter_squares(own):
+            for target in iter_squares(move_mask(sq, player, own, enemy, self.mode, self.camps)):
+                moves.append((sq, target))
+        return moves
+
+    # --- Camps Katarenga -------------------------------------------------
+
+    def is_camp_occupied(self, row, col):
+        """Remplace jeux.katarenga.is_camp_occupied pour la partie en cours"""
+        return bool(self.camps >> square(row, col) & 1)
+
+    def has_pion_in_camp(self, player):
+        return bool(self.camps & CAMP_MASKS[player])
+
+    def camps_winner(self):
+        """Joueur occupant ses deux camps (0 sinon)"""
+        for player in (1, 2):
+            if self.camps & CAMP_MASKS[player] == CAMP_MASKS[player]:
+                return player
+        return 0
+
+    def minimum_pawn_winner(self):
+        """Règle du nombre minimum de pions (Katarenga)"""
+        if self.mode != 0:
+            return 0
+        return minimum_pawn_winner(popcount(self.pawns[1]), popcount(self.pawns[2]),
+                                   self.has_pion_in_camp(1), self.has_pion_in_camp(2))
+
+    # --- Fin de partie -------------------------------------------------
+
+    def pawn_count(self, player):
+        return popcount(self.pawns[player])
+
+    def winner(self):
+        """
+        Retourne (partie_terminée, gagnant) pour la position courante.
+        gagnant vaut 0 en cas d'égalité.
+        """
+        if self.mode == 0:
+            winner = self.camps_winner() or self.minimum_pawn_winner()
+            return winner > 0, winner
+        if self.mode == 1:
+            for player in (1, 2):
+                if connected(self.pawns[player]):
+                    return True, player
+            return False, 0
+        # Isolation : plus aucune case sûre, victoire au nombre de pions
+        # (comme check_isolation_complete_victory, qui termine la partie dans start_game)
+        if self.safe_cells():
+            return False, 0
+        red, blue = self.pawn_count(1), self.pawn_count(2)
+        if red == blue:
+            return True, 0
+        return True, 1 if red > blue else 2
+
+    # --- Conversion ----------------------------------------------------
+
+    def to_pawn_grid(self):
+        """Grille 10x10 des pions (pour l'affichage et le code existant)"""
+        grid = [[0] * GRID_SIZE for _ in range(GRID_SIZE)]
+        for player in (1, 2):
+            for sq in iter_squares(self.pawns[player]):
+                grid[sq // GRID_SIZE][sq % GRID_SIZE] = player
+        return grid
@@ -0,0 +1,202 @@
+from functools import lru_cache
+from itertools import chain
+import hashlib
+from plateau.bitboard import (
+    GRID_SIZE, YELLOW, GREEN, BLUE, RED,
+    KING_MASKS, KNIGHT_MASKS, ROOK_RAYS, BISHOP_RAYS, CAMP_MASKS, ENEMY_BASELINE_ROW,
+    iter_squares, iter_squares_desc, ray_reach, square
+)
+
+# Motif de déplacement associé à chaque couleur de case
+KING = "king"
+KNIGHT = "knight"
+ROOK = "rook"
+BISHOP = "bishop"
+PATTERNS = {BLUE: KING, GREEN: KNIGHT, RED: ROOK, YELLOW: BISHOP}
+
+# Nombre de plateaux gardés en mémoire
+LAYOUT_CACHE_SIZE = 32
+
+
+def layout_key(board_grid):
+    """Clé hachable du plateau (sert de clé au cache LRU)"""
+    return tuple(map(tuple, board_grid))
+
+
+def layout_fingerprint(board_grid):
+    """Empreinte compacte (100 octets) des couleurs du plateau"""
+    return bytes(chain.from_iterable(board_grid))
+
+
+def layout_hash(board_grid):
+    """Hash stable d'un plateau (identique d'une exécution à l'autre)"""
+    return hashlib.sha1(layout_fingerprint(board_grid)).hexdigest()[:16]
+
+
+class LayoutTables:
+    """
+    Tables de déplacement précalculées pour une disposition de plateau.
+    La couleur des cases ne change plus une fois les quadrants assemblés :
+    le motif de chaque case et les rayons tronqués à la case de même couleur
+    sont calculés une seule fois. La génération de coups ne consulte ensuite
+    que l'occupation des pions.
+    """
+
+    def __init__(self, key):
+        fingerprint = layout_fingerprint(key)
+        # Plateau d'origine (tuple de tuples, utilisable comme board_grid)
+        self.key = key
+        self.fingerprint = fingerprint
+        self.colours = [0, 0, 0, 0, 0]
+        for sq, value in enumerate(fingerprint):
+            if 0 < value <= 4:
+                self.colours[value] |= 1 << sq
+
+        size = GRID_SIZE * GRID_SIZE
+        # Motif de la case (None si pas de couleur)
+        self.patterns = [None] * size
+        # Cibles d'un saut pour le roi et le cavalier
+        self.step_targets = [0] * size
+        # Rayons (masque, croissant) déjà tronqués à la case d'arrêt de couleur
+        self.rays = [()] * size
+        # Mêmes données sous forme de coordonnées, pour travailler sur pawn_grid
+        self.step_cells = [()] * size
+        self.ray_cells = [()] * size
+        # Et sous forme de paires (bit, coordonnées), pour move_list
+        self.step_bits = [()] * size
+        self.ray_bits = [()] * size
+
+        for sq in range(size):
+            pattern = PATTERNS.get(fingerprint[sq])
+            self.patterns[sq] = pattern
+            if pattern == KING:
+                self.step_targets[sq] = KING_MASKS[sq]
+            elif pattern == KNIGHT:
+                self.step_targets[sq] = KNIGHT_MASKS[sq]
+            elif pattern in (ROOK, BISHOP):
+                colour = self.colours[fingerprint[sq]]
+                directions = ROOK_RAYS if pattern == ROOK else BISHOP_RAYS
+                self.rays[sq] = tuple(
+                    (ray_reach(per_square[sq], ascending, colour), ascending)
+                    for per_square, ascending in directions
+                )
+            self.step_cells[sq] = tuple(divmod(target, GRID_SIZE) for target in iter_squares(self.step_targets[sq]))
+            self.ray_cells[sq] = tuple(
+                tuple(divmod(target, GRID_SIZE)
+                      for target in (iter_squares(ray) if ascending else iter_squares_desc(ray)))
+                for ray, ascending in self.rays[sq]
+            )
+            self.step_bits[sq] = tuple((1 << square(*cell), cell) for cell in self.step_cells[sq])
+            self.ray_bits[sq] = tuple(tuple((1 << square(*cell), cell) for cell in ray)
+                                      for ray in self.ray_cells[sq])
+
+    def attacks(self, sq, occupied):
+        """
+        Cases atteintes par le motif de la case sq, case occupée bloquante incluse.
+        Sert aussi de zone d'attaque en Isolation.
+        """
+        targets = self.step_targets[sq]
+        for ray, ascending in self.rays[sq]:
+            targets |= ray_reach(ray, ascending, occupied)
+        return targets
+
+    def move_mask(self, sq, player, own, enemy, game_mode, camps_occupied=0):
+        """
+        Masque des coups du pion du joueur situé sur sq.
+        own/enemy : bitboards des pions, camps_occupied : camps déjà occupés (Katarenga).
+        """
+        if game_mode == 2:
+            return 0
+        targets = self.attacks(sq, own | enemy) & ~own
+        if game_mode != 0:
+            return targets & ~enemy
+        return targets | camp_targets(sq, player, camps_occupied)
+
+    def move_list(self, sq, player, own, enemy, game_mode, camps_occupied=0):
+        """
+        Liste ordonnée des coups [(ligne, colonne), ...] du pion situé sur sq.
+        Même ordre que l'implémentation par listes : direction par direction,
+        du plus proche au plus lointain, puis les camps.
+        """
+        if game_mode == 2:
+            return []
+        capture = game_mode == 0
+        forbidden = own if capture else own | enemy
+        # Les décalages du roi et du cavalier sont déjà triés par index croissant
+        moves = [cell for bit, cell in self.step_bits[sq] if not bit & forbidden]
+
+        occupied = own | enemy
+        for ray in self.ray_bits[sq]:
+            for bit, cell in ray:
+                if bit & occupied:
+                    # Case occupée : capture possible en Katarenga, puis arrêt
+                    if capture and bit & enemy:
+                        moves.append(cell)
+                    break
+                moves.append(cell)
+
+        if capture:
+            for target in iter_squares(camp_targets(sq, player, camps_occupied)):
+                moves.append(divmod(target, GRID_SIZE))
+        return moves
+
+    def grid_move_list(self, row, col, pawn_grid, game_mode, camps_occupied=0):
+        """
+        Même résultat que move_list mais en lisant directement pawn_grid :
+        seules les cases candidates de la case (row, col) sont consultées.
+        Pour un seul pion, c'est moins cher que de convertir toute la grille
+        en bitboards (pawn_occupancy).
+        """
+        player = pawn_grid[row][col]
+        if game_mode == 2 or player == 0:
+            return []
+        capture = game_mode == 0
+        sq = row * GRID_SIZE + col
+        moves = []
+
+        if capture:
+            # Case vide ou pion adverse
+            for r, c in self.step_cells[sq]:
+                if pawn_grid[r][c] != player:
+                    moves.append((r, c))
+        else:
+            for r, c in self.step_cells[sq]:
+                if pawn_grid[r][c] == 0:
+                    moves.append((r, c))
+
+        for ray in self.ray_cells[sq]:
+            for r, c in ray:
+                value = pawn_grid[r][c]
+                if value == 0:
+                    moves.append((r, c))
+                    continue
+                # Case occupée : capture possible en Katarenga, puis arrêt
+                if capture and value != player:
+                    moves.append((r, c))
+                break
+
+        if capture:
+            for target in iter_squares(camp_targets(sq, player, camps_occupied)):
+                moves.append(divmod(target, GRID_SIZE))
+        return moves
+
+
+def camp_targets(sq, player, camps_occupied):
+    """Camps libres accessibles depuis la ligne de base ennemie (Katarenga)"""
+    if sq // GRID_SIZE != ENEMY_BASELINE_ROW.get(player, 1):
+        return 0
+    return CAMP_MASKS[player] & ~camps_occupied
+
+
+@lru_cache(maxsize=LAYOUT_CACHE_SIZE)
+def _tables_for_key(key):
+    return LayoutTables(key)
+
+
+def get_layout_tables(board_grid):
+    """
+    Retourne les tables du plateau (construites une seule fois par disposition).
+    Chaque appel convertit et hache la grille : les appelants fréquents
+    récupèrent les tables une fois par tour (ou les gardent, comme GameState).
+    """
+    return _tables_for_key(layout_key(board_grid))
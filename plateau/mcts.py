@@ -0,0 +1,371 @@
+import math
+import random
+import time
+from plateau.bitboard import GRID_SIZE, CAMP_MASKS, iter_squares, popcount
+from plateau.game_state import ALL_CAMPS_MASK, GameState, connected
+from plateau.search import evaluate_pawns
+from jeux.katarenga import minimum_pawn_winner
+
+# Constante d'exploration UCT (racine de 2 par défaut)
+DEFAULT_EXPLORATION = math.sqrt(2)
+# Budget par coup : en millisecondes, ou en nombre d'itérations si précisé
+DEFAULT_TIME_MS = 500
+# Simulations courtes : après ce nombre de coups au hasard, la partie est
+# départagée par une évaluation peu coûteuse (Katarenga : evaluate_pawns de la
+# recherche alpha-beta ; Congress : taille du plus grand bloc). Une fin de
+# partie au hasard demande plus de cent coups et n'apprend guère plus.
+# Isolation se joue toujours jusqu'au bout (au plus 64 placements).
+KATARENGA_PLAYOUT_PLIES = 8
+CONGRESS_PLAYOUT_PLIES = 8
+# Limite de la réflexion pendant le tour de l'adversaire (taille de l'arbre)
+MAX_PONDER_ITERATIONS = 200000
+
+
+class MCTSNode:
+    """Nœud de l'arbre : coup qui y mène, statistiques du joueur qui l'a joué"""
+    __slots__ = ("move", "parent", "children", "untried", "player", "key", "visits", "wins")
+
+    def __init__(self, move, parent, player, key, untried):
+        self.move = move
+        self.parent = parent
+        self.children = []
+        self.untried = untried
+        # Joueur qui a joué move (les gains sont comptés de son point de vue)
+        self.player = player
+        self.key = key
+        self.visits = 0
+        self.wins = 0.0
+
+    def select_child(self, exploration):
+        """Enfant maximisant la borne UCT"""
+        log_visits = math.log(self.visits)
+        best, best_value = None, -1.0
+        for child in self.children:
+            value = child.wins / child.visits + exploration * math.sqrt(log_visits / child.visits)
+            if value > best_value:
+                best, best_value = child, value
+        return best
+
+
+def terminal_winner(state, mover):
+    """
+    Fin de partie après un coup de mover : (terminée, gagnant), gagnant 0 si égalité.
+    Seules les conditions que le coup peut changer sont testées.
+    """
+    mode = state.mode
+    pawns = state.pawns
+    if mode == 0:
+        camps = state.camps
+        if camps & CAMP_MASKS[mover] == CAMP_MASKS[mover]:
+            return True, mover
+        winner = minimum_pawn_winner(popcount(pawns[1]), popcount(pawns[2]),
+                                     bool(camps & CAMP_MASKS[1]), bool(camps & CAMP_MASKS[2]))
+        return winner > 0, winner
+    if mode == 1:
+        # Pas de capture : seul le bloc du joueur qui vient de jouer peut se former
+        if connected(pawns[mover]):
+            return True, mover
+        return False, 0
+    return state.winner()
+
+
+def largest_block(bits):
+    """Taille du plus grand bloc (orthogonal) d'un bitboard de pions"""
+    largest = 0
+    while bits:
+        region = bits & -bits
+        while True:
+            grown = (region | region << 1 | region >> 1
+                     | region << GRID_SIZE | region >> GRID_SIZE) & bits
+            if grown == region:
+                break
+            region = grown
+        largest = max(largest, popcount(region))
+        bits ^= region
+    return largest
+
+
+def adjudicate(mode, pawns, camps):
+    """Gagnant d'une simulation interrompue (0 si les deux joueurs sont à égalité)"""
+    if mode == 0:
+        score = evaluate_pawns(pawns, camps, 1)
+    else:
+        score = largest_block(pawns[1]) - largest_block(pawns[2])
+    if score == 0:
+        return 0
+    return 1 if score > 0 else 2
+
+
+def random_square(mask, randrange):
+    """Index d'un bit à 1 de mask tiré au hasard"""
+    for _ in range(randrange(popcount(mask))):
+        mask &= mask - 1
+    return (mask & -mask).bit_length() - 1
+
+
+def isolation_playout(state, rng):
+    """
+    Isolation jusqu'à la fin : une case sûre n'est sur aucun rayon et les
+    cases sûres ne font que diminuer. Parcourir une seule fois les cases sûres
+    de départ dans un ordre mélangé revient à tirer à chaque placement une case
+    au hasard parmi celles encore sûres.
+    """
+    pawns = state.pawns
+    side = state.side
+    occupied = pawns[1] | pawns[2]
+    safe = state.safe_cells()
+    attacks = state.tables.attacks
+    counts = [0, popcount(pawns[1]), popcount(pawns[2])]
+    order = list(iter_squares(safe))
+    rng.shuffle(order)
+    for sq in order:
+        bit = 1 << sq
+        if safe & bit:
+            occupied |= bit
+            safe &= ~bit & ~attacks(sq, occupied)
+            counts[side] += 1
+            side = 3 - side
+    if counts[1] == counts[2]:
+        return 0
+    return 1 if counts[1] > counts[2] else 2
+
+
+def playout(state, rng, max_plies=None):
+    """
+    Simulation aléatoire sur des bitboards bruts, sans pile d'annulation ni hash :
+    à chaque coup, un pion au hasard puis une arrivée au hasard dans son
+    masque de coups. Au-delà de max_plies coups, la partie est départagée
+    par adjudicate. Retourne le gagnant (1 ou 2) ou 0 pour une nulle.
+    """
+    mode = state.mode
+    if mode == 2:
+        return isolation_playout(state, rng)
+
+    if max_plies is None:
+        max_plies = CONGRESS_PLAYOUT_PLIES if mode == 1 else KATARENGA_PLAYOUT_PLIES
+    pawns = list(state.pawns)
+    camps = state.camps
+    side = state.side
+    # Cases des pions de chaque joueur, tenues à jour coup par coup
+    squares = [None, list(iter_squares(pawns[1])), list(iter_squares(pawns[2]))]
+    move_mask = state.tables.move_mask
+    randrange = rng.randrange
+    for _ in range(max_plies):
+        own = pawns[side]
+        enemy = 3 - side
+        mine = squares[side]
+        # Pions essayés à partir d'un indice aléatoire (moins coûteux qu'un mélange)
+        count = len(mine)
+        start = randrange(count) if count else 0
+        for index in range(count):
+            slot = (start + index) % count
+            from_sq = mine[slot]
+            targets = move_mask(from_sq, side, own, pawns[enemy], mode, camps)
+            if targets:
+                break
+        else:
+            # Joueur bloqué : il perd
+            return enemy
+        to_sq = random_square(targets, randrange)
+        to_bit = 1 << to_sq
+        if mode == 0 and to_bit & ALL_CAMPS_MASK:
+            # Entrée dans un camp : le pion quitte le plateau
+            pawns[side] = own ^ (1 << from_sq)
+            mine[slot] = mine[-1]
+            mine.pop()
+            camps |= to_bit
+            if camps & CAMP_MASKS[side] == CAMP_MASKS[side]:
+                return side
+            winner = minimum_pawn_winner(popcount(pawns[1]), popcount(pawns[2]),
+                                         bool(camps & CAMP_MASKS[1]), bool(camps & CAMP_MASKS[2]))
+            if winner:
+                return winner
+        else:
+            pawns[side] = own ^ (1 << from_sq) ^ to_bit
+            mine[slot] = to_sq
+            if pawns[enemy] & to_bit:
+                # Capture : seule la règle du minimum de pions peut changer
+                pawns[enemy] ^= to_bit
+                squares[enemy].remove(to_sq)
+                winner = minimum_pawn_winner(popcount(pawns[1]), popcount(pawns[2]),
+                                             bool(camps & CAMP_MASKS[1]), bool(camps & CAMP_MASKS[2]))
+                if winner:
+                    return winner
+            elif mode == 1 and connected(pawns[side]):
+                return side
+        side = enemy
+    return adjudicate(mode, pawns, camps)
+
+
+class MCTSPlayer:
+    """
+    Recherche Monte-Carlo (UCT) pour les trois modes, à partir d'un GameState.
+    Aucune évaluation : les positions sont estimées par des simulations aléatoires.
+    L'arbre du coup précédent est réutilisé quand la position actuelle y figure.
+    """
+
+    def __init__(self, exploration=DEFAULT_EXPLORATION, time_ms=DEFAULT_TIME_MS, iterations=None, seed=None):
+        self.exploration = exploration
+        self.time_ms = time_ms
+        self.iterations = iterations
+        self.rng = random.Random(seed)
+        self.root = None
+        self.last_iterations = 0
+        self.reused_visits = 0
+
+    def _new_node(self, move, parent, player, state):
+        over, _ = terminal_winner(state, player) if move is not None else state.winner()
+        untried = [] if over else state.legal_moves()
+        self.rng.shuffle(untried)
+        return MCTSNode(move, parent, player, state.key, untried)
+
+    def _reuse_root(self, state):
+        """Cherche la position actuelle parmi les enfants et petits-enfants de l'ancienne racine"""
+        root = self.root
+        if root is None:
+            return None
+        if root.key == state.key:
+            return root
+        for child in root.children:
+            if child.key == state.key:
+                return child
+            for grandchild in child.children:
+                if grandchild.key == state.key:
+                    return grandchild
+        return None
+
+    def iterate(self, root, state):
+        """Une itération : sélection, expansion, simulation, rétropropagation"""
+        node = root
+        played = 0
+        # Sélection
+        while not node.untried and node.children:
+            node = node.select_child(self.exploration)
+            state.make_move(node.move, node.player)
+            played += 1
+        # Expansion
+        if node.untried:
+            move = node.untried.pop()
+            player = state.side
+            state.make_move(move, player)
+            played += 1
+            child = self._new_node(move, node, player, state)
+            node.children.append(child)
+            node = child
+        # Simulation
+        if node.move is not None:
+            over, winner = terminal_winner(state, node.player)
+        else:
+            over, winner = state.winner()
+        if not over:
+            winner = playout(state, self.rng)
+        for _ in range(played):
+            state.unmake_move()
+        # Rétropropagation
+        while node is not None:
+            node.visits += 1
+            if winner == 0:
+                node.wins += 0.5
+            elif winner == node.player:
+                node.wins += 1
+            node = node.parent
+
+    def _set_root(self, state):
+        """Racine de l'arbre pour state (réutilisée si possible)"""
+        root = self._reuse_root(state)
+        if root is None:
+            root = self._new_node(None, None, 3 - state.side, state)
+        root.parent = None
+        self.root = root
+        return root
+
+    def choose_move(self, state, stop=None):
+        """
+        Meilleur coup (case_départ, case_arrivée) pour le joueur au trait,
+        ou None s'il n'a aucun coup. state n'est pas modifié.
+        stop : threading.Event optionnel qui interrompt la recherche.
+        """
+        state = state.copy()
+        root = self._set_root(state)
+        self.reused_visits = root.visits
+        if not root.untried and not root.children:
+            return None
+
+        count = 0
+        deadline = None if self.iterations is not None else time.perf_counter() + self.time_ms / 1000
+        while True:
+            self.iterate(root, state)
+            count += 1
+            if deadline is None:
+                if count >= self.iterations:
+                    break
+            elif time.perf_counter() >= deadline:
+                break
+            if stop is not None and stop.is_set():
+                break
+        self.last_iterations = count
+        # Coup le plus visité (plus robuste que le meilleur taux)
+        best = max(root.children, key=lambda child: child.visits)
+        return best.move
+
+    def ponder(self, state, stop, max_iterations=MAX_PONDER_ITERATIONS):
+        """
+        Fait grandir l'arbre pendant que l'adversaire réfléchit, jusqu'à stop.
+        Les réponses les plus probables sont les plus explorées ; le coup suivant
+        reprend l'arbre à partir de la réponse réellement jouée.
+        """
+        state = state.copy()
+        root = self._set_root(state)
+        if not root.untried and not root.children:
+            return
+        for _ in range(max_iterations):
+            if stop.is_set():
+                break
+            self.iterate(root, state)
+
+
+def mcts_ai(player, state, stop=None):
+    """
+    Coup de l'IA MCTS au format du jeu : (from_row, from_col, (to_row, to_col))
+    pour Katarenga/Congress, (row, col) pour un placement Isolation, ou None.
+    """
+    move = player.choose_move(state, stop)
+    if move is None:
+        return None
+    from_row, from_col = divmod(move[0], GRID_SIZE)
+    if state.mode == 2:
+        return from_row, from_col
+    return from_row, from_col, divmod(move[1], GRID_SIZE)
+
+
+def benchmark(seconds=2.0, seed=4):
+    """Simulations et coups simulés par seconde pour chaque mode, sur un plateau de quadrants.json"""
+    import json
+    from pathlib import Path
+    from plateau.game_logic import create_game_board, initialize_pawns_for_game_mode
+
+    quadrants_file = Path(__file__).parent.parent / "quadrant" / "quadrants.json"
+    with open(quadrants_file, "r", encoding="utf-8") as f:
+        grids = [quadrant["grid"] for quadrant in json.load(f).values()]
+    rng = random.Random(seed)
+    board_grid = create_game_board([rng.choice(grids) for _ in range(4)])
+    results = {}
+    for mode in (0, 1, 2):
+        state = GameState.from_grids(board_grid, initialize_pawns_for_game_mode(mode), mode)
+        count = 0
+        start = time.perf_counter()
+        while time.perf_counter() - start < seconds:
+            playout(state, rng)
+            count += 1
+        playouts_rate = count / (time.perf_counter() - start)
+
+        player = MCTSPlayer(time_ms=seconds * 1000, seed=seed)
+        player.choose_move(state)
+        results[mode] = (playouts_rate, player.last_iterations / seconds)
+    return results
+
+
+if __name__ == "__main__":
+    names = ["Katarenga", "Congress", "Isolation"]
+    for mode, (playouts_rate, iterations_rate) in benchmark().items():
+        print(f"{names[mode]:10} : {playouts_rate:8.0f} simulations/s, {iterations_rate:8.0f} itérations MCTS/s")
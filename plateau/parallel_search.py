@@ -0,0 +1,314 @@
+import atexit
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, wait
+from plateau.bitboard import GRID_SIZE
+from plateau.layout_tables import get_layout_tables
+from plateau.search import DEFAULT_TIME_BUDGET, MAX_DEPTH, WIN_SCORE
+from plateau.mcts import DEFAULT_TIME_MS
+
+# Nombre de processus par défaut : un par cœur
+DEFAULT_WORKERS = os.cpu_count() or 1
+# Intervalle (s) de vérification d'une demande d'arrêt pendant l'attente des processus
+STOP_POLL_INTERVAL = 0.01
+# Démarrage des processus : jamais par fork, le processus du jeu a des threads
+# (IA, réseau, son) et l'état SDL qu'un processus copié hériterait
+START_METHOD = "spawn"
+
+
+# --- Encodage compact des positions ------------------------------------------
+
+def encode_state(state):
+    """
+    Position réduite à des types simples pour l'envoi aux processus :
+    (couleurs du plateau sur 100 octets, mode, pions rouges, pions bleus, camps, trait).
+    Ni grille pawn_grid ni objet pygame ne traverse la frontière des processus.
+    """
+    return (state.tables.fingerprint, state.mode, state.pawns[1], state.pawns[2],
+            state.camps, state.side)
+
+
+def decode_state(encoded):
+    """Reconstruit un GameState ; les tables du plateau restent en cache dans chaque processus"""
+    from plateau.game_state import GameState
+    fingerprint, mode, red, blue, camps, side = encoded
+    board_grid = [list(fingerprint[row * GRID_SIZE:(row + 1) * GRID_SIZE]) for row in range(GRID_SIZE)]
+    return GameState(get_layout_tables(board_grid), mode, (0, red, blue), camps, side)
+
+
+# --- Tâches exécutées dans les processus -------------------------------------
+
+# Numéro de la dernière demande abandonnée (valeur partagée, donnée au démarrage du processus)
+_cancelled = None
+
+
+def _init_worker(cancelled):
+    global _cancelled
+    _cancelled = cancelled
+
+
+class WorkerStop:
+    """
+    Demande d'arrêt vue depuis un processus (même interface que threading.Event) :
+    levée dès que la demande numéro request, ou une suivante, a été abandonnée.
+    """
+
+    def __init__(self, request):
+        self.request = request
+
+    def is_set(self):
+        return _cancelled is not None and _cancelled.value >= self.request
+
+
+def _warm_up():
+    """Tâche vide : force le démarrage du processus et les imports"""
+    return os.getpid()
+
+
+def _search_split(encoded, root_moves, time_budget, max_depth, history, shared_table, stop=None):
+    """
+    Alpha-beta sur une partie des coups de la racine.
+    Retourne ([(coup, score) par profondeur terminée], nœuds visités).
+    stop : threading.Event (appel direct) ou WorkerStop (dans un processus).
+    """
+    from plateau.search import KatarengaSearch, get_shared_table
+    from plateau.zobrist import TranspositionTable
+    state = decode_state(encoded)
+    # La table partagée d'un processus est conservée d'un tour à l'autre
+    table = get_shared_table(state.tables.key) if shared_table else TranspositionTable()
+    search = KatarengaSearch(time_budget, max_depth, table)
+    search.history = set(history)
+    search.stop = stop
+    search.find_best_move(state, root_moves)
+    return search.depth_results, search.nodes
+
+
+def _mcts_root(encoded, time_ms, iterations, seed, stop=None):
+    """MCTS indépendant ; retourne les statistiques des coups de la racine"""
+    from plateau.mcts import MCTSPlayer
+    player = MCTSPlayer(time_ms=time_ms, iterations=iterations, seed=seed)
+    if player.choose_move(decode_state(encoded), stop) is None:
+        return [], 0
+    return [(child.move, child.visits, child.wins) for child in player.root.children], player.last_iterations
+
+
+# --- Fusion des résultats ----------------------------------------------------
+
+def merge_split_results(results):
+    """
+    Meilleur (coup, score) parmi les recherches réparties.
+    Les scores ne sont comparés qu'à la plus grande profondeur terminée par toutes
+    les parties, sauf pour une partie déjà tranchée (victoire ou défaite forcée)
+    qui garde son dernier résultat.
+    """
+    results = [depths for depths in results if depths]
+    if not results:
+        return None, 0
+
+    def decisive(depths):
+        return abs(depths[-1][1]) >= WIN_SCORE - MAX_DEPTH
+
+    open_depths = [len(depths) for depths in results if not decisive(depths)]
+    depth = min(open_depths) if open_depths else max(len(depths) for depths in results)
+    best_move, best_score = None, -WIN_SCORE - 1
+    for depths in results:
+        move, score = depths[min(depth, len(depths)) - 1]
+        if score > best_score:
+            best_move, best_score = move, score
+    return best_move, best_score
+
+
+def merge_root_statistics(results):
+    """Additionne les visites de chaque coup racine ; retourne le coup le plus visité"""
+    visits = {}
+    for statistics in results:
+        for move, count, _ in statistics:
+            visits[move] = visits.get(move, 0) + count
+    if not visits:
+        return None
+    return max(visits, key=visits.get)
+
+
+def to_game_move(move, mode):
+    """Coup (départ, arrivée) au format du jeu, comme search_move et mcts_ai"""
+    if move is None:
+        return None
+    from_row, from_col = divmod(move[0], GRID_SIZE)
+    if mode == 2:
+        return from_row, from_col
+    return from_row, from_col, divmod(move[1], GRID_SIZE)
+
+
+class ParallelSearch:
+    """
+    Exécuteur de recherche sur plusieurs processus (ProcessPoolExecutor).
+    - search_move : alpha-beta Katarenga, coups de la racine répartis entre les processus
+    - mcts_move : MCTS parallèle à la racine (arbres indépendants, visites additionnées)
+    Avec un seul processus, la recherche est faite directement, sans pool.
+    Utilisable depuis start_game comme depuis un lanceur de parties sans affichage.
+    """
+
+    def __init__(self, workers=None):
+        self.workers = max(1, workers or DEFAULT_WORKERS)
+        self.executor = None
+        self.last_nodes = 0
+        self.last_iterations = 0
+        self.context = multiprocessing.get_context(START_METHOD)
+        # Numéro de la dernière demande et de la dernière demande abandonnée
+        # (lu par les processus : une recherche abandonnée s'arrête d'elle-même)
+        self.requests = 0
+        self.cancelled = self.context.RawValue("Q", 0)
+
+    def _pool(self):
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=self.context,
+                                                initializer=_init_worker, initargs=(self.cancelled,))
+        return self.executor
+
+    def warm_up(self):
+        """
+        Démarre les processus à l'avance (évite le coût au premier coup).
+        À appeler depuis le thread principal ; sans effet si le pool existe déjà.
+        """
+        if self.workers > 1 and self.executor is None:
+            pool = self._pool()
+            for future in [pool.submit(_warm_up) for _ in range(self.workers)]:
+                future.result()
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.cancelled.value = self.requests
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+
+    def _collect(self, futures, stop):
+        """
+        Résultats des processus, ou None si stop est levé avant la fin.
+        Les tâches pas encore commencées sont annulées, celles en cours
+        s'arrêtent au prochain contrôle du temps (WorkerStop).
+        """
+        pending = set(futures)
+        while pending:
+            _, pending = wait(pending, timeout=STOP_POLL_INTERVAL)
+            if stop is not None and stop.is_set():
+                self.cancelled.value = self.requests
+                for future in pending:
+                    future.cancel()
+                return None
+        return [future.result() for future in futures]
+
+    def search_move(self, state, time_budget=DEFAULT_TIME_BUDGET, history=None,
+                    max_depth=MAX_DEPTH, shared_table=True, stop=None):
+        """
+        Meilleur coup Katarenga pour le joueur au trait de state (non modifié).
+        Retourne (from_row, from_col, (to_row, to_col)) comme search_move, ou None
+        (aucun coup, ou recherche interrompue par stop).
+        """
+        from plateau.search import KatarengaSearch
+        history = tuple(history if history is not None else state.history_keys())
+        moves = state.legal_moves()
+        if not moves:
+            return None
+        # Premier coup ordonné si aucune profondeur n'a pu être terminée
+        moves = KatarengaSearch().order_moves(moves, state, state.side)
+        if self.workers == 1 or len(moves) == 1:
+            depths, self.last_nodes = _search_split(encode_state(state), None, time_budget,
+                                                    max_depth, history, shared_table, stop)
+            if stop is not None and stop.is_set():
+                return None
+            move, _ = merge_split_results([depths])
+            return to_game_move(move or moves[0], state.mode)
+
+        # Répartition en alternance : chaque processus reçoit des coups prometteurs
+        parts = [moves[index::self.workers] for index in range(min(self.workers, len(moves)))]
+        encoded = encode_state(state)
+        pool = self._pool()
+        self.requests += 1
+        worker_stop = WorkerStop(self.requests)
+        futures = [pool.submit(_search_split, encoded, part, time_budget, max_depth, history, shared_table,
+                               worker_stop)
+                   for part in parts]
+        results = self._collect(futures, stop)
+        if results is None:
+            return None
+        self.last_nodes = sum(nodes for _, nodes in results)
+        move, _ = merge_split_results([depths for depths, _ in results])
+        return to_game_move(move or moves[0], state.mode)
+
+    def mcts_move(self, state, time_ms=DEFAULT_TIME_MS, iterations=None, seed=None, stop=None):
+        """
+        Coup MCTS (tous modes) au format de mcts_ai, ou None.
+        iterations est le budget de chaque processus.
+        """
+        encoded = encode_state(state)
+        seeds = [None if seed is None else seed + index for index in range(self.workers)]
+        if self.workers == 1:
+            results = [_mcts_root(encoded, time_ms, iterations, seeds[0], stop)]
+        else:
+            pool = self._pool()
+            self.requests += 1
+            worker_stop = WorkerStop(self.requests)
+            futures = [pool.submit(_mcts_root, encoded, time_ms, iterations, worker_seed, worker_stop)
+                       for worker_seed in seeds]
+            results = self._collect(futures, stop)
+            if results is None:
+                return None
+        self.last_iterations = sum(count for _, count in results)
+        return to_game_move(merge_root_statistics([statistics for statistics, _ in results]), state.mode)
+
+
+_parallel_search = None
+
+
+def get_parallel_search():
+    """Exécuteur partagé par les parties (processus fermés à la sortie du programme)"""
+    global _parallel_search
+    if _parallel_search is None:
+        _parallel_search = ParallelSearch()
+        atexit.register(_parallel_search.shutdown)
+    return _parallel_search
+
+
+def benchmark(worker_counts=(1, 2, 4, 8), depth=5, mcts_ms=1000, seed=5):
+    """
+    Accélération selon le nombre de processus sur un plateau de quadrants.json :
+    temps d'un alpha-beta à profondeur fixe et itérations MCTS par seconde.
+    """
+    import json
+    import random
+    from pathlib import Path
+    from plateau.game_logic import create_game_board, initialize_pawns_for_game_mode
+    from plateau.game_state import GameState
+
+    quadrants_file = Path(__file__).parent.parent / "quadrant" / "quadrants.json"
+    with open(quadrants_file, "r", encoding="utf-8") as f:
+        grids = [quadrant["grid"] for quadrant in json.load(f).values()]
+    rng = random.Random(seed)
+    board_grid = create_game_board([rng.choice(grids) for _ in range(4)])
+    state = GameState.from_grids(board_grid, initialize_pawns_for_game_mode(0), 0)
+
+    results = []
+    for workers in worker_counts:
+        executor = ParallelSearch(workers)
+        executor.warm_up()
+        start = time.perf_counter()
+        executor.search_move(state, time_budget=3600, max_depth=depth, shared_table=False)
+        search_time = time.perf_counter() - start
+        nodes = executor.last_nodes
+
+        start = time.perf_counter()
+        executor.mcts_move(state, time_ms=mcts_ms, seed=seed)
+        iterations_rate = executor.last_iterations / (time.perf_counter() - start)
+        executor.shutdown()
+        results.append((workers, search_time, nodes, iterations_rate))
+    return results
+
+
+if __name__ == "__main__":
+    print(f"{os.cpu_count()} cœur(s) disponibles")
+    rows = benchmark()
+    base_time, base_rate = rows[0][1], rows[0][3]
+    for workers, search_time, nodes, iterations_rate in rows:
+        print(f"{workers} processus : alpha-beta {search_time:6.2f} s ({nodes} nœuds, x{base_time / search_time:.2f})"
+              f" | MCTS {iterations_rate:7.0f} itérations/s (x{iterations_rate / base_rate:.2f})")
@@ -0,0 +1,304 @@
+import time
+from plateau.bitboard import GRID_SIZE, popcount, square
+from plateau.layout_tables import get_layout_tables
+from plateau.zobrist import (
+    TranspositionTable, encode_move, decode_move,
+    EXACT, LOWER_BOUND, UPPER_BOUND
+)
+from jeux.katarenga import get_camp_positions
+
+# Budgets de réflexion par coup (secondes)
+TIME_BUDGETS = {"rapide": 0.05, "normal": 0.5, "long": 5.0}
+DEFAULT_TIME_BUDGET = TIME_BUDGETS["normal"]
+
+WIN_SCORE = 100000
+MAX_DEPTH = 64
+
+# Poids de l'évaluation
+PAWN_VALUE = 100
+CAMP_VALUE = 400
+ADVANCE_VALUE = 6
+READY_FOR_CAMP_VALUE = 40
+
+# Fréquence (en nœuds) de la vérification du temps
+TIME_CHECK_INTERVAL = 256
+
+
+def _camp_mask(player):
+    """Bitboard des camps visés par le joueur (d'après jeux.katarenga)"""
+    mask = 0
+    for camp_row, camp_col in get_camp_positions(player):
+        mask |= 1 << square(camp_row, camp_col)
+    return mask
+
+
+CAMP_MASKS = {1: _camp_mask(1), 2: _camp_mask(2)}
+ALL_CAMPS_MASK = CAMP_MASKS[1] | CAMP_MASKS[2]
+# Rouge progresse vers la ligne 8, Bleu vers la ligne 1
+ROW_MASKS = [sum(1 << square(row, col) for col in range(GRID_SIZE)) for row in range(GRID_SIZE)]
+ADVANCE_ROWS = {
+    1: [(row - 1, ROW_MASKS[row]) for row in range(2, 9)],
+    2: [(8 - row, ROW_MASKS[row]) for row in range(1, 8)]
+}
+ENEMY_BASELINE_MASK = {1: ROW_MASKS[8], 2: ROW_MASKS[1]}
+
+
+def evaluate_pawns(pawns, camps, player):
+    """
+    Évaluation statique du point de vue du joueur, à partir des bitboards
+    des pions et des camps occupés (aussi utilisée pour arrêter les
+    simulations MCTS)
+    """
+    score = 0
+    for side, sign in ((player, 1), (3 - player, -1)):
+        own = pawns[side]
+        value = PAWN_VALUE * popcount(own)
+        value += CAMP_VALUE * popcount(camps & CAMP_MASKS[side])
+        for advance, row_mask in ADVANCE_ROWS[side]:
+            value += ADVANCE_VALUE * advance * popcount(own & row_mask)
+        # Pion prêt à entrer dans un camp libre
+        if own & ENEMY_BASELINE_MASK[side] and CAMP_MASKS[side] & ~camps:
+            value += READY_FOR_CAMP_VALUE
+        score += sign * value
+    return score
+
+
+class SearchTimeout(Exception):
+    """Levée quand le budget de temps est épuisé en pleine recherche"""
+
+
+class KatarengaSearch:
+    """
+    Recherche negamax alpha-beta avec approfondissement itératif pour Katarenga.
+    La position est un GameState joué et annulé sur place (make/unmake) :
+    aucune copie de grille ni variable globale pendant la recherche.
+    La table de transposition peut être partagée entre plusieurs recherches.
+    """
+
+    def __init__(self, time_budget=DEFAULT_TIME_BUDGET, max_depth=MAX_DEPTH, transposition_table=None):
+        self.time_budget = time_budget
+        self.max_depth = max_depth
+        self.tt = transposition_table if transposition_table is not None else TranspositionTable()
+        self.deadline = 0
+        self.nodes = 0
+        self.completed_depth = 0
+        # (coup, score) de chaque profondeur terminée
+        self.depth_results = []
+        # threading.Event optionnel : arrêt demandé depuis un autre thread
+        self.stop = None
+        # Clés des positions déjà jouées (partie) et du chemin en cours (recherche)
+        self.history = set()
+        self.path = []
+
+    def order_moves(self, moves, state, player, first_move=None):
+        """Entrées dans les camps puis captures d'abord, meilleur coup précédent en tête"""
+        enemy = state.pawns[3 - player]
+
+        def priority(move):
+            if move == first_move:
+                return 0
+            target_bit = 1 << move[1]
+            if target_bit & ALL_CAMPS_MASK:
+                return 1
+            if target_bit & enemy:
+                return 2
+            return 3
+
+        moves.sort(key=priority)
+        return moves
+
+    def _tt_score_in(self, score, ply):
+        """Les scores de victoire sont stockés relativement au nœud"""
+        if score >= WIN_SCORE - MAX_DEPTH:
+            return score + ply
+        if score <= -(WIN_SCORE - MAX_DEPTH):
+            return score - ply
+        return score
+
+    def _tt_score_out(self, score, ply):
+        if score >= WIN_SCORE - MAX_DEPTH:
+            return score - ply
+        if score <= -(WIN_SCORE - MAX_DEPTH):
+            return score + ply
+        return score
+
+    def evaluate(self, state, player):
+        """Évaluation statique du point de vue du joueur"""
+        return evaluate_pawns(state.pawns, state.camps, player)
+
+    def _check_time(self):
+        self.nodes += 1
+        if self.nodes % TIME_CHECK_INTERVAL == 0 and (
+                time.perf_counter() >= self.deadline or self.stop is not None and self.stop.is_set()):
+            raise SearchTimeout()
+
+    def negamax(self, state, depth, alpha, beta, ply):
+        self._check_time()
+        player = state.side
+        key = state.key
+
+        winner = state.camps_winner() or state.minimum_pawn_winner()
+        if winner:
+            return WIN_SCORE - ply if winner == player else -(WIN_SCORE - ply)
+        # Répétition de position : considérée comme nulle
+        if key in self.history or key in self.path:
+            return 0
+        if depth == 0:
+            return self.evaluate(state, player)
+
+        original_alpha = alpha
+        tt_move = None
+        entry = self.tt.probe(key)
+        if entry is not None:
+            entry_depth, entry_score, entry_flag, entry_move = entry
+            tt_move = decode_move(entry_move)
+            if entry_depth >= depth:
+                entry_score = self._tt_score_out(entry_score, ply)
+                if entry_flag == EXACT:
+                    return entry_score
+                if entry_flag == LOWER_BOUND and entry_score >= beta:
+                    return entry_score
+                if entry_flag == UPPER_BOUND and entry_score <= alpha:
+                    return entry_score
+
+        moves = state.legal_moves(player)
+        if not moves:
+            # Joueur bloqué : considéré comme perdant
+            return -(WIN_SCORE - ply)
+
+        best = -WIN_SCORE - 1
+        best_move = None
+        self.path.append(key)
+        try:
+            for move in self.order_moves(moves, state, player, tt_move):
+                state.make_move(move, player)
+                try:
+                    score = -self.negamax(state, depth - 1, -beta, -alpha, ply + 1)
+                finally:
+                    state.unmake_move()
+                if score > best:
+                    best = score
+                    best_move = move
+                if score > alpha:
+                    alpha = score
+                if alpha >= beta:
+                    break
+        finally:
+            self.path.pop()
+
+        if best <= original_alpha:
+            flag = UPPER_BOUND
+        elif best >= beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        self.tt.store(key, depth, self._tt_score_in(best, ply), flag, encode_move(best_move))
+        return best
+
+    def search_root(self, state, depth, moves):
+        """Recherche à profondeur fixe depuis la racine, retourne (meilleur coup, score)"""
+        player = state.side
+        alpha = -WIN_SCORE - 1
+        beta = WIN_SCORE + 1
+        best_move = moves[0]
+        self.path.append(state.key)
+        try:
+            for move in moves:
+                state.make_move(move, player)
+                try:
+                    score = -self.negamax(state, depth - 1, -beta, -alpha, 1)
+                finally:
+                    state.unmake_move()
+                if score > alpha:
+                    alpha = score
+                    best_move = move
+        finally:
+            self.path.pop()
+        return best_move, alpha
+
+    def find_best_move(self, state, root_moves=None):
+        """
+        Approfondissement itératif jusqu'à épuisement du budget de temps,
+        pour le joueur au trait dans state (GameState, modifié puis restauré).
+        root_moves limite la racine à une partie des coups (recherche répartie).
+        Retourne (coup, score) du dernier niveau terminé, ou (None, 0) sans coup légal.
+        """
+        self.deadline = time.perf_counter() + self.time_budget
+        self.nodes = 0
+        self.completed_depth = 0
+        self.depth_results = []
+
+        player = state.side
+        moves = list(root_moves) if root_moves is not None else state.legal_moves(player)
+        if not moves:
+            return None, 0
+        moves = self.order_moves(moves, state, player)
+        best_move, best_score = moves[0], 0
+
+        for depth in range(1, self.max_depth + 1):
+            try:
+                move, score = self.search_root(state, depth, moves)
+            except SearchTimeout:
+                break
+            best_move, best_score = move, score
+            self.completed_depth = depth
+            self.depth_results.append((move, score))
+            # Coup gagnant forcé trouvé : inutile d'aller plus loin
+            if abs(score) >= WIN_SCORE - MAX_DEPTH:
+                break
+            # Le meilleur coup est examiné en premier à l'itération suivante
+            moves = self.order_moves(moves, state, player, best_move)
+            if time.perf_counter() >= self.deadline:
+                break
+        return best_move, best_score
+
+
+_shared_table = None
+_shared_table_layout = None
+
+
+def get_shared_table(board_grid):
+    """
+    Table de transposition partagée entre les tours de l'IA.
+    Les scores dépendent des couleurs du plateau : la table est vidée
+    quand la disposition change.
+    """
+    global _shared_table, _shared_table_layout
+    fingerprint = get_layout_tables(board_grid).fingerprint
+    if _shared_table is None:
+        _shared_table = TranspositionTable()
+    elif _shared_table_layout != fingerprint:
+        _shared_table.clear()
+    _shared_table_layout = fingerprint
+    return _shared_table
+
+
+def search_move(state, time_budget=DEFAULT_TIME_BUDGET, history=None, stop=None):
+    """
+    Meilleur coup Katarenga pour le joueur au trait de state (GameState).
+    La recherche travaille sur une copie : l'état de la partie n'est pas modifié.
+    history : clés Zobrist des positions déjà jouées (par défaut, celles de state).
+    stop : threading.Event optionnel qui interrompt la recherche.
+    Retourne (from_row, from_col, (to_row, to_col)) comme randomAi, ou None.
+    """
+    search = KatarengaSearch(time_budget, transposition_table=get_shared_table(state.tables.key))
+    search.history = set(history if history is not None else state.history_keys())
+    search.stop = stop
+    move, _ = search.find_best_move(state.copy())
+    if move is None:
+        return None
+    from_row, from_col = divmod(move[0], GRID_SIZE)
+    return from_row, from_col, divmod(move[1], GRID_SIZE)
+
+
+def katarenga_ai(pawn_grid, board_grid, current_player, time_budget=DEFAULT_TIME_BUDGET, history=None):
+    """
+    IA Katarenga par recherche alpha-beta à partir des grilles.
+    L'occupation des camps est lue une seule fois dans les variables globales
+    de jeux.katarenga (appelants qui n'ont pas de GameState).
+    """
+    from plateau.game_state import GameState
+    from jeux.katarenga import occupied_camps_mask
+    camps = occupied_camps_mask(1) | occupied_camps_mask(2)
+    state = GameState.from_grids(board_grid, pawn_grid, 0, current_player, camps)
+    return search_move(state, time_budget, history or ())
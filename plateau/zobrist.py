@@ -0,0 +1,174 @@
+import random
+import time
+from array import array
+from plateau.bitboard import GRID_SIZE, iter_squares, square
+
+# Graine fixe : les clés sont identiques sur toutes les machines (utile en réseau)
+ZOBRIST_SEED = 0x4B415441
+
+_rng = random.Random(ZOBRIST_SEED)
+_SQUARES = GRID_SIZE * GRID_SIZE
+
+# Une clé par (joueur, case), index 0 inutilisé pour accéder par numéro de joueur
+PAWN_KEYS = [
+    [0] * _SQUARES,
+    [_rng.getrandbits(64) for _ in range(_SQUARES)],
+    [_rng.getrandbits(64) for _ in range(_SQUARES)]
+]
+# Clé ajoutée quand c'est au joueur 2 de jouer
+SIDE_KEY = _rng.getrandbits(64)
+# Une clé par mode de jeu (Katarenga, Congress, Isolation)
+MODE_KEYS = [_rng.getrandbits(64) for _ in range(3)]
+# Occupation des camps Katarenga (coins de la grille)
+CAMP_KEYS = [0] * _SQUARES
+for _camp in (square(0, 0), square(0, 9), square(9, 0), square(9, 9)):
+    CAMP_KEYS[_camp] = _rng.getrandbits(64)
+CAMPS_MASK = sum(1 << sq for sq in range(_SQUARES) if CAMP_KEYS[sq])
+
+# Types d'entrées de la table de transposition
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+
+def compute_hash(pawns, camps, side, game_mode):
+    """
+    Calcule la clé Zobrist d'une position à partir de zéro.
+    pawns : [0, bitboard_joueur1, bitboard_joueur2], camps : bitboard des camps occupés.
+    """
+    key = MODE_KEYS[game_mode]
+    for player in (1, 2):
+        keys = PAWN_KEYS[player]
+        for sq in iter_squares(pawns[player]):
+            key ^= keys[sq]
+    for sq in iter_squares(camps & CAMPS_MASK):
+        key ^= CAMP_KEYS[sq]
+    if side == 2:
+        key ^= SIDE_KEY
+    return key
+
+
+def hash_move(key, player, from_sq, to_sq, enemy):
+    """
+    Mise à jour incrémentale après un déplacement (Katarenga, Congress).
+    enemy : bitboard des pions adverses avant le coup (pour les captures).
+    """
+    key ^= PAWN_KEYS[player][from_sq] ^ SIDE_KEY
+    if CAMP_KEYS[to_sq]:
+        # Entrée dans un camp : le pion quitte le plateau
+        return key ^ CAMP_KEYS[to_sq]
+    key ^= PAWN_KEYS[player][to_sq]
+    if enemy >> to_sq & 1:
+        key ^= PAWN_KEYS[3 - player][to_sq]
+    return key
+
+
+def hash_placement(key, player, sq):
+    """Mise à jour incrémentale après un placement (Isolation)"""
+    return key ^ PAWN_KEYS[player][sq] ^ SIDE_KEY
+
+
+class TranspositionTable:
+    """
+    Table de transposition de taille fixe, stockée dans des tableaux (array).
+    Remplacement par profondeur : une entrée n'est écrasée que par une recherche
+    au moins aussi profonde, sauf s'il s'agit de la même position.
+    """
+
+    def __init__(self, size_power=18):
+        self.size = 1 << size_power
+        self.mask = self.size - 1
+        self.keys = array("Q", bytes(8 * self.size))
+        self.depths = array("b", [-1]) * self.size
+        self.scores = array("i", bytes(4 * self.size))
+        self.flags = array("b", bytes(self.size))
+        # Coup encodé départ * 100 + arrivée (ou case * 100 + case en Isolation), -1 si aucun
+        self.moves = array("h", [-1]) * self.size
+
+    def clear(self):
+        """Vide la table (les entrées de profondeur -1 sont considérées vides)"""
+        self.depths = array("b", [-1]) * self.size
+
+    def probe(self, key):
+        """Retourne (profondeur, score, type, coup) ou None si la position est absente"""
+        index = key & self.mask
+        if self.depths[index] < 0 or self.keys[index] != key:
+            return None
+        return self.depths[index], self.scores[index], self.flags[index], self.moves[index]
+
+    def store(self, key, depth, score, flag, move=-1):
+        """Enregistre le résultat d'une recherche"""
+        index = key & self.mask
+        if self.keys[index] != key and depth < self.depths[index]:
+            return
+        self.keys[index] = key
+        self.depths[index] = depth
+        self.scores[index] = score
+        self.flags[index] = flag
+        self.moves[index] = move
+
+    def filled(self):
+        """Nombre d'entrées occupées (statistique)"""
+        return self.size - self.depths.count(-1)
+
+
+def encode_move(move):
+    """(départ, arrivée) -> entier stockable dans la table"""
+    return move[0] * 100 + move[1]
+
+
+def decode_move(value):
+    """Inverse de encode_move"""
+    if value < 0:
+        return None
+    return divmod(value, 100)
+
+
+def benchmark(moves_count=20000):
+    """
+    Compare le coût de la mise à jour incrémentale par coup avec le recalcul complet.
+    Retourne (microsecondes incrémental, microsecondes recalcul).
+    """
+    from plateau.bitboard import PLAYABLE_MASK
+    rng = random.Random(1)
+    playable = list(iter_squares(PLAYABLE_MASK))
+    pawns = [0, 0, 0]
+    for player, squares in ((1, playable[:8]), (2, playable[-8:])):
+        for sq in squares:
+            pawns[player] |= 1 << sq
+
+    # Suite de coups aléatoires vers des cases vides
+    sequence = []
+    state = list(pawns)
+    side = 1
+    for _ in range(moves_count):
+        own = list(iter_squares(state[side]))
+        empty = [sq for sq in playable if not (state[1] | state[2]) >> sq & 1]
+        from_sq, to_sq = rng.choice(own), rng.choice(empty)
+        sequence.append((side, from_sq, to_sq, list(state)))
+        state[side] ^= (1 << from_sq) | (1 << to_sq)
+        side = 3 - side
+
+    key = compute_hash(pawns, 0, 1, 0)
+    start = time.perf_counter()
+    for mover, from_sq, to_sq, before in sequence:
+        key = hash_move(key, mover, from_sq, to_sq, before[3 - mover])
+    incremental = (time.perf_counter() - start) / moves_count * 1e6
+
+    start = time.perf_counter()
+    for mover, from_sq, to_sq, before in sequence:
+        after = list(before)
+        after[mover] ^= (1 << from_sq) | (1 << to_sq)
+        compute_hash(after, 0, 3 - mover, 0)
+    full = (time.perf_counter() - start) / moves_count * 1e6
+
+    if key != compute_hash(state, 0, side, 0):
+        raise AssertionError("Hash incrémental différent du recalcul complet")
+    return incremental, full
+
+
+if __name__ == "__main__":
+    incremental, full = benchmark()
+    print(f"Mise à jour incrémentale : {incremental:.2f} µs/coup")
+    print(f"Recalcul complet         : {full:.2f} µs/coup")
+    print(f"Rapport                  : x{full / incremental:.1f}")
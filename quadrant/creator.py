@@ -1,13 +1,11 @@
 import pygame
-import json 
 import sys
 from pathlib import Path
 from config_manager import initialize_quadrants
+from quadrant.repository import quadrant_repository
 from assets.colors import Colors
 from assets.audio_manager import audio_manager  # ✅ NOUVEAU IMPORT AUDIO
 
-JSON_FILE = "quadrants.json"
-
 
 def show_creator(screen):
     # Récupérer la config
@@ -186,23 +184,8 @@ def show_creator(screen):
                 self.show_error_message(screen, "Impossible de sauvegarder : cases blanches !")
                 return
 
-            # ✅ CORRECTION : Charger le JSON depuis le dossier principal
-            json_path = QUADRANTS_MAIN_DIR / JSON_FILE
-            
-            # Charger les données JSON existantes ou créer un nouveau dictionnaire
-            data = {}
-            if json_path.exists():
-                try:
-                    with open(json_path, "r") as f:
-                        data = json.load(f)
-                except json.JSONDecodeError:
-                    # Si le fichier existe mais n'est pas un JSON valide, on le réinitialise
-                    data = {}
-            
-            # Déterminer le prochain ID de quadrant
-            next_id = 1
-            while f"quadrant_{next_id}" in data:
-                next_id += 1
+            # Déterminer le prochain ID de quadrant (dépôt partagé des quadrants)
+            next_id = quadrant_repository.next_id()
                 
             quadrant_id = f"quadrant_{next_id}"
             
@@ -239,15 +222,9 @@ def show_creator(screen):
                         row_data.append(0)  # Valeur par défaut si couleur inconnue
                 grid_data.append(row_data)
             
-            # ✅ CORRECTION : Chemin relatif correct pour le JSON
-            data[quadrant_id] = {
-                "image_path": f"quadrant/quadrant/{img_filename}",  # Chemin vers le sous-dossier
-                "grid": grid_data
-            }
-
-            # Sauvegarde du fichier JSON dans le dossier principal
-            with open(json_path, "w") as f:
-                json.dump(data, f, indent=4)
+            # Ajout au dépôt : rotations calculées et quadrants.json réécrit de façon atomique
+            # (chemin de l'image relatif au projet)
+            quadrant_repository.add(quadrant_id, f"quadrant/quadrant/{img_filename}", grid_data)
 
             self.good_message(screen, f"Quadrant {next_id} sauvegardé avec succès!")
             
@@ -2,15 +2,14 @@
 import pygame
 import sys
 from pathlib import Path
-from config_manager import initialize_quadrants
+from quadrant.repository import quadrant_repository
 from assets.colors import Colors
 from assets.audio_manager import audio_manager  # ✅ NOUVEAU IMPORT AUDIO
+from assets.asset_cache import asset_cache
 
 def load_quadrants():
-    """Charge les quadrants depuis le fichier JSON en initialisant si nécessaire"""
-    # Utiliser le gestionnaire de configuration pour initialiser les quadrants
-    _, quadrants_data = initialize_quadrants()
-    return quadrants_data
+    """Quadrants du dépôt partagé (fichier JSON lu une fois, relu seulement s'il change)"""
+    return quadrant_repository.all()
 
 def show_quadrant_library(screen):
     """Affiche la bibliothèque de quadrants avec une interface épurée"""
@@ -22,7 +21,7 @@ def show_quadrant_library(screen):
     
     # Couleurs
     script_dir = Path(__file__).parent.parent.absolute()
-    background_image = pygame.image.load(script_dir / "assets" / "img" / "fond.png")
+    background_path = script_dir / "assets" / "img" / "fond.png"
     WHITE = Colors.WHITE
     BLACK = Colors.BLACK
     LIGHT_GRAY = Colors.LIGHT_GRAY
@@ -43,7 +42,7 @@ def show_quadrant_library(screen):
         image_path = data.get("image_path")
         if image_path and Path(image_path).exists():
             try:
-                img = pygame.image.load(image_path)
+                img = asset_cache.image(image_path)
                 quadrant_images[quadrant_id] = img
             except pygame.error:
                 print(f"Erreur lors du chargement de l'image pour {quadrant_id}")
@@ -104,7 +103,7 @@ def show_quadrant_library(screen):
     
     running = True
     while running:
-        background_scaled = pygame.transform.scale(background_image, screen.get_size())
+        background_scaled = asset_cache.scaled(background_path, screen.get_size())
         screen.blit(background_scaled, (0, 0))
         
         # Calculer la grille en tenant compte du défilement
@@ -0,0 +1,132 @@
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+# Fichier des quadrants (grilles 4x4 et images)
+QUADRANTS_FILE = Path(__file__).parent / "quadrants.json"
+
+# Orientations gardées pour chaque quadrant (degrés, sens horaire)
+ANGLES = (0, 90, 180, 270)
+
+
+def rotate_grid(grid):
+    """Rotation de 90° dans le sens horaire"""
+    rows = len(grid)
+    return [[grid[rows - 1 - i][j] for i in range(rows)] for j in range(len(grid[0]))] if rows else []
+
+
+def grid_rotations(grid):
+    """Les quatre orientations d'une grille, par angle en texte ("0", "90"...)"""
+    rotations = {}
+    current = [list(row) for row in grid]
+    for angle in ANGLES:
+        rotations[str(angle)] = current
+        current = rotate_grid(current)
+    return rotations
+
+
+class QuadrantRepository:
+    """
+    Quadrants de quadrants.json, partagés par tous les écrans.
+    Le fichier est lu une seule fois ; les grilles et leurs quatre rotations
+    restent en mémoire. Chaque accès compare la date de modification du
+    fichier : s'il a été modifié par un autre programme (ou à la main), il
+    est relu.
+    Les quadrants ajoutés sont écrits dans un fichier temporaire puis mis en
+    place par os.replace : un arrêt pendant l'écriture laisse l'ancien
+    fichier intact.
+    """
+
+    def __init__(self, json_path=QUADRANTS_FILE):
+        self.json_path = Path(json_path)
+        self.data = None
+        self.mtime = None
+        self.loads = 0
+        # Le thread de chargement du démarrage et l'affichage y accèdent
+        self.lock = threading.RLock()
+
+    def _file_mtime(self):
+        try:
+            return self.json_path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _load(self):
+        """Lit le fichier (créé avec les quadrants par défaut s'il est absent ou vide)"""
+        data = {}
+        try:
+            data = json.loads(self.json_path.read_text())
+        except (OSError, ValueError):
+            pass
+        if not data:
+            from config_manager import read_config, create_default_quadrants
+            data = create_default_quadrants(read_config())
+        for quadrant in data.values():
+            quadrant.setdefault("original_grid", [list(row) for row in quadrant["grid"]])
+            quadrant["rotations"] = grid_rotations(quadrant["grid"])
+        self.data = data
+        self.mtime = self._file_mtime()
+        self.loads += 1
+
+    def all(self):
+        """{identifiant: {"image_path", "grid", "rotations"...}} (ne pas modifier)"""
+        with self.lock:
+            if self.data is None or self._file_mtime() != self.mtime:
+                self._load()
+            return self.data
+
+    def get(self, quadrant_id):
+        return self.all().get(quadrant_id)
+
+    def grid(self, quadrant_id, rotation=0):
+        """Copie de la grille du quadrant tournée de rotation degrés ([] si inconnu)"""
+        quadrant = self.get(quadrant_id)
+        if quadrant is None:
+            return []
+        return [list(row) for row in quadrant["rotations"][str(rotation % 360)]]
+
+    def next_id(self):
+        """Premier numéro libre (quadrant_<n>)"""
+        quadrants = self.all()
+        number = 1
+        while f"quadrant_{number}" in quadrants:
+            number += 1
+        return number
+
+    def add(self, quadrant_id, image_path, grid):
+        """Ajoute (ou remplace) un quadrant et l'enregistre"""
+        with self.lock:
+            quadrants = self.all()
+            quadrants[quadrant_id] = {
+                "image_path": image_path,
+                "grid": [list(row) for row in grid],
+                "original_grid": [list(row) for row in grid],
+                "rotations": grid_rotations(grid),
+            }
+            self.save()
+
+    def save(self):
+        """Écriture atomique : fichier temporaire du même dossier puis os.replace"""
+        with self.lock:
+            self.json_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(prefix=".quadrants-", suffix=".tmp", dir=str(self.json_path.parent))
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(self.data, f, indent=4)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.json_path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+            # Notre propre écriture ne doit pas provoquer de relecture
+            self.mtime = self._file_mtime()
+
+
+# Instance globale partagée par les menus, la configuration de partie et le réseau
+quadrant_repository = QuadrantRepository()
@@ -0,0 +1,90 @@
+import struct
+
+# Trame : longueur du contenu (4 octets, ordre réseau) puis le contenu
+HEADER = struct.Struct("!I")
+
+# Taille initiale du tampon de réception (il grandit pour une trame plus longue)
+RECV_BUFFER_SIZE = 64 * 1024
+# Trame la plus longue acceptée : au-delà le flux est considéré comme corrompu
+MAX_FRAME_SIZE = 1024 * 1024
+
+
+class FrameError(Exception):
+    """Flux reçu invalide (longueur annoncée trop grande)"""
+
+
+def encode_frame(payload):
+    """Trame prête pour sendall : en-tête de longueur + contenu"""
+    if len(payload) > MAX_FRAME_SIZE:
+        raise FrameError(f"Message trop long ({len(payload)} octets)")
+    return HEADER.pack(len(payload)) + payload
+
+
+class FrameReader:
+    """
+    Découpe un flux TCP en trames.
+    Les octets sont reçus directement dans un tampon réutilisé
+    (recv_into sur une memoryview) ; les trames complètes en sont extraites
+    par tranches, sans concaténation. Un morceau de trame reste dans le
+    tampon jusqu'à l'arrivée de la suite, plusieurs trames reçues en une
+    fois sont toutes rendues.
+    """
+
+    def __init__(self, size=RECV_BUFFER_SIZE, max_frame=MAX_FRAME_SIZE):
+        self.buffer = bytearray(size)
+        self.view = memoryview(self.buffer)
+        self.max_frame = max_frame
+        # Octets en attente : buffer[start:end]
+        self.start = 0
+        self.end = 0
+
+    def recv_from(self, sock):
+        """Reçoit ce qui est disponible sur la socket ; 0 si la connexion est fermée"""
+        if self.end == len(self.buffer):
+            self._make_room(len(self.buffer) - self.start + 1)
+        received = sock.recv_into(self.view[self.end:])
+        self.end += received
+        return received
+
+    def feed(self, data):
+        """Ajoute des octets déjà reçus (mesures, tests)"""
+        needed = self.end - self.start + len(data)
+        if self.end + len(data) > len(self.buffer):
+            self._make_room(needed)
+        self.view[self.end:self.end + len(data)] = data
+        self.end += len(data)
+
+    def frames(self):
+        """Contenus (bytes) des trames complètes, dans l'ordre de réception"""
+        while self.end - self.start >= HEADER.size:
+            (length,) = HEADER.unpack_from(self.buffer, self.start)
+            if length > self.max_frame:
+                raise FrameError(f"Trame annoncée trop longue ({length} octets)")
+            frame_end = self.start + HEADER.size + length
+            if frame_end > self.end:
+                # Trame incomplète : garder la place pour la recevoir en entier
+                if HEADER.size + length > len(self.buffer) - self.start:
+                    self._make_room(HEADER.size + length)
+                break
+            payload = bytes(self.view[self.start + HEADER.size:frame_end])
+            self.start = frame_end
+            yield payload
+        if self.start == self.end:
+            self.start = self.end = 0
+
+    def _make_room(self, needed):
+        """Ramène les octets en attente au début du tampon, agrandi si needed ne tient pas"""
+        pending = self.end - self.start
+        if needed > len(self.buffer):
+            size = len(self.buffer)
+            while size < needed:
+                size *= 2
+            buffer = bytearray(size)
+            buffer[:pending] = self.view[self.start:self.end]
+            self.buffer = buffer
+            self.view = memoryview(buffer)
+        elif self.start:
+            # Copie avec recouvrement possible : memoryview gère le chevauchement
+            self.view[:pending] = self.view[self.start:self.end]
+        self.start = 0
+        self.end = pending
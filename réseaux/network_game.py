@@ -3,8 +3,11 @@ import sys
 import time
 from pathlib import Path
 from assets.colors import Colors
+from assets.asset_cache import asset_cache
+from assets.event_loop import get_events
+from assets.frame_profiler import profiler, WAIT_SECTION
 from plateau.game_board import create_game_board, initialize_pawns_for_game_mode, Animation
-from plateau.pawn import get_valid_moves, highlight_possible_moves
+from plateau.pawn import highlight_possible_moves
 
 def start_network_game(screen, network_manager):
     """
@@ -16,7 +19,7 @@ def start_network_game(screen, network_manager):
     
     # Couleurs et ressources
     script_dir = Path(sys.argv[0]).parent.absolute()
-    background_image = pygame.image.load(str(script_dir / "assets" / "img" / "fond.png"))
+    background_path = script_dir / "assets" / "img" / "fond.png"
     
     WHITE = Colors.WHITE
     BLACK = Colors.BLACK
@@ -28,12 +31,14 @@ def start_network_game(screen, network_manager):
     
     # Images
     PATH = Path(sys.argv[0]).parent.absolute()
+    cell_image_paths = {
+        1: PATH / "assets" / "img" / "yellow.png",
+        2: PATH / "assets" / "img" / "green.png",
+        3: PATH / "assets" / "img" / "blue.png",
+        4: PATH / "assets" / "img" / "red.png",
+    }
     images = {}
-    images[1] = pygame.image.load(str(PATH / "assets" / "img" / "yellow.png"))  
-    images[2] = pygame.image.load(str(PATH / "assets" / "img" / "green.png"))  
-    images[3] = pygame.image.load(str(PATH / "assets" / "img" / "blue.png"))   
-    images[4] = pygame.image.load(str(PATH / "assets" / "img" / "red.png"))
-    frame_image = pygame.image.load(str(PATH / "assets" / "img" / "frame.png"))
+    frame_path = PATH / "assets" / "img" / "frame.png"
     
     # SYNCHRONISATION MODE DE JEU
     import plateau.game_modes
@@ -88,11 +93,23 @@ def start_network_game(screen, network_manager):
     pawn_grid = initialize_pawns_for_game_mode(current_game_mode)
     animation = Animation()
     
-    # INITIALISATION KATARENGA - CORRECTION CRITIQUE
-    if current_game_mode == 0:
-        from jeux.katarenga import reset_camps
-        reset_camps()
-        print("🎮 Camps Katarenga initialisés")
+    # ÉTAT DE PARTIE - pions et camps Katarenga, pawn_grid n'est qu'une vue
+    from plateau.game_state import GameState
+    state = GameState.from_grids(board_grid, pawn_grid, current_game_mode)
+    
+    # VÉRIFICATION DES COUPS REÇUS - coups légaux de l'adversaire calculés une fois par tour
+    from réseaux.validation import MoveValidator, parse_move
+    validator = MoveValidator(state)
+    # Messages reçus pendant l'animation d'un coup pas encore joué dans state
+    deferred_messages = []
+    
+    # SYNCHRONISATION - clé de l'état jointe à chaque coup, instantané du joueur 1 si elles diffèrent
+    from réseaux.sync import board_key, state_hash, encode_snapshot, decode_snapshot
+    board_hash = board_key(board_grid)
+    
+    # COMPOSANTES CONGRESS - mises à jour à chaque coup, en coordonnées 10x10
+    from jeux.congress import CongressConnectivity
+    connectivity = CongressConnectivity(pawn_grid)
     
     # VARIABLES DE JEU - VERSION CORRIGÉE
     selected_pawn = None
@@ -108,28 +125,78 @@ def start_network_game(screen, network_manager):
     font = pygame.font.Font(None, 24)
     clock = pygame.time.Clock()
     
+    def sync_hash():
+        return state_hash(state, board_hash)
+    
+    def sync_hash_after(from_pos, to_pos):
+        """Clé de l'état après un déplacement pas encore joué (animation en cours)"""
+        state.move_coords(from_pos, to_pos)
+        key = sync_hash()
+        state.unmake_move()
+        return key
+    
+    def send_snapshot():
+        network_manager.send_message("resync", {"snapshot": encode_snapshot(board_grid, state).hex()})
+    
+    def request_resync():
+        # Le joueur 1 fait référence : il envoie son état, l'autre le demande
+        if my_player == 1:
+            send_snapshot()
+        else:
+            network_manager.send_message("resync_request", {"hash": sync_hash()})
+    
+    def check_sync(expected):
+        """Compare la clé reçue avec celle de notre état après le coup de l'adversaire"""
+        if expected is not None and expected != sync_hash():
+            print("⚠️ États différents entre les deux joueurs : resynchronisation")
+            request_resync()
+    
     # FONCTION POUR TRAITER LES MESSAGES - CORRIGÉE POUR KATARENGA
     def process_messages():
-        nonlocal pawn_grid, current_player, game_over, winner, connected_pawns
+        nonlocal pawn_grid, current_player, game_over, winner, connected_pawns, connectivity
+        nonlocal state, board_grid, board_hash, validator
         nonlocal selected_pawn, possible_moves, victory_shown, victory_message_sent, game_ended
         
-        messages = network_manager.get_messages()
-        for msg in messages:
+        messages = deferred_messages + network_manager.get_messages()
+        deferred_messages.clear()
+        for index, msg in enumerate(messages):
+            if (msg['type'] in ('move', 'placement', 'move_rejected', 'resync', 'resync_request')
+                    and animation.has_pending_move()):
+                # Le coup animé n'est pas encore joué : vérifier la suite une fois l'animation finie
+                deferred_messages.extend(messages[index:])
+                return
+            
+            if msg['type'] in ('move', 'placement'):
+                move, reason = validator.check_message(msg, opponent_player)
+                if reason is not None:
+                    # Coup refusé : non appliqué, l'adversaire le reprend (clé de notre état pour comparaison)
+                    print(f"❌ Coup refusé ({reason}): {msg['data']}")
+                    network_manager.send_message("move_rejected", {
+                        "type": msg['type'],
+                        "data": msg['data'],
+                        "reason": reason,
+                        "state": state.key
+                    })
+                    continue
+            
             if msg['type'] == 'move':
-                from_pos = msg['data']['from']
-                to_pos = msg['data']['to']
+                # JSON transmet des listes : comparaisons avec les positions en tuples
+                from_pos = tuple(msg['data']['from'])
+                to_pos = tuple(msg['data']['to'])
                 
                 print(f"📥 Mouvement reçu: {from_pos} -> {to_pos}")
                 
                 # Katarenga - camps spéciaux
                 if current_game_mode == 0:
-                    from jeux.katarenga import get_camp_positions, place_in_camp, check_katarenga_victory, is_camp_occupied
+                    from jeux.katarenga import get_camp_positions
                     camp_positions = get_camp_positions(opponent_player)
                     
                     if to_pos in camp_positions:
-                        if not is_camp_occupied(to_pos[0], to_pos[1], opponent_player) and place_in_camp(to_pos[0], to_pos[1], pawn_grid, opponent_player):
-                            pawn_grid[from_pos[0]][from_pos[1]] = 0
-                            winner = check_katarenga_victory()
+                        if not state.is_camp_occupied(to_pos[0], to_pos[1]):
+                            state.move_coords(from_pos, to_pos)
+                            pawn_grid = state.to_pawn_grid()
+                            check_sync(msg['data'].get('hash'))
+                            winner = state.camps_winner()
                             if winner > 0:
                                 game_over = True
                                 game_ended = True
@@ -139,22 +206,18 @@ def start_network_game(screen, network_manager):
                                 current_player = my_player  # Changement de tour seulement après placement camp
                             selected_pawn = None
                             possible_moves = []
-                            return
+                            continue
                 
                 # MOUVEMENT NORMAL
                 if current_game_mode == 1:  # Congress
-                    pawn_grid[to_pos[0]][to_pos[1]] = pawn_grid[from_pos[0]][from_pos[1]]
-                    pawn_grid[from_pos[0]][from_pos[1]] = 0
-                    
-                    from jeux.congress import check_victory
-                    temp_grid = [[0 for _ in range(8)] for _ in range(8)]
-                    for row in range(1, 9):
-                        for col in range(1, 9):
-                            temp_grid[row-1][col-1] = pawn_grid[row][col]
+                    state.move_coords(from_pos, to_pos)
+                    pawn_grid = state.to_pawn_grid()
+                    check_sync(msg['data'].get('hash'))
                     
-                    winner, connected_pawns_temp = check_victory(temp_grid)
+                    connectivity.apply_move(from_pos, to_pos, opponent_player)
+                    winner, connected_result = connectivity.winner()
                     if winner > 0:
-                        connected_pawns = [(row+1, col+1) for row, col in connected_pawns_temp]
+                        connected_pawns = connected_result
                         game_over = True
                         game_ended = True
                         victory_shown = False
@@ -175,7 +238,8 @@ def start_network_game(screen, network_manager):
                     animation.pending_move = {
                         'from': from_pos,
                         'to': to_pos,
-                        'pawn_color': pawn_grid[from_pos[0]][from_pos[1]]
+                        'pawn_color': pawn_grid[from_pos[0]][from_pos[1]],
+                        'hash': msg['data'].get('hash')
                     }
                     
                     # AJOUT CRITIQUE: Forcer le changement de tour après animation
@@ -184,8 +248,10 @@ def start_network_game(screen, network_manager):
             
             elif msg['type'] == 'placement':  # Isolation
                 row, col = msg['data']['position']
-                player = msg['data']['player']
-                pawn_grid[row][col] = player
+                player = opponent_player
+                state.place(row, col, player)
+                pawn_grid = state.to_pawn_grid()
+                check_sync(msg['data'].get('hash'))
                 
                 from jeux.isolation import check_isolation_victory
                 game_over_temp, winner_temp = check_isolation_victory(pawn_grid, player, board_grid)
@@ -210,6 +276,53 @@ def start_network_game(screen, network_manager):
             elif msg['type'] == 'victory_received':
                 print(f"✅ Adversaire a reçu le message de victoire")
             
+            elif msg['type'] == 'move_rejected':
+                # Notre dernier coup refusé (par l'adversaire ou le serveur dédié) : il est annulé
+                rejected = msg['data']
+                print(f"❌ Coup refusé par l'adversaire ({rejected.get('reason')}): {rejected.get('data')}")
+                try:
+                    move, _ = parse_move(rejected)
+                except (KeyError, TypeError, ValueError):
+                    move = None
+                last = state.undo_stack[-1] if state.undo_stack else None
+                if last is None or last[0] != move or last[1] != my_player:
+                    continue
+                # Clés de la position avant le coup : différentes, les deux états ont divergé
+                diverged = "state" in rejected and rejected["state"] != last[4]
+                state.unmake_move()
+                pawn_grid = state.to_pawn_grid()
+                if current_game_mode == 1:
+                    connectivity = CongressConnectivity(pawn_grid)
+                current_player = my_player
+                selected_pawn = None
+                possible_moves = []
+                if diverged:
+                    print("⚠️ États différents entre les deux joueurs : resynchronisation")
+                    request_resync()
+            
+            elif msg['type'] == 'resync_request':
+                if my_player == 1:
+                    print("🔄 Resynchronisation demandée : envoi de notre état")
+                    send_snapshot()
+            
+            elif msg['type'] == 'resync':
+                # État du joueur 1 : plateau, pions, camps et trait remplacent les nôtres
+                try:
+                    board_grid, state = decode_snapshot(bytes.fromhex(msg['data']['snapshot']), current_game_mode)
+                except (KeyError, TypeError, ValueError) as e:
+                    print(f"❌ Instantané invalide: {e}")
+                    continue
+                board_hash = board_key(board_grid)
+                validator = MoveValidator(state)
+                pawn_grid = state.to_pawn_grid()
+                connectivity = CongressConnectivity(pawn_grid)
+                current_player = state.side
+                animation.moving_pawn = None
+                animation.pending_move = None
+                selected_pawn = None
+                possible_moves = []
+                print(f"🔄 État resynchronisé, tour du joueur {current_player}")
+            
             elif msg['type'] == 'disconnect':
                 print("🔌 Adversaire déconnecté")
                 if not game_ended:
@@ -217,12 +330,14 @@ def start_network_game(screen, network_manager):
                     game_ended = True
                     victory_shown = False
     
-    def send_move(from_pos, to_pos):
+    def send_move(from_pos, to_pos, key):
+        # key : clé de l'état après le coup (sync_hash), comparée par l'adversaire
         network_manager.send_message("move", {
             "from": from_pos,
             "to": to_pos,
             "player": my_player,
-            "change_turn": True  # Nouveau champ pour indiquer le changement de tour
+            "change_turn": True,  # Nouveau champ pour indiquer le changement de tour
+            "hash": key
         })
         # Changement de tour immédiat seulement pour le joueur local
         global current_player
@@ -230,9 +345,11 @@ def start_network_game(screen, network_manager):
         print(f"Tour changé localement à {current_player}")
     
     def send_placement(position):
+        # Envoyé après state.place : la clé est celle de l'état courant
         network_manager.send_message("placement", {
             "position": position,
-            "player": my_player
+            "player": my_player,
+            "hash": sync_hash()
         })
     
     # SYNCHRONISATION FINALE
@@ -264,10 +381,22 @@ def start_network_game(screen, network_manager):
     print("🚀 PARTIE DÉMARRÉE")
     
     # BOUCLE PRINCIPALE
+    # Images encore dessinées à cadence normale après une action : l'état change
+    # parfois après l'affichage (coup en attente exécuté), ensuite la boucle dort
+    # jusqu'au prochain événement ou message réseau (WAKE_EVENT du NetworkManager)
+    busy_frames = 0
+    profiler.reset()
     running = True
     while running:
+        if animation.moving_pawn is not None or animation.has_pending_move():
+            busy_frames = 2
+        with profiler.section(WAIT_SECTION):
+            events = get_events(busy_frames > 0)
+        busy_frames = 2 if events else max(busy_frames - 1, 0)
+        
         if not game_over:
-            process_messages()
+            with profiler.section("messages"):
+                process_messages()
         
         # DIMENSIONS
         current_width, current_height = screen.get_size()
@@ -282,20 +411,21 @@ def start_network_game(screen, network_manager):
         board_x = (current_width - board_size) // 2
         board_y = (current_height - board_size) // 2
         
-        # Redimensionner images
-        for key in images:
-            images[key] = pygame.transform.scale(images[key], (cell_size, cell_size))
+        # Images à la taille des cases (redimensionnées seulement si la taille change)
+        for key, path in cell_image_paths.items():
+            images[key] = asset_cache.scaled(path, (cell_size, cell_size), alpha=True)
         
         # AFFICHAGE
-        background_scaled = pygame.transform.scale(background_image, screen.get_size())
+        profiler.start("plateau")
+        background_scaled = asset_cache.scaled(background_path, screen.get_size())
         screen.blit(background_scaled, (0, 0))
         
         # Cadre
-        if frame_image:
-            scaled_frame = pygame.transform.scale(frame_image, (
+        if frame_path:
+            scaled_frame = asset_cache.scaled(frame_path, (
                 board_size + 2 * cell_size,
                 board_size + 2 * cell_size
-            ))
+            ), alpha=True)
             screen.blit(scaled_frame, (board_x - cell_size, board_y - cell_size))
         
         # PLATEAU
@@ -314,7 +444,7 @@ def start_network_game(screen, network_manager):
                             pygame.draw.rect(screen, BLACK, cell_rect, 2)
             
             from jeux.katarenga import draw_camps
-            draw_camps(screen, board_x, board_y, cell_size)
+            draw_camps(screen, board_x, board_y, cell_size, state.camps)
             
         else:
             for row in range(1, 9):
@@ -328,25 +458,28 @@ def start_network_game(screen, network_manager):
                     if cell_value in images:
                         screen.blit(images[cell_value], cell_rect)
                     pygame.draw.rect(screen, BLACK, cell_rect, 2)
+        profiler.stop("plateau")
         
         # PIONS
-        draw_simple_pawns(screen, pawn_grid, board_x, board_y, cell_size, selected_pawn, animation, current_game_mode)
+        with profiler.section("pions"):
+            draw_simple_pawns(screen, pawn_grid, board_x, board_y, cell_size, selected_pawn, animation, current_game_mode)
         
         # CROIX ISOLATION
         if current_game_mode == 2 and not game_over:
-            draw_isolation_crosses(screen, pawn_grid, board_grid, board_x, board_y, cell_size)
+            with profiler.section("croix"):
+                draw_isolation_crosses(screen, pawn_grid, board_grid, board_x, board_y, cell_size)
         
         # ANIMATION - GESTION CORRIGÉE POUR KATARENGA
         if not animation.is_moving() and animation.has_pending_move() and not game_ended:
             from_pos = animation.pending_move['from']
             to_pos = animation.pending_move['to']
             
-            pawn_grid[to_pos[0]][to_pos[1]] = pawn_grid[from_pos[0]][from_pos[1]]
-            pawn_grid[from_pos[0]][from_pos[1]] = 0
+            state.move_coords(from_pos, to_pos)
+            pawn_grid = state.to_pawn_grid()
+            check_sync(animation.pending_move.get('hash'))
             
             if current_game_mode == 0:
-                from jeux.katarenga import check_minimum_pawn_victory_condition
-                potential_winner = check_minimum_pawn_victory_condition(pawn_grid, current_game_mode)
+                potential_winner = state.minimum_pawn_winner()
                 if potential_winner > 0 and not victory_message_sent:
                     winner = potential_winner
                     game_over = True
@@ -355,7 +488,9 @@ def start_network_game(screen, network_manager):
                     victory_message_sent = True
                     print(f"🏆 Victoire Katarenga par élimination: Joueur {winner}")
                     network_manager.send_message("victory", {"winner": winner})
-                # Ne pas changer le tour ici - déjà géré par l'expéditeur
+                else:
+                    # Tour suivant : celui de l'état (l'autre joueur après le coup animé)
+                    current_player = state.side
             elif current_game_mode == 2:
                 from jeux.isolation import check_isolation_victory
                 game_over_temp, winner_temp = check_isolation_victory(pawn_grid, current_player, board_grid)
@@ -375,9 +510,8 @@ def start_network_game(screen, network_manager):
         
         # VÉRIFICATION KATARENGA - CORRIGÉE
         if current_game_mode == 0 and not game_over and not game_ended:
-            from jeux.katarenga import check_katarenga_victory, check_minimum_pawn_victory_condition
-            
-            potential_winner = check_katarenga_victory()
+            with profiler.section("victoire"):
+                potential_winner = state.camps_winner()
             if potential_winner > 0 and not victory_message_sent:
                 winner = potential_winner
                 game_over = True
@@ -400,7 +534,7 @@ def start_network_game(screen, network_manager):
                     break
             
             elif not victory_message_sent:
-                elimination_winner = check_minimum_pawn_victory_condition(pawn_grid, current_game_mode)
+                elimination_winner = state.minimum_pawn_winner()
                 if elimination_winner > 0:
                     winner = elimination_winner
                     game_over = True
@@ -417,7 +551,7 @@ def start_network_game(screen, network_manager):
             
             # Vérifier victoire par élimination (minimum de pions) seulement si pas de victoire par camps
             elif not victory_message_sent:
-                elimination_winner = check_minimum_pawn_victory_condition(pawn_grid, current_game_mode)
+                elimination_winner = state.minimum_pawn_winner()
                 if elimination_winner > 0:
                     winner = elimination_winner
                     game_over = True
@@ -428,6 +562,7 @@ def start_network_game(screen, network_manager):
                     network_manager.send_message("victory", {"winner": winner})
         
         # VÉRIFICATION ISOLATION
+        profiler.start("victoire")
         if (current_game_mode == 2 and not game_over and current_player == my_player):
             # Test rapide si on peut encore jouer
             can_play = False
@@ -505,6 +640,7 @@ def start_network_game(screen, network_manager):
                 winner = opponent_player
                 victory_shown = False
                 network_manager.send_message("victory", {"winner": winner})
+        profiler.stop("victoire")
         
         # MOUVEMENTS POSSIBLES
         if (selected_pawn and possible_moves and not game_over and 
@@ -626,7 +762,7 @@ def start_network_game(screen, network_manager):
         screen.blit(abandon_text, abandon_text.get_rect(center=abandon_btn.center))
         
         # ÉVÉNEMENTS
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 # Envoyer déconnexion avant de quitter
                 if network_manager.is_connected:
@@ -774,7 +910,8 @@ def start_network_game(screen, network_manager):
                                         break
                                 
                                 if can_place:
-                                    pawn_grid[grid_row][grid_col] = current_player
+                                    state.place(grid_row, grid_col, current_player)
+                                    pawn_grid = state.to_pawn_grid()
                                     send_placement((grid_row, grid_col))
                                     
                                     from jeux.isolation import check_isolation_victory
@@ -803,30 +940,30 @@ def start_network_game(screen, network_manager):
                                     if (grid_row, grid_col) in possible_moves:
                                         # Katarenga - camps
                                         if current_game_mode == 0:
-                                            from jeux.katarenga import get_camp_positions, place_in_camp, check_katarenga_victory, is_camp_occupied
+                                            from jeux.katarenga import get_camp_positions
                                             camp_positions = get_camp_positions(current_player)
                                             
                                             if (grid_row, grid_col) in camp_positions:
                                                 # CORRECTION CRITIQUE : Vérifier si le camp est déjà occupé AVANT de tenter le placement
-                                                if not is_camp_occupied(grid_row, grid_col, current_player):
-                                                    if place_in_camp(grid_row, grid_col, pawn_grid, current_player):
-                                                        pawn_grid[selected_row][selected_col] = 0
-                                                        send_move((selected_row, selected_col), (grid_row, grid_col))
-                                                        winner = check_katarenga_victory()
-                                                        if winner > 0 and not victory_message_sent:
-                                                            game_over = True
-                                                            game_ended = True
-                                                            victory_shown = False
-                                                            victory_message_sent = True
-                                                            print(f"🏆 Victoire Katarenga par placement: Joueur {winner}")
-                                                            network_manager.send_message("victory", {"winner": winner})
-                                                        else:
-                                                            # CORRECTION : Changer le tour après placement dans un camp
-                                                            current_player = opponent_player
-                                                            print(f"Tour passé à joueur {current_player} après placement camp")
-                                                        selected_pawn = None
-                                                        possible_moves = []
-                                                        continue
+                                                if not state.is_camp_occupied(grid_row, grid_col):
+                                                    state.move_coords(selected_pawn, (grid_row, grid_col))
+                                                    pawn_grid = state.to_pawn_grid()
+                                                    send_move((selected_row, selected_col), (grid_row, grid_col), sync_hash())
+                                                    winner = state.camps_winner()
+                                                    if winner > 0 and not victory_message_sent:
+                                                        game_over = True
+                                                        game_ended = True
+                                                        victory_shown = False
+                                                        victory_message_sent = True
+                                                        print(f"🏆 Victoire Katarenga par placement: Joueur {winner}")
+                                                        network_manager.send_message("victory", {"winner": winner})
+                                                    else:
+                                                        # CORRECTION : Changer le tour après placement dans un camp
+                                                        current_player = opponent_player
+                                                        print(f"Tour passé à joueur {current_player} après placement camp")
+                                                    selected_pawn = None
+                                                    possible_moves = []
+                                                    continue
                                                 else:
                                                     # Camp déjà occupé - annuler la sélection
                                                     print("❌ Camp déjà occupé !")
@@ -841,23 +978,19 @@ def start_network_game(screen, network_manager):
                                             pawn_grid[selected_row][selected_col]
                                         )
                                         
-                                        send_move((selected_row, selected_col), (grid_row, grid_col))
+                                        send_move((selected_row, selected_col), (grid_row, grid_col),
+                                                  sync_hash_after(selected_pawn, (grid_row, grid_col)))
                                         
                                         # Congress - exécution immédiate
                                         if current_game_mode == 1:
-                                            pawn_grid[grid_row][grid_col] = pawn_grid[selected_row][selected_col]
-                                            pawn_grid[selected_row][selected_col] = 0
+                                            state.move_coords(selected_pawn, (grid_row, grid_col))
+                                            pawn_grid = state.to_pawn_grid()
                                             
                                             # Vérifier victoire
-                                            from jeux.congress import check_victory
-                                            temp_grid = [[0 for _ in range(8)] for _ in range(8)]
-                                            for row in range(1, 9):
-                                                for col in range(1, 9):
-                                                    temp_grid[row-1][col-1] = pawn_grid[row][col]
-                                            
-                                            winner, connected_pawns_temp = check_victory(temp_grid)
+                                            connectivity.apply_move(selected_pawn, (grid_row, grid_col), current_player)
+                                            winner, connected_result = connectivity.winner()
                                             if winner > 0:
-                                                connected_pawns = [(row+1, col+1) for row, col in connected_pawns_temp]
+                                                connected_pawns = connected_result
                                                 game_over = True
                                                 game_ended = True
                                                 victory_shown = False
@@ -883,7 +1016,7 @@ def start_network_game(screen, network_manager):
                                     # Sélectionner autre pion
                                     elif pawn_grid[grid_row][grid_col] == my_player:
                                         selected_pawn = (grid_row, grid_col)
-                                        possible_moves = get_valid_moves(grid_row, grid_col, board_grid, pawn_grid, current_game_mode)
+                                        possible_moves = state.moves_from(grid_row, grid_col)
                                     
                                     # Annuler
                                     else:
@@ -894,7 +1027,7 @@ def start_network_game(screen, network_manager):
                                 else:
                                     if pawn_grid[grid_row][grid_col] == my_player:
                                         selected_pawn = (grid_row, grid_col)
-                                        possible_moves = get_valid_moves(grid_row, grid_col, board_grid, pawn_grid, current_game_mode)
+                                        possible_moves = state.moves_from(grid_row, grid_col)
         
         # Vérifier connexion
         if not network_manager.is_connected and not game_over:
@@ -903,8 +1036,12 @@ def start_network_game(screen, network_manager):
             victory_shown = False
             # Pas de winner = "Partie interrompue"
         
-        pygame.display.flip()
-        clock.tick(60)
+        profiler.draw(screen)
+        with profiler.section("affichage"):
+            pygame.display.flip()
+        with profiler.section(WAIT_SECTION):
+            clock.tick(60)
+        profiler.end_frame()
     
     # Envoyer déconnexion à la sortie
     if network_manager.is_connected:
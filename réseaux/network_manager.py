@@ -1,7 +1,16 @@
 import socket
 import threading
-import json
 import time
+import queue
+from réseaux.framing import FrameReader, FrameError, encode_frame
+from réseaux.protocol import BINARY, SUPPORTED_PROTOCOLS, choose_protocol, decode_message, encode_message
+
+# Messages reçus en attente de traitement par la boucle de jeu : quand la file
+# est pleine, le thread de réception attend, et TCP ralentit l'émetteur
+RECEIVE_QUEUE_SIZE = 256
+
+# Attente du "hello" de l'hôte après la connexion (secondes)
+HELLO_TIMEOUT = 2.0
 
 class NetworkManager:
     def __init__(self):
@@ -9,8 +18,18 @@ class NetworkManager:
         self.is_server = False
         self.is_connected = False
         self.connection = None
-        self.received_messages = []
-        self.message_lock = threading.Lock()
+        self.received_messages = queue.Queue(maxsize=RECEIVE_QUEUE_SIZE)
+        # Une trame est envoyée en entier avant la suivante
+        self.send_lock = threading.Lock()
+        # Protocole binaire (réseaux/protocol.py) : activé quand l'autre côté l'annonce dans "hello"
+        self.binary = False
+        self.pings_sent = 0
+        self.latency = None
+        # Serveur dédié (réseaux/server.py) : salon d'attente puis rôle attribué
+        self.hello_received = threading.Event()
+        self.match_found = threading.Event()
+        self.lobby = False
+        self.match = None
         
     def start_server(self, port=12345):
         """Démarre le serveur pour attendre une connexion"""
@@ -25,60 +44,122 @@ class NetworkManager:
             print("En attente de connexion...")
             
             # Attendre une connexion (bloquant)
-            self.connection, addr = self.socket.accept()
-            self.is_connected = True
+            connection, addr = self.socket.accept()
             print(f"Connexion établie avec {addr}")
             
-            # Démarrer le thread de réception
-            receive_thread = threading.Thread(target=self._receive_messages)
-            receive_thread.daemon = True
-            receive_thread.start()
-            
+            self.attach(connection)
             return True
             
         except Exception as e:
             print(f"Erreur lors du démarrage du serveur: {e}")
             return False
     
-    def connect_to_server(self, host, port=12345):
-        """Se connecte à un serveur"""
+    def connect_to_server(self, host, port=12345, mode=0):
+        """
+        Se connecte à un serveur : un joueur qui héberge, ou le serveur dédié,
+        qui cherche un adversaire pour ce mode de jeu et attribue le rôle
+        (is_server) ; l'appel attend alors jusqu'à l'appariement.
+        """
         try:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.socket.connect((host, port))
-            self.connection = self.socket
-            self.is_connected = True
             self.is_server = False
             
             print(f"Connecté au serveur {host}:{port}")
             
-            # Démarrer le thread de réception
-            receive_thread = threading.Thread(target=self._receive_messages)
-            receive_thread.daemon = True
-            receive_thread.start()
-            
+            self.attach(self.socket)
+            if self.hello_received.wait(HELLO_TIMEOUT) and self.lobby:
+                print("Serveur dédié : recherche d'un adversaire...")
+                self.send_message("lobby_join", {"mode": mode})
+                while self.is_connected and not self.match_found.wait(0.2):
+                    pass
+                if not self.match_found.is_set():
+                    return False
+                print(f"Adversaire trouvé (partie {self.match.get('match')}, rôle {self.match['role']})")
             return True
             
         except Exception as e:
             print(f"Erreur lors de la connexion: {e}")
             return False
     
+    def attach(self, connection):
+        """Utilise une socket déjà connectée et démarre le thread de réception"""
+        if connection.family in (socket.AF_INET, socket.AF_INET6):
+            # Petits messages (coups) : envoyés tout de suite, sans attendre Nagle
+            connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.connection = connection
+        self.is_connected = True
+        receive_thread = threading.Thread(target=self._receive_messages)
+        receive_thread.daemon = True
+        receive_thread.start()
+        # Négociation : chaque côté annonce ses protocoles (toujours en JSON)
+        self.send_message("hello", {"protocols": SUPPORTED_PROTOCOLS})
+    
     def _receive_messages(self):
-        """Thread pour recevoir les messages en continu"""
+        """
+        Thread pour recevoir les messages en continu.
+        Chaque message est une trame (longueur + JSON) : un message peut
+        arriver en plusieurs morceaux, ou plusieurs messages en un seul recv.
+        """
+        from assets.event_loop import wake
+        reader = FrameReader()
         while self.is_connected:
             try:
-                data = self.connection.recv(1024)
-                if not data:
+                if not reader.recv_from(self.connection):
                     break
+                received = False
+                for payload in reader.frames():
+                    message = decode_message(payload)
+                    if not self._handle_control(message):
+                        self._queue_message(message)
+                        received = True
+                # Réveiller la boucle d'affichage qui attend les événements
+                if received:
+                    wake()
                     
-                message = data.decode('utf-8')
-                with self.message_lock:
-                    self.received_messages.append(json.loads(message))
-                    
-            except Exception as e:
-                print(f"Erreur lors de la réception: {e}")
+            except (OSError, ValueError, FrameError, KeyError, TypeError) as e:
+                # KeyError / TypeError : trame valide mais pas un message {"type", "data"}
+                if self.is_connected:
+                    print(f"Erreur lors de la réception: {e}")
                 break
         
         self.is_connected = False
+        wake()
+    
+    def _handle_control(self, message):
+        """Messages du transport (négociation, ping), traités sans passer par la boucle de jeu"""
+        message_type = message['type']
+        if message_type == 'hello':
+            self.binary = choose_protocol(message['data'].get('protocols', [])) == BINARY
+            self.lobby = bool(message['data'].get('lobby'))
+            self.hello_received.set()
+        elif message_type == 'match_found':
+            # Le serveur dédié joue le rôle d'hôte : "server" = joueur 1
+            self.match = message['data']
+            self.is_server = self.match['role'] == 'server'
+            self.match_found.set()
+        elif message_type == 'ping':
+            self.send_message('pong', message['data'])
+        elif message_type == 'pong':
+            self.latency = time.time() - message['data']['sent']
+        else:
+            return False
+        return True
+    
+    def ping(self):
+        """Mesure l'aller-retour : latency est mis à jour à la réception du pong"""
+        self.pings_sent += 1
+        return self.send_message('ping', {'id': self.pings_sent, 'sent': time.time()})
+    
+    def _queue_message(self, message):
+        """Ajoute un message à la file ; attend tant qu'elle est pleine et la connexion ouverte"""
+        while self.is_connected:
+            try:
+                self.received_messages.put(message, timeout=0.1)
+                return
+            except queue.Full:
+                from assets.event_loop import wake
+                wake()
     
     def send_message(self, message_type, data):
         """Envoie un message à l'autre joueur"""
@@ -86,14 +167,10 @@ class NetworkManager:
             return False
             
         try:
-            message = {
-                'type': message_type,
-                'data': data,
-                'timestamp': time.time()
-            }
-            
-            json_message = json.dumps(message)
-            self.connection.send(json_message.encode('utf-8'))
+            # Binaire si négocié et si ce message a un codage binaire, JSON sinon
+            frame = encode_frame(encode_message(message_type, data, self.binary))
+            with self.send_lock:
+                self.connection.sendall(frame)
             return True
             
         except Exception as e:
@@ -102,10 +179,12 @@ class NetworkManager:
     
     def get_messages(self):
         """Récupère tous les messages reçus"""
-        with self.message_lock:
-            messages = self.received_messages.copy()
-            self.received_messages.clear()
-            return messages
+        messages = []
+        while True:
+            try:
+                messages.append(self.received_messages.get_nowait())
+            except queue.Empty:
+                return messages
     
     def disconnect(self):
         """Ferme la connexion"""
@@ -125,4 +204,4 @@ class NetworkManager:
             temp_socket.close()
             return local_ip
         except:
-            return "127.0.0.1"
\ No newline at end of file
+            return "127.0.0.1"
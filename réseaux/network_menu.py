@@ -4,6 +4,7 @@ import threading
 from pathlib import Path
 from assets.colors import Colors
 from assets.audio_manager import audio_manager  #  NOUVEAU IMPORT AUDIO
+from assets.asset_cache import asset_cache
 from réseaux.network_manager import NetworkManager
 
 def show_network_menu(screen):
@@ -15,7 +16,7 @@ def show_network_menu(screen):
     
     # Couleurs et ressources
     script_dir = Path(__file__).parent.parent.absolute()
-    background_image = pygame.image.load(str(script_dir / "assets" / "img" / "fond.png"))
+    background_path = script_dir / "assets" / "img" / "fond.png"
     
     WHITE = Colors.WHITE
     BLACK = Colors.BLACK
@@ -75,7 +76,9 @@ def show_network_menu(screen):
     def connect_to_server_thread(host_ip):
         """Se connecte au serveur dans un thread séparé"""
         nonlocal status_message, mode
-        if network_manager.connect_to_server(host_ip):
+        # Un serveur dédié apparie les joueurs du mode choisi
+        import plateau.game_modes
+        if network_manager.connect_to_server(host_ip, mode=plateau.game_modes.GLOBAL_SELECTED_GAME):
             status_message = "Connexion établie !"
             mode = "connected"
         else:
@@ -87,7 +90,7 @@ def show_network_menu(screen):
     
     while running:
         # Affichage du fond
-        background_scaled = pygame.transform.scale(background_image, screen.get_size())
+        background_scaled = asset_cache.scaled(background_path, screen.get_size())
         screen.blit(background_scaled, (0, 0))
         
         # Menu principal
@@ -195,7 +198,8 @@ def show_network_menu(screen):
         
         # Mode connexion en cours
         elif mode == "connecting":
-            title = title_font.render("Connexion en cours...", True, BLACK)
+            waiting = network_manager.lobby and not network_manager.match_found.is_set()
+            title = title_font.render("En attente d'un adversaire..." if waiting else "Connexion en cours...", True, BLACK)
             title_rect = title.get_rect(center=(WIDTH // 2, HEIGHT // 2))
             
             bg_surface = pygame.Surface((title_rect.width + 20, title_rect.height + 10), pygame.SRCALPHA)
@@ -2,8 +2,10 @@ import pygame
 import sys
 from pathlib import Path
 from quadrant.quadrant_viewer import load_quadrants
+from quadrant.repository import quadrant_repository
 from assets.colors import Colors
 from assets.audio_manager import audio_manager
+from assets.asset_cache import asset_cache
 
 def show_network_quadrant_setup(screen, network_manager, is_server):
     """
@@ -28,7 +30,7 @@ def show_network_quadrant_setup(screen, network_manager, is_server):
     
     # Couleurs
     script_dir = Path(__file__).parent.parent.absolute()
-    background_image = pygame.image.load(str(script_dir / "assets" / "img" / "fond.png"))
+    background_path = script_dir / "assets" / "img" / "fond.png"
     WHITE = Colors.WHITE
     BLACK = Colors.BLACK
     LIGHT_GRAY = Colors.LIGHT_GRAY
@@ -53,7 +55,7 @@ def show_network_quadrant_setup(screen, network_manager, is_server):
         if image_path:
             path_obj = Path(image_path)
             if path_obj.exists():
-                img = pygame.image.load(str(path_obj))
+                img = asset_cache.image(path_obj)
                 quadrant_images[quadrant_id] = img
     
     # Configuration de l'interface
@@ -169,26 +171,9 @@ def show_network_quadrant_setup(screen, network_manager, is_server):
                 pygame.draw.rect(screen, (150, 0, 0), rot_rect, 1)
                 screen.blit(rot_text, (slot_rect.left + 8, slot_rect.bottom - rot_text.get_height() - 8))
     
-    def apply_rotation_to_grid(grid, rotation):
-        """Applique une rotation à une grille"""
-        rotated_grid = [row.copy() for row in grid]
-        num_rotations = rotation // 90
-        for _ in range(num_rotations):
-            rows = len(rotated_grid)
-            cols = len(rotated_grid[0])
-            new_grid = [[0 for _ in range(rows)] for _ in range(cols)]
-            for i in range(rows):
-                for j in range(cols):
-                    new_grid[j][rows - 1 - i] = rotated_grid[i][j]
-            rotated_grid = new_grid
-        return rotated_grid
-    
     def get_quadrant_grid(quadrant_id, rotation):
-        """Obtient la grille du quadrant avec rotation"""
-        if quadrant_id in quadrants:
-            original_grid = quadrants[quadrant_id].get("grid", [])
-            return apply_rotation_to_grid(original_grid, rotation)
-        return []
+        """Obtient la grille du quadrant avec rotation (rotations préparées par le dépôt)"""
+        return quadrant_repository.grid(quadrant_id, rotation)
     
     def send_my_quadrants():
         """Envoie la configuration de mes quadrants à l'adversaire"""
@@ -228,7 +213,7 @@ def show_network_quadrant_setup(screen, network_manager, is_server):
     clock = pygame.time.Clock()
     
     while running:
-        background_scaled = pygame.transform.scale(background_image, screen.get_size())
+        background_scaled = asset_cache.scaled(background_path, screen.get_size())
         screen.blit(background_scaled, (0, 0))
         
         # Titre
@@ -458,25 +443,8 @@ def build_final_board_config(my_quadrants, my_rotations, opponent_config, is_ser
     """
     print(f"🔧 Construction du plateau - Je suis {'serveur' if is_server else 'client'}")
     
-    def apply_rotation_to_grid(grid, rotation):
-        rotated_grid = [row.copy() for row in grid]
-        num_rotations = rotation // 90
-        for _ in range(num_rotations):
-            rows = len(rotated_grid)
-            cols = len(rotated_grid[0])
-            new_grid = [[0 for _ in range(rows)] for _ in range(cols)]
-            for i in range(rows):
-                for j in range(cols):
-                    new_grid[j][rows - 1 - i] = rotated_grid[i][j]
-            rotated_grid = new_grid
-        return rotated_grid
-    
     def get_quadrant_grid(quadrant_id, rotation):
-        quadrants = load_quadrants()
-        if quadrant_id in quadrants:
-            original_grid = quadrants[quadrant_id].get("grid", [])
-            return apply_rotation_to_grid(original_grid, rotation)
-        return []
+        return quadrant_repository.grid(quadrant_id, rotation)
     
     # Construire ma configuration
     my_grids = []
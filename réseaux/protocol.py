@@ -0,0 +1,308 @@
+import json
+import struct
+import time
+
+# Protocoles proposés à la connexion, du préféré au moins bon. Chaque côté
+# envoie "hello" avec sa liste ; le binaire n'est utilisé que si l'autre
+# côté l'annonce aussi. Les messages JSON restent toujours lisibles : ceux
+# envoyés avant la réponse, et ceux que le binaire ne sait pas coder.
+# Version 2 : clé de l'état après le coup dans move et placement, instantané (resync)
+PROTOCOL_VERSION = 2
+BINARY = f"binary/{PROTOCOL_VERSION}"
+JSON = "json"
+SUPPORTED_PROTOCOLS = [BINARY, JSON]
+
+# Un message JSON commence par "{" ; un message binaire par son code (< 0x20)
+JSON_START = ord("{")
+
+# Codes des messages binaires
+OP_MOVE = 0x01
+OP_PLACEMENT = 0x02
+OP_VICTORY = 0x03
+OP_VICTORY_RECEIVED = 0x04
+OP_QUADRANT_CONFIG = 0x05
+OP_PING = 0x06
+OP_PONG = 0x07
+OP_SNAPSHOT = 0x08
+
+# Cases du plateau 10x10 codées sur un octet (ligne * 10 + colonne)
+BOARD_SIZE = 10
+
+# move : départ, arrivée, joueur (bit 7 : change_turn, bit 6 : suivi de la clé)
+MOVE = struct.Struct("!BBBB")
+# placement (Isolation) : case, joueur (bit 6 : suivi de la clé)
+PLACEMENT = struct.Struct("!BBB")
+# clé de l'état après le coup (hash), après move ou placement
+HASH = struct.Struct("!Q")
+# victory / victory_received : gagnant
+WINNER = struct.Struct("!BB")
+# ping / pong : numéro et heure d'envoi
+PING = struct.Struct("!BId")
+# quadrant_config : serveur ou client, nombre de quadrants
+CONFIG = struct.Struct("!BBB")
+# puis pour chaque quadrant : position sur le plateau, quart de tour, 16 cases, longueur de l'identifiant
+CONFIG_QUADRANT = struct.Struct("!BB16BB")
+
+CHANGE_TURN = 0x80
+WITH_HASH = 0x40
+
+
+def encode_square(position):
+    row, col = position
+    if not (0 <= row < BOARD_SIZE and 0 <= col < BOARD_SIZE):
+        raise ValueError(f"Case hors plateau : {position}")
+    return row * BOARD_SIZE + col
+
+
+def decode_square(square):
+    return list(divmod(square, BOARD_SIZE))
+
+
+def _encode_hash(data):
+    """(bit du joueur, octets) pour le champ hash facultatif"""
+    if "hash" not in data:
+        return 0, b""
+    if type(data["hash"]) is not int:
+        raise TypeError("hash doit être un entier")
+    return WITH_HASH, HASH.pack(data["hash"])
+
+
+def _decode_player(payload, size, player, data):
+    """Joueur sans ses bits ; ajoute hash à data s'il suit le message"""
+    expected = size + (HASH.size if player & WITH_HASH else 0)
+    if len(payload) != expected:
+        raise ValueError(f"Message de {len(payload)} octets au lieu de {expected}")
+    if player & WITH_HASH:
+        (data["hash"],) = HASH.unpack_from(payload, size)
+    return player & ~(CHANGE_TURN | WITH_HASH)
+
+
+def _encode_quadrant_config(data):
+    if set(data) != {"player", "quadrants", "quadrant_indices", "selected_ids", "rotations"}:
+        return None
+    count = len(data["quadrants"])
+    if not (len(data["quadrant_indices"]) == len(data["selected_ids"]) == len(data["rotations"]) == count):
+        return None
+    parts = [CONFIG.pack(OP_QUADRANT_CONFIG, data["player"] == "server", count)]
+    for grid, index, quadrant_id, rotation in zip(data["quadrants"], data["quadrant_indices"],
+                                                  data["selected_ids"], data["rotations"]):
+        cells = [cell for row in grid for cell in row]
+        name = quadrant_id.encode("utf-8")
+        if len(grid) != 4 or len(cells) != 16 or rotation % 90:
+            return None
+        parts.append(CONFIG_QUADRANT.pack(index, rotation // 90, *cells, len(name)))
+        parts.append(name)
+    return b"".join(parts)
+
+
+def _decode_quadrant_config(payload):
+    _, server, count = CONFIG.unpack_from(payload)
+    offset = CONFIG.size
+    data = {"player": "server" if server else "client", "quadrants": [],
+            "quadrant_indices": [], "selected_ids": [], "rotations": []}
+    for _ in range(count):
+        index, quarter, *values = CONFIG_QUADRANT.unpack_from(payload, offset)
+        cells, name_length = values[:16], values[16]
+        offset += CONFIG_QUADRANT.size
+        data["quadrants"].append([list(cells[row * 4:row * 4 + 4]) for row in range(4)])
+        data["quadrant_indices"].append(index)
+        data["selected_ids"].append(bytes(payload[offset:offset + name_length]).decode("utf-8"))
+        data["rotations"].append(quarter * 90)
+        offset += name_length
+    return data
+
+
+def encode_binary(message_type, data):
+    """
+    Message binaire, ou None si ce type (ou ce contenu) n'a pas de codage
+    binaire : il est alors envoyé en JSON.
+    Le codage binaire ne perd rien : les données décodées sont celles
+    qu'aurait données le JSON (listes pour les positions), sans l'heure
+    d'envoi que personne ne lit.
+    """
+    try:
+        if message_type == "move" and set(data) - {"change_turn", "hash"} == {"from", "to", "player"}:
+            # change_turn : absent ou True (bit 7), toute autre valeur passe en JSON
+            if "change_turn" in data and data["change_turn"] is not True:
+                return None
+            if not 0 <= data["player"] < WITH_HASH:
+                return None
+            flags, key = _encode_hash(data)
+            if "change_turn" in data:
+                flags |= CHANGE_TURN
+            return MOVE.pack(OP_MOVE, encode_square(data["from"]), encode_square(data["to"]), data["player"] | flags) + key
+        if message_type == "placement" and set(data) - {"hash"} == {"position", "player"}:
+            if not 0 <= data["player"] < WITH_HASH:
+                return None
+            flags, key = _encode_hash(data)
+            return PLACEMENT.pack(OP_PLACEMENT, encode_square(data["position"]), data["player"] | flags) + key
+        if message_type in ("victory", "victory_received") and set(data) == {"winner"}:
+            opcode = OP_VICTORY if message_type == "victory" else OP_VICTORY_RECEIVED
+            return WINNER.pack(opcode, data["winner"])
+        if message_type in ("ping", "pong") and set(data) == {"id", "sent"}:
+            return PING.pack(OP_PING if message_type == "ping" else OP_PONG, data["id"], data["sent"])
+        if message_type == "quadrant_config":
+            return _encode_quadrant_config(data)
+        if message_type == "resync" and set(data) == {"snapshot"}:
+            # Instantané en hexadécimal minuscule (comme bytes.hex) : envoyé tel quel en binaire
+            snapshot = bytes.fromhex(data["snapshot"])
+            if snapshot.hex() != data["snapshot"]:
+                return None
+            return bytes([OP_SNAPSHOT]) + snapshot
+    except (struct.error, ValueError, TypeError, AttributeError):
+        pass
+    return None
+
+
+def decode_binary(payload):
+    opcode = payload[0]
+    if opcode == OP_MOVE:
+        _, from_square, to_square, player = MOVE.unpack_from(payload)
+        data = {"from": decode_square(from_square), "to": decode_square(to_square)}
+        data["player"] = _decode_player(payload, MOVE.size, player, data)
+        if player & CHANGE_TURN:
+            data["change_turn"] = True
+        return {"type": "move", "data": data}
+    if opcode == OP_PLACEMENT:
+        _, square, player = PLACEMENT.unpack_from(payload)
+        data = {"position": decode_square(square)}
+        data["player"] = _decode_player(payload, PLACEMENT.size, player, data)
+        return {"type": "placement", "data": data}
+    if opcode in (OP_VICTORY, OP_VICTORY_RECEIVED):
+        _, winner = WINNER.unpack(payload)
+        return {"type": "victory" if opcode == OP_VICTORY else "victory_received", "data": {"winner": winner}}
+    if opcode in (OP_PING, OP_PONG):
+        _, number, sent = PING.unpack(payload)
+        return {"type": "ping" if opcode == OP_PING else "pong", "data": {"id": number, "sent": sent}}
+    if opcode == OP_QUADRANT_CONFIG:
+        return {"type": "quadrant_config", "data": _decode_quadrant_config(payload)}
+    if opcode == OP_SNAPSHOT:
+        return {"type": "resync", "data": {"snapshot": bytes(payload[1:]).hex()}}
+    raise ValueError(f"Code de message inconnu : {opcode}")
+
+
+def encode_json(message_type, data):
+    return json.dumps({"type": message_type, "data": data, "timestamp": time.time()}).encode("utf-8")
+
+
+def encode_message(message_type, data, binary=False):
+    """Contenu d'une trame : binaire si négocié et possible, JSON sinon"""
+    if binary:
+        payload = encode_binary(message_type, data)
+        if payload is not None:
+            return payload
+    return encode_json(message_type, data)
+
+
+def decode_message(payload):
+    """Message {"type", "data"...} depuis le contenu d'une trame (binaire ou JSON)"""
+    if payload and payload[0] != JSON_START:
+        try:
+            return decode_binary(payload)
+        except (struct.error, IndexError) as e:
+            raise ValueError(f"Message binaire invalide : {e}")
+    return json.loads(payload)
+
+
+def choose_protocol(offered):
+    """Premier protocole de notre liste que l'autre côté propose aussi"""
+    for protocol in SUPPORTED_PROTOCOLS:
+        if protocol in offered:
+            return protocol
+    return JSON
+
+
+# --- Mesure : octets par partie et coût de codage -----------------------------
+
+def game_messages(mode, seed=0):
+    """
+    Messages d'une partie en réseau (dans les deux sens), comme les envoie
+    network_game : négociation, mode, quadrants, coups d'une partie au
+    hasard, victoire et déconnexion.
+    """
+    import random
+    from headless.simulator import load_quadrant_grids, MAX_PLIES
+    from plateau.game_logic import create_game_board, initialize_pawns_for_game_mode
+    from plateau.game_state import GameState, is_placement
+    from réseaux.sync import board_key, state_hash
+    rng = random.Random(seed)
+    grids = load_quadrant_grids()
+    configs = []
+    for player, indices in (("server", [0, 1]), ("client", [2, 3])):
+        chosen = [rng.randrange(len(grids)) for _ in indices]
+        configs.append({"player": player, "quadrants": [grids[i] for i in chosen], "quadrant_indices": indices,
+                        "selected_ids": [f"quadrant_{i + 1}" for i in chosen], "rotations": [0, 90]})
+    messages = [("hello", {"protocols": SUPPORTED_PROTOCOLS}), ("hello", {"protocols": SUPPORTED_PROTOCOLS}),
+                ("game_mode", {"mode": mode}), ("game_mode_confirm", {"mode": mode}),
+                ("quadrant_config", configs[0]), ("quadrant_config", configs[1]),
+                ("game_start", {"ready": True}), ("game_start_confirm", {"ready": True})]
+
+    board = create_game_board([config["quadrants"][i] for config in configs for i in (0, 1)])
+    state = GameState.from_grids(board, initialize_pawns_for_game_mode(mode), mode)
+    board_hash = board_key(board)
+    winner = 0
+    while len(state.undo_stack) < MAX_PLIES:
+        player = state.side
+        moves = state.legal_moves(player)
+        if not moves:
+            winner = 3 - player
+            break
+        move = rng.choice(moves)
+        from_pos, to_pos = divmod(move[0], BOARD_SIZE), divmod(move[1], BOARD_SIZE)
+        state.make_move(move, player)
+        key = state_hash(state, board_hash)
+        if is_placement(move):
+            messages.append(("placement", {"position": to_pos, "player": player, "hash": key}))
+        else:
+            messages.append(("move", {"from": from_pos, "to": to_pos, "player": player, "change_turn": True,
+                                      "hash": key}))
+        over, winner = state.winner()
+        if over:
+            break
+    messages += [("victory", {"winner": winner}), ("victory_received", {"winner": winner}), ("disconnect", {})]
+    return messages
+
+
+def benchmark(games=30, repeat=20000):
+    """
+    Octets par partie (trames comprises) en JSON seul et avec le binaire
+    négocié, et coût de codage + décodage d'un coup.
+    """
+    from réseaux.framing import HEADER
+    results = {}
+    for mode, name in enumerate(("Katarenga", "Congress", "Isolation")):
+        totals = {"json": 0, "binaire": 0, "messages": 0}
+        for seed in range(games):
+            for message_type, data in game_messages(mode, seed):
+                json_payload = encode_json(message_type, data)
+                binary_payload = encode_message(message_type, data, binary=True)
+                expected = json.loads(json_payload)
+                decoded = decode_message(binary_payload)
+                if decoded["type"] != expected["type"] or decoded["data"] != expected["data"]:
+                    raise AssertionError(f"Décodage différent pour {message_type}: {decoded} != {expected}")
+                totals["json"] += HEADER.size + len(json_payload)
+                totals["binaire"] += HEADER.size + len(binary_payload)
+                totals["messages"] += 1
+        results[name] = {key: value / games for key, value in totals.items()}
+
+    move = {"from": (3, 4), "to": (5, 6), "player": 1, "change_turn": True, "hash": 0x0123456789ABCDEF}
+    timings = {}
+    for label, binary in (("json", False), ("binaire", True)):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            decode_message(encode_message("move", move, binary))
+        timings[label] = (time.perf_counter() - start) / repeat
+    return results, timings
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Protocole réseau : octets par partie et coût du codage, JSON contre binaire")
+    parser.add_argument("--games", type=int, default=30)
+    args = parser.parse_args()
+    results, timings = benchmark(args.games)
+    for name, totals in results.items():
+        print(f"{name:10} {totals['messages']:6.0f} messages/partie : JSON {totals['json']:8.0f} octets, "
+              f"binaire {totals['binaire']:7.0f} octets ({totals['json'] / totals['binaire']:.1f}x moins)")
+    print(f"coup codé + décodé : JSON {1e6 * timings['json']:.2f} us, binaire {1e6 * timings['binaire']:.2f} us "
+          f"({timings['json'] / timings['binaire']:.1f}x plus rapide)")
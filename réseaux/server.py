@@ -0,0 +1,424 @@
+import asyncio
+import itertools
+from collections import deque
+from réseaux.framing import HEADER, MAX_FRAME_SIZE, encode_frame
+from réseaux.protocol import BINARY, JSON_START, SUPPORTED_PROTOCOLS, choose_protocol, decode_message, encode_message
+from réseaux.sync import encode_snapshot
+from réseaux.validation import MoveValidator, parse_move
+
+# Serveur dédié sans affichage : héberge de nombreuses parties en même temps.
+#   python -m réseaux.server [--host 0.0.0.0] [--port 12345]
+# Les clients pygame s'y connectent par « Rejoindre une partie » : le serveur
+# les apparie par mode de jeu dans un salon, leur attribue un rôle (serveur
+# = joueur 1, client = joueur 2) puis relaie leurs messages, comme le ferait
+# un hôte. Les coups et placements sont vérifiés avec GameState, le moteur
+# de règles du jeu ; un coup refusé n'est pas transmis à l'adversaire.
+# Une victoire annoncée n'est relayée que si GameState la confirme, et les
+# resynchronisations sont servies depuis l'état du serveur, jamais depuis
+# l'instantané d'un client.
+
+DEFAULT_PORT = 12345
+MODE_NAMES = ["Katarenga", "Congress", "Isolation"]
+
+# Quadrants configurés par chaque joueur (network_quadrant_setup) : le joueur 1
+# ceux du haut, le joueur 2 ceux du bas
+QUADRANT_INDICES = {1: (0, 1), 2: (2, 3)}
+
+# Au-delà, le serveur attend que le client lise avant de lui envoyer la suite
+WRITE_BUFFER_LIMIT = 256 * 1024
+
+
+class Client:
+    """Connexion d'un joueur"""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.binary = False
+        self.match = None
+        self.player = 0
+
+    def send(self, message_type, data):
+        self.writer.write(encode_frame(encode_message(message_type, data, self.binary)))
+
+    def forward(self, payload, message):
+        """Relaie un message reçu de l'adversaire, recodé en JSON si ce client ne lit pas le binaire"""
+        if payload and payload[0] != JSON_START and not self.binary:
+            payload = encode_message(message["type"], message["data"])
+        self.writer.write(encode_frame(payload))
+
+
+class Match:
+    """
+    Partie entre deux clients. L'état de référence (GameState) est créé
+    quand les deux configurations de quadrants sont reçues ; les coups
+    légaux du joueur au trait sont calculés une fois par tour.
+    """
+
+    def __init__(self, number, mode, first, second):
+        self.number = number
+        self.mode = mode
+        self.players = {1: first, 2: second}
+        self.quadrants = [None, None, None, None]
+        self.board = None
+        self.state = None
+        self.validator = None
+        self.over = False
+        self.winner = 0
+        self.moves = 0
+        for player, client in self.players.items():
+            client.match = self
+            client.player = player
+
+    def opponent(self, client):
+        return self.players[3 - client.player]
+
+    def add_quadrant_config(self, client, data):
+        """
+        Quadrants d'un joueur, placés selon quadrant_indices (0-1 en haut pour
+        le joueur 1, 2-3 en bas pour le joueur 2). Retourne la raison du refus,
+        ou None si la configuration est acceptée.
+        """
+        indices = data.get("quadrant_indices", [])
+        if any(index not in QUADRANT_INDICES[client.player] for index in indices):
+            return f"quadrants {QUADRANT_INDICES[client.player]} seulement"
+        if self.state is not None:
+            return "plateau déjà construit"
+        for index, grid in zip(indices, data.get("quadrants", [])):
+            self.quadrants[index] = grid
+        if all(grid is not None for grid in self.quadrants):
+            from plateau.game_logic import create_game_board, initialize_pawns_for_game_mode
+            from plateau.game_state import GameState
+            self.board = create_game_board(self.quadrants)
+            self.state = GameState.from_grids(self.board, initialize_pawns_for_game_mode(self.mode), self.mode)
+            self.validator = MoveValidator(self.state)
+        return None
+
+    def check(self, client, move, claimed_player):
+        """Raison du refus d'un coup (départ, arrivée) en cases 0-99, ou None s'il est légal"""
+        if self.state is None:
+            return "plateau pas encore construit"
+        if self.over:
+            return "partie terminée"
+        if claimed_player != client.player:
+            return "pas votre tour"
+        return self.validator.check(move, client.player)
+
+    def check_victory(self, claimed_winner):
+        """Raison du refus d'une victoire annoncée, ou None si l'état de référence la confirme"""
+        if self.state is None:
+            return "plateau pas encore construit"
+        over, winner = self.state.winner()
+        if not over:
+            return "partie pas terminée"
+        if claimed_winner != winner:
+            return f"gagnant {winner}"
+        return None
+
+    def snapshot(self):
+        """Instantané de l'état de référence (hexadécimal, comme l'envoie le joueur 1)"""
+        return encode_snapshot(self.board, self.state).hex()
+
+    def play(self, move):
+        self.state.make_move(move, self.state.side)
+        self.moves += 1
+        self.over, self.winner = self.state.winner()
+
+
+class GameServer:
+    """Salon d'attente par mode de jeu et parties en cours"""
+
+    def __init__(self, verbose=True):
+        self.verbose = verbose
+        self.waiting = {mode: deque() for mode in range(len(MODE_NAMES))}
+        self.matches = set()
+        self.match_numbers = itertools.count(1)
+        self.clients = set()
+        self.tasks = set()
+        self.stats = {"connexions": 0, "parties": 0, "messages": 0, "coups": 0, "refusés": 0}
+
+    def log(self, text):
+        if self.verbose:
+            print(text)
+
+    async def handle(self, reader, writer):
+        client = Client(reader, writer)
+        self.clients.add(client)
+        self.tasks.add(asyncio.current_task())
+        self.stats["connexions"] += 1
+        client.send("hello", {"protocols": SUPPORTED_PROTOCOLS, "lobby": True})
+        try:
+            while True:
+                (length,) = HEADER.unpack(await reader.readexactly(HEADER.size))
+                if length > MAX_FRAME_SIZE:
+                    break
+                payload = await reader.readexactly(length)
+                self.dispatch(client, payload)
+                # Adversaire qui ne lit plus : ralentir la lecture de ce client
+                if client.match is not None:
+                    peer = client.match.opponent(client)
+                    if peer.writer.transport.get_write_buffer_size() > WRITE_BUFFER_LIMIT:
+                        try:
+                            await peer.writer.drain()
+                        except ConnectionError:
+                            pass
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError, KeyError, TypeError):
+            pass
+        finally:
+            self.leave(client)
+            self.clients.discard(client)
+            self.tasks.discard(asyncio.current_task())
+            writer.close()
+
+    def dispatch(self, client, payload):
+        message = decode_message(payload)
+        message_type = message["type"]
+        self.stats["messages"] += 1
+        if message_type == "hello":
+            client.binary = choose_protocol(message["data"].get("protocols", [])) == BINARY
+        elif message_type == "ping":
+            client.send("pong", message["data"])
+        elif message_type == "lobby_join":
+            self.join(client, message["data"].get("mode", 0))
+        elif client.match is not None:
+            self.relay(client, payload, message)
+
+    def join(self, client, mode):
+        if client.match is not None or mode not in self.waiting:
+            client.send("lobby_error", {"reason": "mode inconnu" if mode not in self.waiting else "déjà en partie"})
+            return
+        queue = self.waiting[mode]
+        if not queue:
+            queue.append(client)
+            return
+        first = queue.popleft()
+        match = Match(next(self.match_numbers), mode, first, client)
+        self.matches.add(match)
+        self.stats["parties"] += 1
+        for role, player in (("server", 1), ("client", 2)):
+            match.players[player].send("match_found", {"role": role, "mode": mode, "match": match.number})
+        self.log(f"Partie {match.number} ({MODE_NAMES[mode]}) : {len(self.matches)} en cours")
+
+    def relay(self, client, payload, message):
+        match = client.match
+        message_type = message["type"]
+        if message_type == "quadrant_config":
+            reason = match.add_quadrant_config(client, message["data"])
+            if reason is not None:
+                self.stats["refusés"] += 1
+                client.send("quadrant_config_rejected", {"reason": reason})
+                return
+        elif message_type in ("move", "placement"):
+            move, claimed_player = parse_move(message)
+            reason = match.check(client, move, claimed_player)
+            if reason is not None:
+                self.stats["refusés"] += 1
+                client.send("move_rejected", {"type": message_type, "data": message["data"], "reason": reason})
+                return
+            match.play(move)
+            self.stats["coups"] += 1
+        elif message_type == "victory":
+            reason = match.check_victory(message["data"]["winner"])
+            if reason is not None:
+                self.stats["refusés"] += 1
+                client.send("victory_rejected", {"winner": message["data"]["winner"], "reason": reason})
+                return
+        elif message_type in ("resync", "resync_request"):
+            # Le serveur fait référence : l'instantané d'un client n'est pas relayé,
+            # celui qui constate l'écart reçoit l'état du serveur
+            if match.state is not None:
+                client.send("resync", {"snapshot": match.snapshot()})
+            return
+        match.opponent(client).forward(payload, message)
+        if message_type == "disconnect":
+            self.end_match(match)
+
+    def leave(self, client):
+        for queue in self.waiting.values():
+            if client in queue:
+                queue.remove(client)
+        match = client.match
+        if match is not None:
+            peer = match.opponent(client)
+            if peer.match is match:
+                peer.send("disconnect", {})
+            self.end_match(match)
+
+    def end_match(self, match):
+        if match not in self.matches:
+            return
+        self.matches.discard(match)
+        for client in match.players.values():
+            client.match = None
+        result = f"gagnant {match.winner}" if match.over else "interrompue"
+        self.log(f"Fin de la partie {match.number} ({match.moves} coups, {result}) : {len(self.matches)} en cours")
+
+
+    async def close(self):
+        """Arrêt : ferme les connexions et attend la fin de leurs tâches"""
+        for client in list(self.clients):
+            client.writer.close()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+
+
+async def serve(host="0.0.0.0", port=DEFAULT_PORT, verbose=True):
+    """Accepte les connexions jusqu'à Ctrl+C (ou SIGTERM)"""
+    import signal
+    game_server = GameServer(verbose)
+    server = await asyncio.start_server(game_server.handle, host, port)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signal_number in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signal_number, stop.set)
+        except (NotImplementedError, RuntimeError):
+            # Windows : Ctrl+C lève KeyboardInterrupt, attrapé par l'appelant
+            pass
+    print(f"Serveur Katarenga & Co sur {host}:{port}", flush=True)
+    async with server:
+        await stop.wait()
+    await game_server.close()
+    game_server.log(f"Arrêt du serveur : {game_server.stats}")
+
+
+# --- Mesure de charge ----------------------------------------------------------
+
+class BenchClient:
+    """Client minimal (asyncio) pour la mesure de charge"""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def connect(cls, host, port, mode):
+        reader, writer = await asyncio.open_connection(host, port)
+        client = cls(reader, writer)
+        await client.receive()  # hello du serveur
+        client.send("hello", {"protocols": SUPPORTED_PROTOCOLS}, binary=False)
+        client.send("lobby_join", {"mode": mode}, binary=False)
+        return client
+
+    def send(self, message_type, data, binary=True):
+        self.writer.write(encode_frame(encode_message(message_type, data, binary)))
+
+    async def receive(self):
+        (length,) = HEADER.unpack(await self.reader.readexactly(HEADER.size))
+        return decode_message(await self.reader.readexactly(length))
+
+
+async def bench_match(players, mode, rng, latencies, max_plies=400):
+    """Une partie au hasard entre deux BenchClient appariés ; chaque coup attend son relais"""
+    import time
+    from headless.simulator import load_quadrant_grids
+    from plateau.game_logic import create_game_board, initialize_pawns_for_game_mode
+    from plateau.game_state import GameState, is_placement
+    grids = load_quadrant_grids()
+    quadrants = [rng.choice(grids) for _ in range(4)]
+    for player, indices in ((1, [0, 1]), (2, [2, 3])):
+        players[player].send("quadrant_config", {
+            "player": "server" if player == 1 else "client", "quadrants": [quadrants[i] for i in indices],
+            "quadrant_indices": indices, "selected_ids": [f"quadrant_{i + 1}" for i in indices], "rotations": [0, 0]})
+    for player in (1, 2):
+        await players[3 - player].receive()
+    state = GameState.from_grids(create_game_board(quadrants), initialize_pawns_for_game_mode(mode), mode)
+    while len(state.undo_stack) < max_plies:
+        player = state.side
+        moves = state.legal_moves(player)
+        if not moves:
+            break
+        move = rng.choice(moves)
+        from_pos, to_pos = divmod(move[0], 10), divmod(move[1], 10)
+        start = time.perf_counter()
+        if is_placement(move):
+            players[player].send("placement", {"position": to_pos, "player": player})
+        else:
+            players[player].send("move", {"from": from_pos, "to": to_pos, "player": player, "change_turn": True})
+        message = await players[3 - player].receive()
+        latencies.append(time.perf_counter() - start)
+        if message["type"] not in ("move", "placement"):
+            raise AssertionError(f"Relais inattendu : {message}")
+        state.make_move(move, player)
+        if state.winner()[0]:
+            break
+    # Un coup illégal doit être refusé et non relayé
+    players[state.side].send("move", {"from": (0, 0), "to": (0, 0), "player": state.side, "change_turn": True})
+    rejected = await players[state.side].receive()
+    players[1].send("disconnect", {})
+    await players[2].receive()
+    for client in players.values():
+        client.writer.close()
+    return rejected["type"] == "move_rejected"
+
+
+async def run_bench(host, port, games, seed):
+    import random
+    import time
+    rng = random.Random(seed)
+    clients = []
+    for index in range(2 * games):
+        clients.append(await BenchClient.connect(host, port, index // 2 % len(MODE_NAMES)))
+    by_match = {}
+    for client in clients:
+        found = await client.receive()
+        data = found["data"]
+        by_match.setdefault(data["match"], {"mode": data["mode"]})[1 if data["role"] == "server" else 2] = client
+    latencies = []
+    start = time.perf_counter()
+    results = await asyncio.gather(*(bench_match({1: match[1], 2: match[2]}, match["mode"], random.Random(rng.random()), latencies)
+                                     for match in by_match.values()))
+    return len(by_match), all(results), latencies, time.perf_counter() - start
+
+
+def bench(games=300, port=DEFAULT_PORT + 1, seed=1):
+    """
+    Lance le serveur dans un autre processus, y joue games parties au hasard
+    en même temps (clients asyncio), et mesure le temps de relais des coups
+    et le temps CPU du serveur.
+    """
+    import os
+    import resource
+    import signal
+    import subprocess
+    import sys
+    process = subprocess.Popen([sys.executable, "-m", "réseaux.server", "--host", "127.0.0.1", "--port", str(port), "--quiet"],
+                               stdout=subprocess.PIPE, text=True,
+                               cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    process.stdout.readline()
+    try:
+        matches, rejected_ok, latencies, seconds = asyncio.run(run_bench("127.0.0.1", port, games, seed))
+    finally:
+        process.send_signal(signal.SIGINT)
+        process.wait()
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    latencies.sort()
+    return {
+        "parties": matches,
+        "coups": len(latencies),
+        "secondes": seconds,
+        "cpu_serveur": usage.ru_utime + usage.ru_stime,
+        "p50_ms": 1000 * latencies[len(latencies) // 2],
+        "p99_ms": 1000 * latencies[int(len(latencies) * 0.99)],
+        "refus_ok": rejected_ok,
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Serveur dédié Katarenga & Co (plusieurs parties en même temps)")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--quiet", action="store_true", help="ne pas afficher le début et la fin des parties")
+    parser.add_argument("--bench", type=int, metavar="PARTIES", help="mesure de charge avec PARTIES parties simultanées")
+    args = parser.parse_args()
+    if args.bench:
+        result = bench(args.bench)
+        print(f"{result['parties']} parties simultanées, {result['coups']} coups relayés en {result['secondes']:.2f} s "
+              f"({result['coups'] / result['secondes']:.0f} coups/s)")
+        print(f"relais d'un coup : p50 {result['p50_ms']:.2f} ms, p99 {result['p99_ms']:.2f} ms ; "
+              f"CPU du serveur {result['cpu_serveur']:.2f} s ; coups illégaux refusés : {'oui' if result['refus_ok'] else 'NON'}")
+    else:
+        try:
+            asyncio.run(serve(args.host, args.port, not args.quiet))
+        except KeyboardInterrupt:
+            pass
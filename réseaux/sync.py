@@ -0,0 +1,67 @@
+import struct
+
+# Synchronisation des deux joueurs d'une partie en réseau.
+# Chaque coup envoyé porte la clé de l'état qui en résulte (state_hash) :
+# celui qui le reçoit compare avec la sienne après l'avoir joué. Si elles
+# diffèrent, le joueur 1 (l'hôte) fait référence et envoie un instantané
+# binaire de sa partie (plateau, pions, camps, trait) que l'autre recharge.
+
+SNAPSHOT_VERSION = 1
+# version, mode de jeu, joueur au trait
+SNAPSHOT_HEADER = struct.Struct("!BBB")
+# Couleurs du plateau 10x10 (0 à 4) : deux cases par octet
+BOARD_CELLS = 100
+BOARD_BYTES = BOARD_CELLS // 2
+# Bitboards de 100 cases : pions du joueur 1, du joueur 2, camps occupés
+BITBOARD_BYTES = 13
+SNAPSHOT_SIZE = SNAPSHOT_HEADER.size + BOARD_BYTES + 3 * BITBOARD_BYTES
+
+
+def board_key(board_grid):
+    """Empreinte 64 bits des couleurs du plateau (fixe pendant la partie)"""
+    from plateau.layout_tables import layout_hash
+    return int(layout_hash(board_grid), 16)
+
+
+def state_hash(state, board):
+    """Clé comparée entre les joueurs : clé Zobrist de l'état (pions, camps, trait) et empreinte du plateau"""
+    return state.key ^ board
+
+
+def encode_snapshot(board_grid, state):
+    """Instantané binaire (92 octets) : plateau, pions, camps et joueur au trait"""
+    cells = [cell for row in board_grid for cell in row]
+    if len(cells) != BOARD_CELLS or not all(0 <= cell < 16 for cell in cells):
+        raise ValueError("Plateau invalide pour un instantané")
+    board = bytes(cells[i] << 4 | cells[i + 1] for i in range(0, BOARD_CELLS, 2))
+    bitboards = b"".join(bits.to_bytes(BITBOARD_BYTES, "big")
+                         for bits in (state.pawns[1], state.pawns[2], state.camps))
+    return SNAPSHOT_HEADER.pack(SNAPSHOT_VERSION, state.mode, state.side) + board + bitboards
+
+
+def decode_snapshot(payload, mode):
+    """
+    Plateau (grille 10x10) et GameState d'un instantané reçu.
+    ValueError s'il est invalide ou d'un autre mode de jeu.
+    """
+    if len(payload) != SNAPSHOT_SIZE:
+        raise ValueError(f"Instantané de {len(payload)} octets")
+    version, snapshot_mode, side = SNAPSHOT_HEADER.unpack_from(payload)
+    if version != SNAPSHOT_VERSION or snapshot_mode != mode or side not in (1, 2):
+        raise ValueError("Instantané incompatible")
+    offset = SNAPSHOT_HEADER.size
+    cells = []
+    for byte in payload[offset:offset + BOARD_BYTES]:
+        cells += (byte >> 4, byte & 0x0F)
+    if max(cells) > 4:
+        raise ValueError("Couleur de case invalide")
+    board_grid = [cells[row * 10:row * 10 + 10] for row in range(10)]
+    offset += BOARD_BYTES
+    pawns1, pawns2, camps = (int.from_bytes(payload[offset + i * BITBOARD_BYTES:offset + (i + 1) * BITBOARD_BYTES], "big")
+                             for i in range(3))
+    if max(pawns1, pawns2, camps) >> BOARD_CELLS or pawns1 & pawns2:
+        raise ValueError("Pions invalides")
+    from plateau.game_state import GameState
+    from plateau.layout_tables import get_layout_tables
+    state = GameState(get_layout_tables(board_grid), mode, [0, pawns1, pawns2], camps, side)
+    return board_grid, state
@@ -0,0 +1,118 @@
+# Vérification des coups reçus du réseau avec GameState, le moteur de règles
+# (mêmes coups que get_valid_moves, is_position_safe_isolation et les camps
+# Katarenga). Utilisée par la partie en réseau et par le serveur dédié.
+
+BOARD_SIZE = 10
+
+
+def parse_square(position):
+    """Case 0-99 depuis (ligne, colonne) ; ValueError si hors du plateau 10x10"""
+    row, col = position
+    if not (isinstance(row, int) and isinstance(col, int)
+            and 0 <= row < BOARD_SIZE and 0 <= col < BOARD_SIZE):
+        raise ValueError(f"Case invalide : {position}")
+    return row * BOARD_SIZE + col
+
+
+def parse_move(message):
+    """(départ, arrivée) en cases 0-99 et joueur annoncé, depuis un message move ou placement"""
+    data = message["data"]
+    if message["type"] == "placement":
+        square = parse_square(data["position"])
+        return (square, square), data["player"]
+    return (parse_square(data["from"]), parse_square(data["to"])), data["player"]
+
+
+class MoveValidator:
+    """
+    Coups légaux du joueur au trait, calculés une seule fois par tour :
+    vérifier un message reçu ne coûte ensuite qu'une recherche dans un
+    ensemble. L'ensemble est recalculé dès que l'état a changé (nombre de
+    coups joués ou clé Zobrist différents), sans avoir à le signaler.
+    """
+
+    def __init__(self, state):
+        self.state = state
+        self.legal = frozenset()
+        self.stamp = None
+        # Nombre de calculs de l'ensemble (mesures)
+        self.computed = 0
+
+    def legal_moves(self):
+        stamp = (len(self.state.undo_stack), self.state.key)
+        if stamp != self.stamp:
+            self.legal = frozenset(self.state.legal_moves(self.state.side))
+            self.stamp = stamp
+            self.computed += 1
+        return self.legal
+
+    def check(self, move, player):
+        """Raison du refus d'un coup (départ, arrivée) du joueur, ou None s'il est légal"""
+        if player != self.state.side:
+            return "pas votre tour"
+        # Isolation ne se joue qu'en placements (départ = arrivée), les autres modes en déplacements
+        if (move[0] == move[1]) != (self.state.mode == 2):
+            return "type de coup invalide"
+        if move not in self.legal_moves():
+            return "coup illégal"
+        return None
+
+    def check_message(self, message, player):
+        """
+        Vérifie un message move ou placement envoyé par player.
+        Retourne (coup, raison) : raison vaut None si le coup est légal.
+        """
+        try:
+            move, claimed_player = parse_move(message)
+        except (KeyError, TypeError, ValueError):
+            return None, "message invalide"
+        if claimed_player != player:
+            return move, "pas votre tour"
+        return move, self.check(move, player)
+
+
+def benchmark(messages=20000, seed=0):
+    """
+    Coût de la vérification d'un coup reçu : ensemble calculé une fois par
+    tour contre recalcul des coups légaux à chaque message.
+    Retourne {mode: (secondes par message avec cache, sans cache)}.
+    """
+    import random
+    import time
+    from headless.simulator import load_quadrant_grids
+    from plateau.game_logic import create_game_board, initialize_pawns_for_game_mode
+    from plateau.game_state import GameState
+    rng = random.Random(seed)
+    grids = load_quadrant_grids()
+    results = {}
+    for mode, name in enumerate(("Katarenga", "Congress", "Isolation")):
+        board = create_game_board([grids[rng.randrange(len(grids))] for _ in range(4)])
+        state = GameState.from_grids(board, initialize_pawns_for_game_mode(mode), mode)
+        # Position de milieu de partie
+        for _ in range(6):
+            state.make_move(rng.choice(state.legal_moves()))
+        player = state.side
+        candidates = [(rng.randrange(100), rng.randrange(100)) for _ in range(messages)]
+        if mode == 2:
+            candidates = [(sq, sq) for sq, _ in candidates]
+        validator = MoveValidator(state)
+        start = time.perf_counter()
+        for move in candidates:
+            validator.check(move, player)
+        cached = (time.perf_counter() - start) / messages
+        start = time.perf_counter()
+        for move in candidates:
+            move in set(state.legal_moves(player))
+        uncached = (time.perf_counter() - start) / messages
+        results[name] = (cached, uncached)
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Coût de la vérification d'un coup reçu du réseau")
+    parser.add_argument("--messages", type=int, default=20000)
+    args = parser.parse_args()
+    for name, (cached, uncached) in benchmark(args.messages).items():
+        print(f"{name:10} ensemble par tour {1e6 * cached:6.2f} us/message, "
+              f"recalcul {1e6 * uncached:7.2f} us/message ({uncached / cached:.0f}x)")
@@ -0,0 +1,82 @@
+import random
+import time
+from plateau.bitboard import pawn_occupancy
+from plateau.game_logic import initialize_pawns_for_game_mode
+from plateau.layout_tables import get_layout_tables
+from tests.test_move_parity import legacy_get_valid_moves, random_board, random_pawns
+
+# Mesure (pas un test) : temps de génération des coups d'un pion, ancienne
+# version par listes contre les tables du plateau (pygame requis).
+#   python -m tests.benchmark_moves
+
+
+def _best_time(run, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def benchmark(boards=20, positions=10, repeat=5, seed=5):
+    """
+    Temps par pion :
+    - listes : ancienne get_valid_moves
+    - adaptateur : plateau.pawn.get_valid_moves (tables cherchées à chaque appel)
+    - move_list : tables et bitboards des pions récupérés une fois par tour
+      (randomAi), liste de coordonnées
+    - move_mask : tables et bitboards gardés par GameState, masque des coups
+      (recherche de l'IA)
+    Pour chaque plateau : position de départ puis positions au hasard.
+    Retourne {mode: ({nom: secondes par pion}, pions)}.
+    """
+    from plateau.pawn import get_valid_moves
+    results = {}
+    for game_mode in (0, 1):
+        rng = random.Random(seed)
+        calls = []
+        for _ in range(boards):
+            board_grid = random_board(rng)
+            tables = get_layout_tables(board_grid)
+            for index in range(positions):
+                pawn_grid = random_pawns(rng) if index else initialize_pawns_for_game_mode(game_mode)
+                pawns = pawn_occupancy(pawn_grid)
+                for row in range(10):
+                    for col in range(10):
+                        player = pawn_grid[row][col]
+                        if player:
+                            calls.append((row, col, board_grid, pawn_grid, tables, row * 10 + col, player,
+                                          pawns[player], pawns[3 - player]))
+
+        def legacy():
+            for row, col, board_grid, pawn_grid, _, _, _, _, _ in calls:
+                legacy_get_valid_moves(row, col, board_grid, pawn_grid, game_mode)
+
+        def adapter():
+            for row, col, board_grid, pawn_grid, _, _, _, _, _ in calls:
+                get_valid_moves(row, col, board_grid, pawn_grid, game_mode)
+
+        def move_list():
+            for _, _, _, _, tables, sq, player, own, enemy in calls:
+                tables.move_list(sq, player, own, enemy, game_mode)
+
+        def move_mask():
+            for _, _, _, _, tables, sq, player, own, enemy in calls:
+                tables.move_mask(sq, player, own, enemy, game_mode)
+
+        timings = {run.__name__: _best_time(run, repeat) / len(calls)
+                   for run in (legacy, adapter, move_list, move_mask)}
+        results[game_mode] = (timings, len(calls))
+    return results
+
+
+if __name__ == "__main__":
+    for game_mode, (timings, calls) in benchmark().items():
+        name = "Katarenga" if game_mode == 0 else "Congress"
+        legacy = timings["legacy"]
+        print(f"{name:10} {calls} pions, listes {1e6 * legacy:5.2f} us/pion")
+        for label, seconds in timings.items():
+            if label != "legacy":
+                print(f"{'':10} {label:10} {1e6 * seconds:5.2f} us/pion ({legacy / seconds:.2f}x)")
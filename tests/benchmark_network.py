@@ -0,0 +1,18 @@
+from tests.test_network_manager import stress_test
+
+# Mesure (pas un test) : débit de NetworkManager sur socket.socketpair,
+# ordre et contenu des messages vérifiés (pygame requis).
+#   python -m tests.benchmark_network --messages 20000
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Test de charge du découpage en trames sur socket.socketpair")
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    for slow_reader in (False, True):
+        received, sent_bytes, seconds = stress_test(args.messages, args.seed, slow_reader)
+        print(f"{'lecture lente' if slow_reader else 'lecture rapide':15} {received} messages, "
+              f"{sent_bytes / 1e6:.1f} Mo en {seconds:.2f} s ({received / seconds:.0f} messages/s, "
+              f"{sent_bytes / 1e6 / seconds:.1f} Mo/s) : ordre et contenu vérifiés")
@@ -0,0 +1,252 @@
+import random
+import pytest
+from jeux import katarenga
+from plateau.bitboard import pawn_occupancy
+from plateau.game_logic import create_game_board
+from plateau.layout_tables import get_layout_tables
+
+# Parité de la génération de coups (LayoutTables) avec l'ancienne
+# implémentation par parcours de listes, gardée ci-dessous telle qu'elle
+# était avant le passage aux bitboards :
+# - grid_move_list, appelé par plateau.pawn.get_valid_moves sur les grilles
+# - move_list sur les bitboards des pions (GameState, IA)
+# Sans pygame : plateau.pawn (affichage) n'est pas importé.
+#   python -m pytest tests
+
+SEEDS = range(40)
+POSITIONS_PER_BOARD = 25
+
+
+def legacy_get_valid_moves(row, col, board_grid, pawn_grid, game_mode):
+    """get_valid_moves d'origine (parcours des listes case par case)"""
+    # Isolation: aucun déplacement de pions, seulement placement
+    if game_mode == 2:
+        return []
+
+    # Vérifier s'il y a un pion à cette position
+    if pawn_grid[row][col] == 0:
+        return []
+
+    # Couleur du pion
+    pawn_color = pawn_grid[row][col]
+
+    # Obtenir la couleur de la case où se trouve le pion
+    cell_color = board_grid[row][col]
+
+    # Liste des mouvements possibles
+    possible_moves = []
+
+    # Déterminer les limites du plateau selon le mode
+    if game_mode == 0:  # Katarenga - grille complète 10x10
+        min_coord = 0
+        max_coord = 10
+        playable_min = 1
+        playable_max = 8
+    else:  # Congress - zone 8x8 dans grille 10x10
+        min_coord = 1
+        max_coord = 9
+        playable_min = 1
+        playable_max = 8
+
+    # Pour Katarenga, vérifier si on peut aller aux camps
+    camp_moves = []
+    if game_mode == 0:
+        from jeux.katarenga import is_on_enemy_baseline, get_camp_positions, is_camp_occupied
+        if is_on_enemy_baseline(row, pawn_color):
+            camp_positions = get_camp_positions(pawn_color)
+            for camp_row, camp_col in camp_positions:
+                # Vérifier que le camp n'est pas déjà occupé (limite 1 pion par camp)
+                if not is_camp_occupied(camp_row, camp_col, pawn_color):
+                    camp_moves.append((camp_row, camp_col))
+
+    # Déplacement selon la couleur de la case
+    if cell_color == 3:  # Bleu: déplacement en roi
+        directions = [
+            (-1, -1), (-1, 0), (-1, 1),
+            (0, -1),           (0, 1),
+            (1, -1),  (1, 0),  (1, 1)
+        ]
+
+        for move_row, move_column in directions:
+            r, c = row + move_row, col + move_column
+            if min_coord <= r < max_coord and min_coord <= c < max_coord:
+                # Zone de jeu normale
+                if playable_min <= r <= playable_max and playable_min <= c <= playable_max:
+                    # Si la case est vide, toujours autorisé
+                    if pawn_grid[r][c] == 0:
+                        possible_moves.append((r, c))
+                    # Si la case contient un pion ennemi et que le mode est Katarenga
+                    elif pawn_grid[r][c] != pawn_color and game_mode == 0:
+                        possible_moves.append((r, c))
+                    # Congress: pas de capture
+                    elif game_mode == 1 and pawn_grid[r][c] == 0:
+                        possible_moves.append((r, c))
+
+    elif cell_color == 4:  # Rouge: déplacement en tour
+        directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+
+        for move_row, move_column in directions:
+            r, c = row + move_row, col + move_column
+            # Continuer dans cette direction jusqu'à rencontrer un obstacle
+            while min_coord <= r < max_coord and min_coord <= c < max_coord:
+                # Zone de jeu normale
+                if playable_min <= r <= playable_max and playable_min <= c <= playable_max:
+                    # Si la case est vide
+                    if pawn_grid[r][c] == 0:
+                        possible_moves.append((r, c))
+                    else:
+                        # Si la case contient un pion ennemi et que le mode autorise la capture (Katarenga)
+                        if pawn_grid[r][c] != pawn_color and game_mode == 0:
+                            possible_moves.append((r, c))
+                        break  # On ne peut pas aller plus loin
+
+                    # Si c'est aussi une case rouge, c'est la dernière case accessible
+                    if board_grid[r][c] == 4:
+                        break
+                else:
+                    break
+
+                # Avancer d'une case dans la même direction
+                r += move_row
+                c += move_column
+
+    elif cell_color == 1:  # Jaune: déplacement en fou
+        directions = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+
+        for move_row, move_column in directions:
+            r, c = row + move_row, col + move_column
+            # Continuer dans cette direction jusqu'à rencontrer un obstacle
+            while min_coord <= r < max_coord and min_coord <= c < max_coord:
+                # Zone de jeu normale
+                if playable_min <= r <= playable_max and playable_min <= c <= playable_max:
+                    # Si la case est vide
+                    if pawn_grid[r][c] == 0:
+                        possible_moves.append((r, c))
+                    else:
+                        # Si la case contient un pion ennemi et que le mode est Katarenga
+                        if pawn_grid[r][c] != pawn_color and game_mode == 0:
+                            possible_moves.append((r, c))
+                        break # On ne peut pas aller plus loin
+
+                    # Si c'est aussi une case jaune, c'est la dernière case accessible
+                    if board_grid[r][c] == 1:  # Jaune
+                        break
+                else:
+                    break
+
+                # Avancer d'une case dans la même direction
+                r += move_row
+                c += move_column
+
+    elif cell_color == 2:  # Vert: déplacement en cavalier
+        knight_moves = [
+            (-2, -1), (-2, 1),
+            (-1, -2), (-1, 2),
+            (1, -2),  (1, 2),
+            (2, -1),  (2, 1)
+        ]
+
+        for move_row, move_column in knight_moves:
+            r, c = row + move_row, col + move_column
+            if min_coord <= r < max_coord and min_coord <= c < max_coord:
+                # Zone de jeu normale
+                if playable_min <= r <= playable_max and playable_min <= c <= playable_max:
+                    # Si la case est vide
+                    if pawn_grid[r][c] == 0:
+                        possible_moves.append((r, c))
+                    # Si la case contient un pion ennemi et que le mode est Katarenga
+                    elif pawn_grid[r][c] != pawn_color and game_mode == 0:
+                        possible_moves.append((r, c))
+                    # Congress: pas de capture
+                    elif game_mode == 1 and pawn_grid[r][c] == 0:
+                        possible_moves.append((r, c))
+
+    # Ajouter les mouvements vers les camps pour Katarenga
+    if game_mode == 0:
+        possible_moves.extend(camp_moves)
+
+    return possible_moves
+
+
+def grid_moves(row, col, board_grid, pawn_grid, game_mode):
+    """Coups comme plateau.pawn.get_valid_moves : camps occupés lus dans jeux.katarenga, puis grid_move_list"""
+    player = pawn_grid[row][col]
+    camps = katarenga.occupied_camps_mask(player) if game_mode == 0 else 0
+    return get_layout_tables(board_grid).grid_move_list(row, col, pawn_grid, game_mode, camps)
+
+
+def random_board(rng):
+    """Plateau 10x10 assemblé à partir de quatre quadrants aux couleurs aléatoires (1 à 4)"""
+    quadrants = [[[rng.randint(1, 4) for _ in range(4)] for _ in range(4)] for _ in range(4)]
+    return create_game_board(quadrants)
+
+
+def random_pawns(rng):
+    """Pions des deux joueurs placés au hasard dans la zone 8x8, densité variable"""
+    density = rng.uniform(0.05, 0.6)
+    pawn_grid = [[0] * 10 for _ in range(10)]
+    for row in range(1, 9):
+        for col in range(1, 9):
+            if rng.random() < density:
+                pawn_grid[row][col] = rng.choice((1, 2))
+    return pawn_grid
+
+
+def random_camps(rng):
+    """Occupation aléatoire des camps Katarenga (variables globales lues par les deux versions)"""
+    katarenga.reset_camps()
+    for camps in (katarenga.camps_player1, katarenga.camps_player2):
+        for name in ("camp1", "camp2"):
+            if rng.random() < 0.5:
+                camps[name].append(1)
+
+
+@pytest.fixture(autouse=True)
+def clean_camps():
+    katarenga.reset_camps()
+    yield
+    katarenga.reset_camps()
+
+
+@pytest.mark.parametrize("game_mode", [0, 1, 2])
+def test_same_moves_as_list_implementation(game_mode):
+    mismatches = []
+    checked = 0
+    for seed in SEEDS:
+        rng = random.Random(seed * 3 + game_mode)
+        board_grid = random_board(rng)
+        tables = get_layout_tables(board_grid)
+        for _ in range(POSITIONS_PER_BOARD):
+            pawn_grid = random_pawns(rng)
+            if game_mode == 0:
+                random_camps(rng)
+            pawns = pawn_occupancy(pawn_grid)
+            for row in range(10):
+                for col in range(10):
+                    player = pawn_grid[row][col]
+                    if player == 0:
+                        continue
+                    expected = legacy_get_valid_moves(row, col, board_grid, pawn_grid, game_mode)
+                    camps = katarenga.occupied_camps_mask(player) if game_mode == 0 else 0
+                    bitboard = tables.move_list(row * 10 + col, player, pawns[player], pawns[3 - player],
+                                                game_mode, camps)
+                    for actual in (grid_moves(row, col, board_grid, pawn_grid, game_mode), bitboard):
+                        checked += 1
+                        if actual != expected:
+                            mismatches.append((seed, row, col, expected, actual))
+    assert checked > 0
+    assert not mismatches, f"{len(mismatches)} positions différentes, première : {mismatches[0]}"
+
+
+def test_camp_moves_follow_occupancy():
+    # Pion rouge (joueur 1) sur la ligne de base ennemie : camps (9, 0) et (9, 9)
+    rng = random.Random(7)
+    board_grid = random_board(rng)
+    pawn_grid = [[0] * 10 for _ in range(10)]
+    pawn_grid[8][4] = 1
+    assert {(9, 0), (9, 9)} <= set(grid_moves(8, 4, board_grid, pawn_grid, 0))
+
+    katarenga.camps_player1["camp1"].append(1)
+    moves = grid_moves(8, 4, board_grid, pawn_grid, 0)
+    assert (9, 0) not in moves and (9, 9) in moves
+    assert moves == legacy_get_valid_moves(8, 4, board_grid, pawn_grid, 0)
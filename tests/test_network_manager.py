@@ -0,0 +1,101 @@
+import json
+import random
+import socket
+import threading
+import time
+import pytest
+
+# Réception de NetworkManager sur socket.socketpair : découpage en trames
+# sous charge et messages invalides. Le thread de réception réveille la
+# boucle d'affichage (assets.event_loop) : pygame requis.
+pytest.importorskip("pygame")
+
+from réseaux.framing import encode_frame
+from réseaux.network_manager import NetworkManager
+
+# Nombre de messages du test de charge (python -m tests.benchmark_network pour la mesure complète)
+STRESS_MESSAGES = 2000
+
+
+def stress_test(count=20000, seed=1, slow_reader=False):
+    """
+    Deux NetworkManager reliés par socket.socketpair : count messages de
+    tailles variées (coups de quelques octets jusqu'à des configurations de
+    200 Ko) envoyés en rafales depuis deux threads. Vérifie que chaque message
+    arrive une seule fois, entier et dans l'ordre de son thread.
+    slow_reader : la boucle de lecture s'arrête régulièrement, la file de
+    réception se remplit et le thread de réception doit attendre.
+    Retourne (messages reçus, octets JSON envoyés, secondes).
+    """
+    rng = random.Random(seed)
+    sizes = [rng.choice((0, 2, 16, 300, 1500, 5000)) if rng.random() < 0.995 else rng.randint(50000, 200000)
+             for _ in range(count)]
+    payloads = {size: "x" * size for size in set(sizes)}
+
+    left_socket, right_socket = socket.socketpair()
+    sender, receiver = NetworkManager(), NetworkManager()
+    sender.attach(left_socket)
+    receiver.attach(right_socket)
+
+    sent_bytes = [0, 0]
+
+    def send_all(thread_id):
+        for index in range(thread_id, count, 2):
+            data = {"thread": thread_id, "index": index, "payload": payloads[sizes[index]]}
+            if not sender.send_message("stress", data):
+                raise RuntimeError("envoi impossible")
+            sent_bytes[thread_id] += len(json.dumps(data))
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=send_all, args=(thread_id,), daemon=True) for thread_id in (0, 1)]
+    for thread in threads:
+        thread.start()
+
+    next_index = [0, 1]
+    received = 0
+    deadline = start + 120
+    while received < count and time.perf_counter() < deadline:
+        messages = receiver.get_messages()
+        for message in messages:
+            data = message["data"]
+            thread_id = data["thread"]
+            if data["index"] != next_index[thread_id]:
+                raise AssertionError(f"ordre: attendu {next_index[thread_id]}, reçu {data['index']}")
+            if data["payload"] != payloads[sizes[data["index"]]]:
+                raise AssertionError(f"contenu altéré pour le message {data['index']}")
+            next_index[thread_id] += 2
+            received += 1
+        if slow_reader and rng.random() < 0.05:
+            time.sleep(0.02)
+        elif not messages:
+            time.sleep(0.002)
+    seconds = time.perf_counter() - start
+    for thread in threads:
+        thread.join()
+    sender.disconnect()
+    receiver.disconnect()
+    if received != count:
+        raise AssertionError(f"{received} messages reçus sur {count}")
+    return received, sum(sent_bytes), seconds
+
+
+@pytest.mark.parametrize("slow_reader", [False, True])
+def test_messages_arrive_whole_and_in_order(slow_reader):
+    received, _, _ = stress_test(STRESS_MESSAGES, slow_reader=slow_reader)
+    assert received == STRESS_MESSAGES
+
+
+@pytest.mark.parametrize("payload", [b"{}", b"[]", b"42", b'{"data": {}}'])
+def test_frame_without_message_closes_connection(payload):
+    # Trame JSON valide mais sans "type" : la connexion est fermée
+    # au lieu de laisser un thread de réception mort et is_connected vrai
+    left_socket, right_socket = socket.socketpair()
+    receiver = NetworkManager()
+    receiver.attach(right_socket)
+    left_socket.sendall(encode_frame(payload))
+    deadline = time.perf_counter() + 5
+    while receiver.is_connected and time.perf_counter() < deadline:
+        time.sleep(0.01)
+    assert not receiver.is_connected
+    receiver.disconnect()
+    left_socket.close()
@@ -0,0 +1,21 @@
+import pytest
+from headless.perft import check_golden
+
+# Comptes perft de référence (tests/perft_golden.json) pour les deux moteurs :
+# GameState et fonctions du jeu sur grilles. Profondeurs limitées à 3, la
+# vérification complète (python -m headless.perft --check) est plus longue.
+CHECK_DEPTH = 3
+
+
+def quiet(line):
+    pass
+
+
+def test_state_engine_matches_golden_counts():
+    assert check_golden("etat", quiet, CHECK_DEPTH) == []
+
+
+def test_grid_engine_matches_golden_counts():
+    # plateau.pawn et jeux.congress dessinent avec pygame
+    pytest.importorskip("pygame")
+    assert check_golden("grille", quiet, CHECK_DEPTH) == []
@@ -0,0 +1,108 @@
+import asyncio
+import random
+from headless.simulator import load_quadrant_grids
+from plateau.game_logic import create_game_board, initialize_pawns_for_game_mode
+from plateau.game_state import GameState
+from réseaux.server import BenchClient, GameServer
+from réseaux.sync import decode_snapshot
+
+# Serveur dédié sur un port libre, deux BenchClient appariés dans une partie.
+# Seuls les messages confirmés par l'état du serveur doivent être relayés.
+
+# Une réponse qui n'arrive pas fait échouer le test au lieu de le bloquer
+TIMEOUT = 5
+
+
+async def open_match(mode, seed=1):
+    """Serveur, partie en cours ({1: client, 2: client}) et GameState de référence"""
+    game_server, server, players = await join_match(mode)
+    rng = random.Random(seed)
+    grids = load_quadrant_grids()
+    quadrants = [rng.choice(grids) for _ in range(4)]
+    for player, indices in ((1, [0, 1]), (2, [2, 3])):
+        players[player].send("quadrant_config", {"quadrants": [quadrants[i] for i in indices], "quadrant_indices": indices})
+    for player in (1, 2):
+        assert (await players[3 - player].receive())["type"] == "quadrant_config"
+    state = GameState.from_grids(create_game_board(quadrants), initialize_pawns_for_game_mode(mode), mode)
+    return game_server, server, players, state
+
+
+async def join_match(mode):
+    """Serveur et deux clients appariés, avant la configuration des quadrants"""
+    game_server = GameServer(verbose=False)
+    server = await asyncio.start_server(game_server.handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    players = {}
+    for player in (1, 2):
+        players[player] = await BenchClient.connect("127.0.0.1", port, mode)
+    for player in (1, 2):
+        assert (await players[player].receive())["type"] == "match_found"
+    return game_server, server, players
+
+
+async def close_match(game_server, server, players):
+    for client in players.values():
+        client.writer.close()
+    server.close()
+    await game_server.close()
+
+
+async def send_first_placement(players, state):
+    """Joue un placement légal du joueur 1 et retourne le message reçu par le joueur 2"""
+    move = state.legal_moves(1)[0]
+    players[1].send("placement", {"position": divmod(move[1], 10), "player": 1})
+    return await players[2].receive()
+
+
+def test_false_victory_is_rejected_and_not_relayed():
+    async def run():
+        game_server, server, players, state = await open_match(2)
+        players[1].send("victory", {"winner": 1})
+        rejected = await players[1].receive()
+        # Le message suivant du joueur 2 est le coup, pas la victoire
+        relayed = await send_first_placement(players, state)
+        await close_match(game_server, server, players)
+        return rejected, relayed
+
+    rejected, relayed = asyncio.run(asyncio.wait_for(run(), TIMEOUT))
+    assert rejected["type"] == "victory_rejected"
+    assert relayed["type"] == "placement"
+
+
+def test_resync_is_answered_from_server_state():
+    async def run():
+        game_server, server, players, state = await open_match(2)
+        # Instantané d'un client : ignoré, le serveur renvoie le sien
+        players[1].send("resync", {"snapshot": "00"})
+        from_resync = await players[1].receive()
+        players[2].send("resync_request", {"hash": 0})
+        from_request = await players[2].receive()
+        relayed = await send_first_placement(players, state)
+        await close_match(game_server, server, players)
+        return state, from_resync, from_request, relayed
+
+    state, from_resync, from_request, relayed = asyncio.run(asyncio.wait_for(run(), TIMEOUT))
+    for message in (from_resync, from_request):
+        assert message["type"] == "resync"
+        _, snapshot_state = decode_snapshot(bytes.fromhex(message["data"]["snapshot"]), 2)
+        assert snapshot_state.key == state.key
+    assert relayed["type"] == "placement"
+
+
+def test_quadrants_of_the_other_player_are_rejected():
+    async def run():
+        game_server, server, players = await join_match(2)
+        grid = load_quadrant_grids()[0]
+        # Le joueur 2 configure les quadrants du bas seulement
+        players[2].send("quadrant_config", {"quadrants": [grid], "quadrant_indices": [0]})
+        rejected = await players[2].receive()
+        players[2].send("quadrant_config", {"quadrants": [grid, grid], "quadrant_indices": [2, 3]})
+        relayed = await players[1].receive()
+        match = next(iter(game_server.matches))
+        await close_match(game_server, server, players)
+        return rejected, relayed, match
+
+    rejected, relayed, match = asyncio.run(asyncio.wait_for(run(), TIMEOUT))
+    assert rejected["type"] == "quadrant_config_rejected"
+    assert relayed["data"]["quadrant_indices"] == [2, 3]
+    assert match.quadrants[:2] == [None, None]